@@ -0,0 +1,74 @@
+"""Import time check of the cold start of a cron job sending one heartbeat event.
+
+Every run starts a fresh interpreter that times `import upassist` and
+`upassist.Heartbeat("slug").event()` against a local fake Upassist server, and lists the
+heavy modules loaded on the way. The check fails when the median of a timing exceeds
+its budget or when pydantic, asyncio or an unused HTTP backend is imported, so it can
+guard cold start in CI.
+
+Usage:
+    python benchmarks/import_time.py --runs 10 --max-import-ms 20 --max-event-ms 300
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from upassist.testing import FakeUpassistServer
+
+FORBIDDEN_MODULES = ("pydantic", "pydantic_extra_types", "asyncio", "aiohttp", "httpx")
+
+CHILD = """
+import sys, time, json
+started = time.perf_counter()
+import upassist
+imported = time.perf_counter()
+upassist.Heartbeat.base_heartbeat_event_api_url = sys.argv[1]
+upassist.Heartbeat("heartbeat-0", api_key="benchmark").event()
+sent = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1e3,
+    "event_ms": (sent - started) * 1e3,
+    "loaded": [name for name in sys.argv[2:] if name in sys.modules],
+}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters started")
+    parser.add_argument("--max-import-ms", type=float, default=20.0, help="Budget of the median `import upassist`")
+    parser.add_argument("--max-event-ms", type=float, default=500.0, help="Budget of the median import and event")
+    args = parser.parse_args()
+
+    with FakeUpassistServer(heartbeats=1) as server:
+        url = f"{server.url}/api"
+        runs = [
+            json.loads(subprocess.check_output([sys.executable, "-c", CHILD, url, *FORBIDDEN_MODULES], text=True))
+            for _ in range(args.runs)
+        ]
+
+    report = {
+        "runs": args.runs,
+        "import_ms_median": statistics.median(run["import_ms"] for run in runs),
+        "event_ms_median": statistics.median(run["event_ms"] for run in runs),
+        "loaded_forbidden_modules": sorted({name for run in runs for name in run["loaded"]}),
+    }
+    print(json.dumps(report, indent=2))
+
+    failures = []
+    if report["import_ms_median"] > args.max_import_ms:
+        failures.append(f"`import upassist` took {report['import_ms_median']:.1f}ms > {args.max_import_ms}ms")
+    if report["event_ms_median"] > args.max_event_ms:
+        failures.append(f"first event took {report['event_ms_median']:.1f}ms > {args.max_event_ms}ms")
+    if report["loaded_forbidden_modules"]:
+        failures.append(f"cold start imported {', '.join(report['loaded_forbidden_modules'])}")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
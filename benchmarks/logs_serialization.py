@@ -0,0 +1,71 @@
+"""Benchmark of log batch serialization used by `Logs.collect`.
+
+Compares the previous per-item `model_dump(mode="json")` + stdlib `json` path with
+`encode_logs` for `LogItemSchema`, `LogEntry` and plain dictionary items.
+
+Usage:
+    python benchmarks/logs_serialization.py --items 100000 --batch-size 500
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from upassist.entities.logs import LogEntry, LogItemSchema
+from upassist.entities.logs.logs import encode_logs
+from upassist.utils.serialization import JSON_BACKEND
+
+
+def legacy_encode(logs: Sequence[LogItemSchema]) -> bytes:
+    return json.dumps([log.model_dump(mode="json") for log in logs]).encode()
+
+
+def make_fields(index: int) -> dict[str, Any]:
+    return {
+        "dt": datetime.now(tz=timezone.utc),
+        "host": "web-1",
+        "message": f"Handled request {index}",
+        "file": "app/views.py:42",
+        "data": {"level": "INFO", "logger": "app.views", "request_id": index, "status": 200},
+    }
+
+
+def measure(encode: Callable[[Any], bytes], batches: list[Any]) -> tuple[float, int]:
+    started = time.perf_counter()
+    size = sum(len(encode(batch)) for batch in batches)
+    return time.perf_counter() - started, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    fields = [make_fields(index) for index in range(args.items)]
+    schemas = [LogItemSchema(**item) for item in fields]
+    entries = [LogEntry(**item) for item in fields]
+
+    def batched(items: list[Any]) -> list[list[Any]]:
+        return [items[start : start + args.batch_size] for start in range(0, len(items), args.batch_size)]
+
+    cases = [
+        ("legacy LogItemSchema", legacy_encode, batched(schemas)),
+        ("encode_logs LogItemSchema", encode_logs, batched(schemas)),
+        ("encode_logs LogEntry", encode_logs, batched(entries)),
+        ("encode_logs dict", encode_logs, batched(fields)),
+    ]
+    print(f"JSON backend: {JSON_BACKEND}, items: {args.items}, batch size: {args.batch_size}")
+    baseline = None
+    for name, encode, batches in cases:
+        elapsed, size = measure(encode, batches)
+        rate = args.items / elapsed
+        baseline = baseline or rate
+        print(f"{name:<28} {rate:>12,.0f} items/s {size / args.items:>8.1f} bytes/item {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
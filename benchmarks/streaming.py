@@ -0,0 +1,94 @@
+"""Benchmark of streamed heartbeat pages against fully read ones.
+
+Fetches pages of several sizes from a fake Upassist server running in a separate process,
+with `Heartbeat.list()` and with `Heartbeat.list_stream()`, and reports the time to the
+first item, the total time and the peak memory traced in the client process.
+
+Usage:
+    python benchmarks/streaming.py --page-sizes 1000 5000 20000 --validation full
+"""
+
+import argparse
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from upassist import Heartbeat, SyncAPIClient
+from upassist.testing import RedirectTransport
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, heartbeats: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "upassist.testing.server", "--port", str(port), "--heartbeats", str(heartbeats)],
+        stdout=subprocess.DEVNULL,
+    )
+    for _ in range(600):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("The fake Upassist server did not start")
+
+
+def measure(fetch: Callable[[], Iterable[Any]]) -> tuple[float, float, int]:
+    """Get the seconds to the first item, the seconds to the last one and the peak traced bytes."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    first = None
+    for _ in fetch():
+        if first is None:
+            first = time.perf_counter() - started
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first or total, total, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--validation", default="full", choices=["full", "raw"])
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_server(port, max(args.page_sizes))
+    try:
+        client = SyncAPIClient(api_key="benchmark", transport=RedirectTransport(f"http://127.0.0.1:{port}"))
+        heartbeat = Heartbeat(api_client=client)
+        heartbeat.list(per_page=1)  # Warm up the connection and the validators
+
+        print(f"{'page size':>10} {'method':<14} {'first item ms':>14} {'total ms':>10} {'peak MiB':>10}")
+        for per_page in args.page_sizes:
+            methods = {
+                "list()": lambda per_page=per_page: heartbeat.list(per_page=per_page, validation=args.validation).data,
+                "list_stream()": lambda per_page=per_page: heartbeat.list_stream(
+                    per_page=per_page, validation=args.validation
+                ),
+            }
+            if args.validation == "raw":
+                methods["list()"] = lambda per_page=per_page: heartbeat.list(per_page=per_page, validation="raw")[
+                    "data"
+                ]
+            for name, fetch in methods.items():
+                first, total, peak = measure(fetch)
+                print(f"{per_page:>10} {name:<14} {first * 1e3:>14.1f} {total * 1e3:>10.1f} {peak / 2**20:>10.1f}")
+        client.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""Benchmark suite of the client, schema validation and log shipping hot paths.
+
+Every case runs against the local fake Upassist server of `upassist.testing`, or its
+in-process transport, so results do not depend on the network. Results are written as
+JSON to compare releases:
+
+    python benchmarks/suite.py --output before.json
+    git checkout new-release
+    python benchmarks/suite.py --output after.json --compare before.json
+
+Cases:
+    client.*    per-request wall time of `SyncAPIClient` and `AsyncAPIClient`, sequential,
+                over HTTP and in process (client overhead without sockets)
+    schema.*    `HeartbeatPaginatedSchema` and `HeartbeatDetailSchema` validation of decoded
+                responses at several page sizes
+    logs.*      `Logs.collect` items per second and request bytes per item
+    memory.*    peak traced memory of building and shipping 100k log items, and retained
+                memory per heartbeat of a fleet fetched with `list_all()` or `list_table()`
+    import.*    wall time of `import upassist` in a fresh interpreter
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from upassist import AsyncAPIClient, Heartbeat, Logs, SyncAPIClient
+from upassist.entities.heartbeat import HeartbeatDetailSchema, HeartbeatPaginatedSchema
+from upassist.entities.logs import LogEntry
+from upassist.testing import AsyncMockTransport, FakeUpassist, FakeUpassistServer, MockTransport
+from upassist.utils.serialization import JSON_BACKEND
+from upassist.version import __version__
+
+EVENT_URL = "https://heartbeats.upassist.cloud/api/event/heartbeat-0"
+PAGE_SIZES = (10, 50, 100, 500)
+
+
+def timed(run: Callable[[], Any], repeat: int) -> float:
+    """Get the best wall time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_sync_client(client: SyncAPIClient, requests: int) -> dict[str, float]:
+    client.get(EVENT_URL)  # Warm up the connection pool
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(EVENT_URL)
+    elapsed = time.perf_counter() - started
+    client.close()
+    return {"requests": requests, "us_per_request": elapsed / requests * 1e6, "requests_per_sec": requests / elapsed}
+
+
+def bench_async_client(make_client: Callable[[], AsyncAPIClient], requests: int) -> dict[str, float]:
+    async def main() -> float:
+        async with make_client() as client:
+            await client.get(EVENT_URL)
+            started = time.perf_counter()
+            for _ in range(requests):
+                await client.get(EVENT_URL)
+            return time.perf_counter() - started
+
+    elapsed = asyncio.run(main())
+    return {"requests": requests, "us_per_request": elapsed / requests * 1e6, "requests_per_sec": requests / elapsed}
+
+
+def bench_schemas(backend: FakeUpassist, repeat: int) -> dict[str, dict[str, float]]:
+    results = {}
+    for per_page in PAGE_SIZES:
+        page = json.loads(
+            backend.handle("GET", "https://api.upassist.cloud/v1/heartbeats", params={"per_page": per_page}).body
+        )
+        rounds = max(2000 // per_page, 1)
+        elapsed = timed(
+            lambda page=page, rounds=rounds: [HeartbeatPaginatedSchema.model_validate(page) for _ in range(rounds)],
+            repeat,
+        )
+        results[f"schema.paginated.per_page_{per_page}"] = {
+            "items_per_sec": per_page * rounds / elapsed,
+            "pages_per_sec": rounds / elapsed,
+            "us_per_item": elapsed / (per_page * rounds) * 1e6,
+        }
+
+    detail = json.loads(backend.handle("GET", "https://api.upassist.cloud/v1/heartbeats/heartbeat-0").body)
+    rounds = 2000
+    elapsed = timed(lambda: [HeartbeatDetailSchema.model_validate(detail) for _ in range(rounds)], repeat)
+    results["schema.detail"] = {"items_per_sec": rounds / elapsed, "us_per_item": elapsed / rounds * 1e6}
+    return results
+
+
+def make_logs(count: int) -> list[LogEntry]:
+    now = datetime.now(tz=timezone.utc)
+    return [
+        LogEntry(
+            dt=now,
+            host="web-1",
+            message=f"Handled request {index}",
+            file="app/views.py:42",
+            data={"level": "INFO", "logger": "app.views", "request_id": index, "status": 200},
+        )
+        for index in range(count)
+    ]
+
+
+def bench_logs(client: SyncAPIClient, backend: FakeUpassist, items: int, batch_size: int) -> dict[str, float]:
+    logs = Logs(api_client=client)
+    entries = make_logs(items)
+    batches = [entries[start : start + batch_size] for start in range(0, items, batch_size)]
+    collected_bytes = backend.collected_bytes
+    started = time.perf_counter()
+    for batch in batches:
+        logs.collect(batch)
+    elapsed = time.perf_counter() - started
+    client.close()
+    return {
+        "items": items,
+        "batch_size": batch_size,
+        "items_per_sec": items / elapsed,
+        "bytes_per_item": (backend.collected_bytes - collected_bytes) / items,
+    }
+
+
+def bench_memory(items: int, batch_size: int) -> dict[str, float]:
+    backend = FakeUpassist()
+    logs = Logs(api_client=SyncAPIClient(api_key="benchmark", transport=MockTransport(backend)))
+    tracemalloc.start()
+    entries = make_logs(items)
+    for start in range(0, items, batch_size):
+        logs.collect(entries[start : start + batch_size])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"items": items, "peak_bytes_per_100k_items": peak / items * 100_000}
+
+
+def bench_fleet_memory(heartbeats: int) -> dict[str, dict[str, float]]:
+    backend = FakeUpassist(heartbeats=heartbeats)
+    heartbeat = Heartbeat(api_client=SyncAPIClient(api_key="benchmark", transport=MockTransport(backend)))
+    results = {}
+    for name, fetch in (("list_all", heartbeat.list_all), ("table", heartbeat.list_table)):
+        tracemalloc.start()
+        fleet = fetch(per_page=500)
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"memory.heartbeats.{name}"] = {"items": len(fleet), "bytes_per_item": retained / len(fleet)}
+        del fleet
+    return results
+
+
+def bench_import(runs: int) -> dict[str, float]:
+    code = "import time; started = time.perf_counter(); import upassist; print(time.perf_counter() - started)"
+    durations = [float(subprocess.check_output([sys.executable, "-c", code], text=True)) for _ in range(runs)]
+    return {"runs": runs, "ms_min": min(durations) * 1e3, "ms_median": statistics.median(durations) * 1e3}
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, dict[str, float]] = {}
+
+    def record(name: str, result: dict[str, float]) -> None:
+        results[name] = result
+        print(f"{name:<40} {json.dumps({key: round(value, 2) for key, value in result.items()})}", file=sys.stderr)
+
+    with FakeUpassistServer(heartbeats=max(PAGE_SIZES)) as server:
+        backend = server.backend
+        record(
+            "client.sync.http",
+            bench_sync_client(SyncAPIClient(api_key="benchmark", transport=server.transport()), args.requests),
+        )
+        record(
+            "client.async.http",
+            bench_async_client(
+                lambda: AsyncAPIClient(api_key="benchmark", transport=server.async_transport()), args.requests
+            ),
+        )
+        record(
+            "client.sync.in_process",
+            bench_sync_client(SyncAPIClient(api_key="benchmark", transport=MockTransport(backend)), args.requests),
+        )
+        record(
+            "client.async.in_process",
+            bench_async_client(
+                lambda: AsyncAPIClient(api_key="benchmark", transport=AsyncMockTransport(backend)), args.requests
+            ),
+        )
+        for name, result in bench_schemas(backend, args.repeat).items():
+            record(name, result)
+        record(
+            "logs.collect.http",
+            bench_logs(
+                SyncAPIClient(api_key="benchmark", transport=server.transport()),
+                backend,
+                args.log_items,
+                args.batch_size,
+            ),
+        )
+        record(
+            "logs.collect.http.gzip",
+            bench_logs(
+                SyncAPIClient(api_key="benchmark", transport=server.transport(), compression="gzip"),
+                backend,
+                args.log_items,
+                args.batch_size,
+            ),
+        )
+    record("memory.logs", bench_memory(args.memory_items, args.batch_size))
+    for name, result in bench_fleet_memory(args.fleet_items).items():
+        record(name, result)
+    record("import.upassist", bench_import(args.import_runs))
+
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "json_backend": JSON_BACKEND,
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "args": vars(args) | {"output": None, "compare": None},
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    print(f"Compared with {baseline['meta']['version']} ({baseline['meta']['timestamp']}):", file=sys.stderr)
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric, value in result.items():
+            if previous.get(metric) and metric not in {"requests", "items", "runs", "batch_size"}:
+                print(f"  {name:<40} {metric:<28} {value / previous[metric]:>6.2f}x", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per client case")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs of a schema case, the best one is reported")
+    parser.add_argument("--log-items", type=int, default=50_000, help="Log items shipped per logs case")
+    parser.add_argument("--batch-size", type=int, default=500, help="Log items per collect request")
+    parser.add_argument("--memory-items", type=int, default=100_000, help="Log items of the memory case")
+    parser.add_argument("--fleet-items", type=int, default=20_000, help="Heartbeats of the fleet memory cases")
+    parser.add_argument("--import-runs", type=int, default=5, help="Fresh interpreters timing the import")
+    parser.add_argument("--output", help="File the JSON results are written to, stdout if not provided")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.compare:
+        with open(args.compare) as fd:
+            compare(report, json.load(fd))
+    if args.output:
+        with open(args.output, "w") as fd:
+            json.dump(report, fd, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark of the client transports sending concurrent heartbeat events.
+
+Compares `SyncAPIClient` with the `requests` and HTTP/2 `httpx` transports driven by a
+thread pool, and `AsyncAPIClient` with the `aiohttp` and HTTP/2 `httpx` transports
+driven by `asyncio.gather`.
+
+By default requests go to a local stub server speaking HTTP/1.1, which measures the
+per-request overhead of every backend. Pass `--url` of an HTTPS endpoint to let the
+`httpx` transports negotiate HTTP/2 and compare multiplexing with connection pooling.
+
+Usage:
+    python benchmarks/transports.py --requests 2000 --concurrency 100
+    python benchmarks/transports.py --url https://heartbeats.upassist.cloud/api/event/your-slug
+"""
+
+import argparse
+import asyncio
+import http.server
+import importlib.util
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from upassist.client import AsyncAPIClient, SyncAPIClient
+from upassist.client.transports import AsyncHttpxTransport, HttpxTransport
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b'{"detail": "ok"}'
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args: object) -> None:
+        return
+
+
+def start_stub_server() -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_sync(make_client: Callable[[], SyncAPIClient], url: str, requests: int, concurrency: int) -> float:
+    with make_client() as client:
+        client.get(url)  # Warm up the connection pool
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda _: client.get(url), range(requests)))
+        return time.perf_counter() - started
+
+
+def run_async(make_client: Callable[[], AsyncAPIClient], url: str, requests: int, concurrency: int) -> float:
+    async def main() -> float:
+        async with make_client() as client:
+            await client.get(url)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def send() -> None:
+                async with semaphore:
+                    await client.get(url)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(send() for _ in range(requests)))
+            return time.perf_counter() - started
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--url", help="Endpoint to call, a local stub server is started if not provided")
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        server = start_stub_server()
+        url = f"http://127.0.0.1:{server.server_port}/event/benchmark"
+
+    http2 = url.startswith("https://")
+    cases: list[tuple[str, Callable[[], float]]] = [
+        (
+            "sync requests",
+            lambda: run_sync(
+                lambda: SyncAPIClient(api_key="benchmark", pool_size=args.concurrency),
+                url,
+                args.requests,
+                args.concurrency,
+            ),
+        ),
+        (
+            "async aiohttp",
+            lambda: run_async(lambda: AsyncAPIClient(api_key="benchmark"), url, args.requests, args.concurrency),
+        ),
+    ]
+    if importlib.util.find_spec("httpx") and (not http2 or importlib.util.find_spec("h2")):
+        cases += [
+            (
+                f"sync httpx{' http2' if http2 else ''}",
+                lambda: run_sync(
+                    lambda: SyncAPIClient(
+                        api_key="benchmark", transport=HttpxTransport(http2=http2, max_connections=args.concurrency)
+                    ),
+                    url,
+                    args.requests,
+                    args.concurrency,
+                ),
+            ),
+            (
+                f"async httpx{' http2' if http2 else ''}",
+                lambda: run_async(
+                    lambda: AsyncAPIClient(
+                        api_key="benchmark",
+                        transport=AsyncHttpxTransport(http2=http2, max_connections=args.concurrency),
+                    ),
+                    url,
+                    args.requests,
+                    args.concurrency,
+                ),
+            ),
+        ]
+    else:
+        print("httpx is not installed, install `upassist[http2]` to compare the httpx transports")
+
+    print(f"URL: {url}, requests: {args.requests}, concurrency: {args.concurrency}")
+    for name, run in cases:
+        elapsed = run()
+        print(
+            f"{name:<20} {args.requests / elapsed:>10,.0f} req/s "
+            f"{elapsed / args.requests * 1e6:>10,.0f} us/req (wall clock)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark of the response validation modes on large heartbeat pages.
+
+Compares `full` and `raw` validation of `HeartbeatPaginatedSchema` pages of
+several sizes, on decoded pages alone and through `Heartbeat.list()` with the in-process
+transport of `upassist.testing`, which adds JSON decoding and the client overhead. The
+speedup is the one of `Heartbeat.list()` over full validation.
+
+Usage:
+    python benchmarks/validation_modes.py --page-sizes 100 1000 5000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from upassist import Heartbeat, SyncAPIClient
+from upassist.entities.heartbeat import HeartbeatPaginatedSchema
+from upassist.schemas.validation import ValidationMode, validate
+from upassist.testing import FakeUpassist, MockTransport
+
+
+def best_of(run: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    backend = FakeUpassist(heartbeats=max(args.page_sizes))
+    client = SyncAPIClient(api_key="benchmark", transport=MockTransport(backend))
+    heartbeat = Heartbeat(api_client=client)
+
+    print(f"{'page size':>10} {'mode':<8} {'validate items/s':>18} {'list() items/s':>16} {'list() speedup':>8}")
+    for per_page in args.page_sizes:
+        page = json.loads(
+            backend.handle("GET", "https://api.upassist.cloud/v1/heartbeats", params={"per_page": per_page}).body
+        )
+        full_listed = None
+        for mode in ValidationMode:
+            validate(HeartbeatPaginatedSchema, page, mode)  # Build the validator outside of the timing
+            validated = best_of(
+                lambda mode=mode, page=page: validate(HeartbeatPaginatedSchema, page, mode), args.repeat
+            )
+            listed = best_of(
+                lambda mode=mode, per_page=per_page: heartbeat.list(per_page=per_page, validation=mode), args.repeat
+            )
+            full_listed = full_listed or listed
+            print(
+                f"{per_page:>10} {mode.value:<8} {per_page / validated:>18,.0f} "
+                f"{per_page / listed:>16,.0f} {full_listed / listed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,8 @@ with open(index_path, "w") as fd:
         "- [Heartbeat](entities/heartbeat/index.md): Heartbeat monitoring functionality\n"
     )
     fd.write("- [Logs](entities/logs/index.md): Log management functionality\n")
-    fd.write("- [API Clients](client/index.md): API client documentation\n\n")
+    fd.write("- [API Clients](client/index.md): API client documentation\n")
+    fd.write("- [Testing](testing/index.md): Fake backend for offline tests and load tests\n\n")
     fd.write("## Overview\n\n")
     fd.write(
         "The Upassist Python SDK provides a comprehensive set of tools for interacting "
@@ -1,10 +1,30 @@
+from typing import TYPE_CHECKING
+
 from upassist import config
-from upassist.client import AbstractAPIClient, AsyncAPIClient, SyncAPIClient
-from upassist.entities import Heartbeat, Logs
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from upassist.client import AbstractAPIClient, AsyncAPIClient, SyncAPIClient
+    from upassist.entities import AsyncHeartbeat, AsyncLogs, Heartbeat, Logs
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AbstractAPIClient": "upassist.client",
+        "AsyncAPIClient": "upassist.client",
+        "AsyncHeartbeat": "upassist.entities",
+        "AsyncLogs": "upassist.entities",
+        "Heartbeat": "upassist.entities",
+        "Logs": "upassist.entities",
+        "SyncAPIClient": "upassist.client",
+    },
+)
 
 __all__ = (
     "AbstractAPIClient",
     "AsyncAPIClient",
+    "AsyncHeartbeat",
+    "AsyncLogs",
     "Heartbeat",
     "Logs",
     "SyncAPIClient",
@@ -1,9 +1,44 @@
-from ._async import AsyncAPIClient
-from ._sync import SyncAPIClient
-from .abstract import AbstractAPIClient
+from typing import TYPE_CHECKING
+
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from ._async import AsyncAPIClient
+    from ._http2 import AsyncHTTP2APIClient, HTTP2APIClient
+    from ._sync import SyncAPIClient
+    from .abstract import AbstractAPIClient
+    from .cache import ResponseCache
+    from .circuit import CircuitBreaker, CircuitState
+    from .retry import RetryPolicy
+    from .timeout import Deadline, Timeout
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AbstractAPIClient": ".abstract",
+        "AsyncAPIClient": "._async",
+        "AsyncHTTP2APIClient": "._http2",
+        "CircuitBreaker": ".circuit",
+        "CircuitState": ".circuit",
+        "Deadline": ".timeout",
+        "HTTP2APIClient": "._http2",
+        "ResponseCache": ".cache",
+        "RetryPolicy": ".retry",
+        "SyncAPIClient": "._sync",
+        "Timeout": ".timeout",
+    },
+)
 
 __all__ = (
     "AbstractAPIClient",
     "AsyncAPIClient",
+    "AsyncHTTP2APIClient",
+    "CircuitBreaker",
+    "CircuitState",
+    "Deadline",
+    "HTTP2APIClient",
+    "ResponseCache",
+    "RetryPolicy",
     "SyncAPIClient",
+    "Timeout",
 )
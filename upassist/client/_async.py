@@ -1,16 +1,95 @@
+import asyncio
+import functools
 import importlib.util
+import time
 from typing import Any
 
-from ..errors import APIError
+from ..errors import CircuitOpenError, DeadlineExceededError
 from .abstract import AbstractAPIClient
+from .timeout import Deadline, Timeout
+from .transports import AiohttpTransport, AsyncTransport, AsyncTransportStream
 
 
 class AsyncAPIClient(AbstractAPIClient):
+    """Asynchronous API client backed by a shared `aiohttp` session.
+
+    The session and its TCP connector are created lazily on the first request and
+    reused afterwards, so concurrent calls share keep-alive connections and the DNS
+    cache. The number of simultaneously open sockets is bounded by the connector limits.
+
+    Another HTTP backend can be plugged in with `transport`, e.g. `AsyncHttpxTransport`
+    to multiplex requests over HTTP/2.
+
+    Example:
+        ```python
+        import asyncio
+
+        from upassist import AsyncAPIClient
+
+        async def main():
+            async with AsyncAPIClient(limit=100, limit_per_host=50) as client:
+                await asyncio.gather(*(client.get("heartbeats") for _ in range(500)))
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int | None = 10,
+        keepalive_timeout: float = 15,
+        compression_offload_threshold: int = 64 * 1024,
+        transport: AsyncTransport | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the asynchronous API client.
+
+        Args:
+            api_key: Optional API key. If not provided, uses config.API_KEY
+            api_version: Optional API version. If not provided, uses config.API_VERSION
+            limit: Total number of simultaneous connections, 0 for no limit
+            limit_per_host: Number of simultaneous connections to a single host, 0 for no limit
+            ttl_dns_cache: Seconds to cache resolved DNS records, None to cache forever
+            keepalive_timeout: Seconds to keep idle connections open for reuse
+            compression_offload_threshold: Raw bodies of at least this number of bytes, and all
+                JSON bodies, are compressed in the default executor instead of on the event loop
+            transport: Optional HTTP backend. An `AiohttpTransport` configured with the
+                connector options is used if not provided
+            **kwargs: Options of `AbstractAPIClient`, such as request compression
+        """
+        self.transport = transport
+        super().__init__(api_key=api_key, api_version=api_version, **kwargs)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.compression_offload_threshold = compression_offload_threshold
+        if self.transport is None:
+            self.transport = AiohttpTransport(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=ttl_dns_cache,
+                keepalive_timeout=keepalive_timeout,
+            )
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     def _check_required_packages(self):
-        if not importlib.util.find_spec("aiohttp"):
+        if self.transport is None and not importlib.util.find_spec("aiohttp"):
             raise ImportError("You need to install the `aiohttp` package to use async client")
 
+    async def aclose(self) -> None:
+        """Close the transport and release its connections."""
+        await self.transport.aclose()
+
     async def _request(
         self,
         method: str,
@@ -18,11 +97,126 @@ class AsyncAPIClient(AbstractAPIClient):
         params: dict | None = None,
         headers: dict | None = None,
         json: dict[Any, Any] | list[Any] | None = None,
+        data: bytes | None = None,
+        cacheable: bool = False,
+        retry: bool | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
-        import aiohttp
+        headers = dict(headers or {})
+        cache_key, cache_entry = self._cache_lookup(method, url, params, headers, cacheable)
+        if cache_entry is not None and cache_entry.fresh:
+            return cache_entry.value
+
+        if self.compression is not None and (json is not None or data is not None):
+            if data is not None and len(data) < self.compression_offload_threshold:
+                json, data = self._compress_body(headers, json=json, data=data)
+            else:
+                loop = asyncio.get_running_loop()
+                json, data = await loop.run_in_executor(
+                    None, functools.partial(self._compress_body, headers, json=json, data=data)
+                )
+
+        response = await self._send(method, url, params, headers, json, data, retry, timeout, deadline)
+        return self._handle_response(method, url, response, cache_key, cache_entry)
+
+    async def _stream(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncTransportStream:
+        response = await self._send(
+            method, url, params, dict(headers or {}), None, None, retry, timeout, deadline, stream=True
+        )
+        if not response.ok:
+            self._handle_response(method, url, await response.read(), None, None)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: dict[Any, Any] | list[Any] | None,
+        data: bytes | None,
+        retry: bool | None,
+        timeout: Timeout | None,
+        deadline: Deadline | None,
+        stream: bool = False,
+    ) -> Any:
+        """Send a request, retrying transient failures according to the retry policy.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers
+            json: JSON body of the request
+            data: Raw body of the request
+            retry: Per-request override of the retried methods
+            timeout: Timeout of every attempt
+            deadline: Optional deadline bounding all attempts
+            stream: Whether to return as soon as the response headers of the last attempt
+                are received, with an unread body
+
+        Returns:
+            `TransportResponse` of the last attempt, or its `AsyncTransportStream` when streaming
+        """
+        attempt, retry_started = 1, None
+        while True:
+            try:
+                attempt_timeout = self._attempt_timeout(timeout, deadline)
+                self._circuit_before(url)
+            except (CircuitOpenError, DeadlineExceededError):
+                self._retry_finished(attempt - 1, retry_started, succeeded=False)
+                raise
+            try:
+                if stream:
+                    response = await self.transport.stream(
+                        method, url, params=params, headers=headers, timeout=attempt_timeout
+                    )
+                else:
+                    response = await self.transport.request(
+                        method, url, params=params, headers=headers, json=json, data=data, timeout=attempt_timeout
+                    )
+            except self.transport.transient_errors:
+                self._circuit_record(url, None)
+                retry_started = retry_started or time.monotonic()
+                delay = self._retry_delay(method, attempt, retry_started, retry, deadline=deadline)
+                if delay is None:
+                    self._retry_finished(attempt, retry_started, succeeded=False)
+                    raise
+            except BaseException:
+                # Cancellations and non-transient errors say nothing about the host, the
+                # trial slot of a half-open circuit is given back for the next request.
+                self._circuit_release(url)
+                raise
+            else:
+                self._circuit_record(url, response.status)
+                if response.ok:
+                    break
+                retry_started = retry_started or time.monotonic()
+                delay = self._retry_delay(
+                    method,
+                    attempt,
+                    retry_started,
+                    retry,
+                    response.status,
+                    response.headers.get("Retry-After"),
+                    deadline,
+                )
+                if delay is None:
+                    break
+                if stream:
+                    await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, headers=headers, json=json, params=params) as response:
-                if not response.ok:
-                    raise APIError(await response.json(), response.url)
-                return await response.json()
+        self._retry_finished(attempt, retry_started, succeeded=response.ok)
+        return response
@@ -0,0 +1,91 @@
+from typing import Any
+
+from ._async import AsyncAPIClient
+from ._sync import SyncAPIClient
+from .transports import AsyncHttpxTransport, HttpxTransport
+
+
+class HTTP2APIClient(SyncAPIClient):
+    """Synchronous API client sending requests over HTTP/2 with `httpx`.
+
+    Concurrent requests from many threads are multiplexed as streams of one connection
+    per host instead of holding one socket per in-flight request. Requires
+    `pip install upassist[http2]`.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+        from upassist.client import HTTP2APIClient
+
+        heartbeat = Heartbeat("your-heartbeat-slug", api_client_cls=HTTP2APIClient)
+        heartbeat.event()
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        max_connections: int = 10,
+        keepalive_expiry: float = 15.0,
+        **kwargs: Any,
+    ):
+        """Initialize the HTTP/2 API client.
+
+        Args:
+            api_key: Optional API key. If not provided, uses config.API_KEY
+            api_version: Optional API version. If not provided, uses config.API_VERSION
+            max_connections: Maximum number of connections of the pool
+            keepalive_expiry: Seconds to keep idle connections open for reuse
+            **kwargs: Options of `SyncAPIClient`, a given `transport` replaces the HTTP/2 one
+        """
+        if kwargs.get("transport") is None:
+            kwargs["transport"] = HttpxTransport(
+                http2=True, max_connections=max_connections, keepalive_expiry=keepalive_expiry
+            )
+        super().__init__(api_key=api_key, api_version=api_version, **kwargs)
+
+
+class AsyncHTTP2APIClient(AsyncAPIClient):
+    """Asynchronous API client sending requests over HTTP/2 with `httpx`.
+
+    Hundreds of concurrent heartbeat and log requests are multiplexed as streams of one
+    connection per host. Requires `pip install upassist[http2]`.
+
+    Example:
+        ```python
+        import asyncio
+
+        from upassist import AsyncHeartbeat
+        from upassist.client import AsyncHTTP2APIClient
+
+        async def main():
+            async with AsyncHTTP2APIClient() as client:
+                await AsyncHeartbeat(api_client=client).event_many(slugs, concurrency=200)
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        max_connections: int = 100,
+        keepalive_expiry: float = 15.0,
+        **kwargs: Any,
+    ):
+        """Initialize the asynchronous HTTP/2 API client.
+
+        Args:
+            api_key: Optional API key. If not provided, uses config.API_KEY
+            api_version: Optional API version. If not provided, uses config.API_VERSION
+            max_connections: Maximum number of connections of the pool
+            keepalive_expiry: Seconds to keep idle connections open for reuse
+            **kwargs: Options of `AsyncAPIClient`, a given `transport` replaces the HTTP/2 one
+        """
+        if kwargs.get("transport") is None:
+            kwargs["transport"] = AsyncHttpxTransport(
+                http2=True, max_connections=max_connections, keepalive_expiry=keepalive_expiry
+            )
+        super().__init__(api_key=api_key, api_version=api_version, **kwargs)
@@ -1,16 +1,81 @@
 import importlib.util
+import time
 from typing import Any
 
-from ..errors import APIError
+from ..errors import CircuitOpenError, DeadlineExceededError
 from .abstract import AbstractAPIClient
+from .timeout import Deadline, Timeout
+from .transports import RequestsTransport, SyncTransport, TransportStream
 
 
 class SyncAPIClient(AbstractAPIClient):
+    """Synchronous API client backed by pooled `requests` sessions.
+
+    The client keeps one long-lived session per upstream host, so repeated calls to
+    the API, heartbeat and logs hosts reuse established TCP/TLS connections instead
+    of performing a new handshake per request. Sessions are created lazily, shared
+    between threads and discarded in forked child processes.
+
+    Another HTTP backend can be plugged in with `transport`, e.g. `HttpxTransport`
+    to multiplex requests over HTTP/2.
+
+    Example:
+        ```python
+        from upassist import Heartbeat, SyncAPIClient
+
+        with SyncAPIClient(pool_size=20, max_connections=50) as client:
+            Heartbeat("first-slug", api_client=client).event()
+            Heartbeat("second-slug", api_client=client).event()
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        pool_size: int = 10,
+        max_connections: int | None = None,
+        keep_alive: bool = True,
+        transport: SyncTransport | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the synchronous API client.
+
+        Args:
+            api_key: Optional API key. If not provided, uses config.API_KEY
+            api_version: Optional API version. If not provided, uses config.API_VERSION
+            pool_size: Number of connections kept alive per host
+            max_connections: Optional hard limit of connections per host. When reached,
+                callers wait for a free connection instead of opening a new one
+            keep_alive: Whether to keep connections open between requests
+            transport: Optional HTTP backend. A `RequestsTransport` configured with the
+                pool options is used if not provided
+            **kwargs: Options of `AbstractAPIClient`, such as request compression
+        """
+        self.transport = transport
+        super().__init__(api_key=api_key, api_version=api_version, **kwargs)
+        self.pool_size = pool_size
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        if self.transport is None:
+            self.transport = RequestsTransport(
+                pool_size=pool_size, max_connections=max_connections, keep_alive=keep_alive
+            )
+
+    def __enter__(self) -> "SyncAPIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def _check_required_packages(self) -> None:
-        if not importlib.util.find_spec("requests"):
+        if self.transport is None and not importlib.util.find_spec("requests"):
             raise ImportError("You need to install the `requests` package to use sync client")
 
+    def close(self) -> None:
+        """Close the transport and release its connections."""
+        self.transport.close()
+
     def _request(
         self,
         method: str,
@@ -18,16 +83,118 @@ class SyncAPIClient(AbstractAPIClient):
         params: dict | None = None,
         headers: dict | None = None,
         json: dict[Any, Any] | list[Any] | None = None,
+        data: bytes | None = None,
+        cacheable: bool = False,
+        retry: bool | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
-        import requests  # type: ignore
-
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            params=params,
+        headers = dict(headers or {})
+        cache_key, cache_entry = self._cache_lookup(method, url, params, headers, cacheable)
+        if cache_entry is not None and cache_entry.fresh:
+            return cache_entry.value
+
+        json, data = self._compress_body(headers, json=json, data=data)
+        response = self._send(method, url, params, headers, json, data, retry, timeout, deadline)
+        return self._handle_response(method, url, response, cache_key, cache_entry)
+
+    def _stream(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> TransportStream:
+        response = self._send(
+            method, url, params, dict(headers or {}), None, None, retry, timeout, deadline, stream=True
         )
         if not response.ok:
-            raise APIError(response.json(), response.url)
-        return response.json()
+            self._handle_response(method, url, response.read(), None, None)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: dict[Any, Any] | list[Any] | None,
+        data: bytes | None,
+        retry: bool | None,
+        timeout: Timeout | None,
+        deadline: Deadline | None,
+        stream: bool = False,
+    ) -> Any:
+        """Send a request, retrying transient failures according to the retry policy.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers
+            json: JSON body of the request
+            data: Raw body of the request
+            retry: Per-request override of the retried methods
+            timeout: Timeout of every attempt
+            deadline: Optional deadline bounding all attempts
+            stream: Whether to return as soon as the response headers of the last attempt
+                are received, with an unread body
+
+        Returns:
+            `TransportResponse` of the last attempt, or its `TransportStream` when streaming
+        """
+        attempt, retry_started = 1, None
+        while True:
+            try:
+                attempt_timeout = self._attempt_timeout(timeout, deadline)
+                self._circuit_before(url)
+            except (CircuitOpenError, DeadlineExceededError):
+                self._retry_finished(attempt - 1, retry_started, succeeded=False)
+                raise
+            try:
+                if stream:
+                    response = self.transport.stream(
+                        method, url, params=params, headers=headers, timeout=attempt_timeout
+                    )
+                else:
+                    response = self.transport.request(
+                        method, url, params=params, headers=headers, json=json, data=data, timeout=attempt_timeout
+                    )
+            except self.transport.transient_errors:
+                self._circuit_record(url, None)
+                retry_started = retry_started or time.monotonic()
+                delay = self._retry_delay(method, attempt, retry_started, retry, deadline=deadline)
+                if delay is None:
+                    self._retry_finished(attempt, retry_started, succeeded=False)
+                    raise
+            except BaseException:
+                # Cancellations and non-transient errors say nothing about the host, the
+                # trial slot of a half-open circuit is given back for the next request.
+                self._circuit_release(url)
+                raise
+            else:
+                self._circuit_record(url, response.status)
+                if response.ok:
+                    break
+                retry_started = retry_started or time.monotonic()
+                delay = self._retry_delay(
+                    method,
+                    attempt,
+                    retry_started,
+                    retry,
+                    response.status,
+                    response.headers.get("Retry-After"),
+                    deadline,
+                )
+                if delay is None:
+                    break
+                if stream:
+                    response.close()
+            time.sleep(delay)
+            attempt += 1
+
+        self._retry_finished(attempt, retry_started, succeeded=response.ok)
+        return response
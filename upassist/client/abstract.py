@@ -1,7 +1,23 @@
+import json as json_module
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
 from upassist import config
+from upassist.errors import APIError
+from upassist.schemas.validation import ValidationMode
+from upassist.utils.compression import check_encoding, compress
+
+from .cache import CacheKey, ResponseCache
+from .circuit import CircuitBreaker
+from .retry import RetryPolicy
+from .timeout import DEFAULT_TIMEOUT, Deadline, Timeout
+from .transports.base import TransportResponse
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Responses with this status or above count as failures of the upstream host
+SERVER_ERROR_STATUS = 500
 
 
 class AbstractAPIClient(ABC):
@@ -42,16 +58,51 @@ class AbstractAPIClient(ABC):
         ```
     """
 
-    def __init__(self, api_key: str | None = None, api_version: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        compression_threshold: int = 1024,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        timeout: Timeout | float | None = DEFAULT_TIMEOUT,
+        validation: ValidationMode | str = ValidationMode.FULL,
+    ):
         """Initialize the API client.
 
         Args:
             api_key: Optional API key. If not provided, uses config.API_KEY
             api_version: Optional API version. If not provided, uses config.API_VERSION
+            compression: Optional request body encoding: `gzip`, `deflate` or `zstd`.
+                Bodies are sent uncompressed if not provided
+            compression_level: Optional compression level, uses the encoding default if not provided
+            compression_threshold: Bodies smaller than this number of bytes are sent uncompressed
+            cache: Optional response cache used by GET requests made with `cacheable=True`
+            retry: Optional retry policy for transient failures. Requests are attempted
+                once if not provided
+            circuit_breaker: Optional per-host circuit breaker that fails requests to a
+                failing host fast with `CircuitOpenError`
+            timeout: Default connect, read and total timeouts of a request attempt. A number
+                sets all three, None disables them. Every request can override it
+            validation: Default validation mode of the responses parsed by entities, `full`
+                or `raw`. Entity methods can override it per call
         """
         self._check_required_packages()
+        if compression is not None:
+            check_encoding(compression)
         self.api_key = api_key or config.API_KEY
         self.api_version = api_version or config.API_VERSION
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.cache = cache
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.timeout = Timeout.coerce(timeout)
+        self.validation = ValidationMode(validation)
 
     @property
     def base_api_url(self) -> str:
@@ -61,6 +112,192 @@ class AbstractAPIClient(ABC):
     def _check_required_packages(self) -> None:
         return
 
+    def _compress_body(
+        self,
+        headers: dict,
+        json: dict[Any, Any] | list[Any] | None = None,
+        data: bytes | None = None,
+    ) -> tuple[dict[Any, Any] | list[Any] | None, bytes | None]:
+        """Encode and compress the request body if compression is enabled.
+
+        Args:
+            headers: Request headers, updated with `Content-Type` and `Content-Encoding`
+            json: JSON body of the request
+            data: Raw body of the request
+
+        Returns:
+            Tuple of JSON and raw body to send
+        """
+        if self.compression is None or (json is None and data is None):
+            return json, data
+        if data is None:
+            data = json_module.dumps(json).encode()
+            headers.setdefault("Content-Type", "application/json")
+        if len(data) < self.compression_threshold:
+            return None, data
+        headers["Content-Encoding"] = self.compression
+        return None, compress(data, self.compression, self.compression_level)
+
+    def _cache_lookup(
+        self, method: str, url: str, params: dict | None, headers: dict, cacheable: bool
+    ) -> tuple[CacheKey | None, Any]:
+        """Look up a cacheable request and add revalidation headers for stale entries.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers, updated with conditional headers of a stale entry
+            cacheable: Whether the caller allows the response to be cached
+
+        Returns:
+            Tuple of the cache key, or None if the request is not cached, and the cached entry
+        """
+        if not cacheable or self.cache is None or method not in SAFE_METHODS:
+            return None, None
+        key = self.cache.key(method, url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None and not entry.fresh:
+            headers.update(entry.conditional_headers())
+        return key, entry
+
+    def _cache_update(self, method: str, url: str, key: CacheKey | None, value: Any, headers: Mapping) -> None:
+        """Store a cacheable response or invalidate entries affected by a mutating request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            key: Cache key returned by `_cache_lookup`
+            value: Decoded JSON body of the response
+            headers: Response headers
+        """
+        if self.cache is None:
+            return
+        if key is not None:
+            self.cache.store(key, value, headers)
+        elif method not in SAFE_METHODS:
+            self.cache.invalidate(url)
+
+    def _circuit_before(self, url: str) -> None:
+        """Fail fast if the circuit of the request host is open.
+
+        Args:
+            url: Absolute request URL
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(url)
+
+    def _circuit_record(self, url: str, status: int | None) -> None:
+        """Record the outcome of an attempt in the circuit of the request host.
+
+        Args:
+            url: Absolute request URL
+            status: Response status code, None for a connection error
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url, failed=status is None or status >= SERVER_ERROR_STATUS)
+
+    def _circuit_release(self, url: str) -> None:
+        """Give back the circuit trial slot of an attempt that ended without an outcome.
+
+        Args:
+            url: Absolute request URL
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(url)
+
+    def _attempt_timeout(self, timeout: Timeout | None, deadline: Deadline | None) -> Timeout:
+        """Get the timeout of the next attempt of a request.
+
+        Args:
+            timeout: Timeout of the request, uses the client timeout if not provided
+            deadline: Optional deadline bounding the attempt
+
+        Returns:
+            Timeout capped by the time left before the deadline
+
+        Raises:
+            DeadlineExceededError: If the deadline passed
+        """
+        timeout = timeout or self.timeout
+        if deadline is None:
+            return timeout
+        return timeout.bounded(deadline.check())
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        retry_started: float | None,
+        retry: bool | None,
+        status: int | None = None,
+        retry_after: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> float | None:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            method: HTTP method
+            attempt: Number of the attempt that failed, starting at 1
+            retry_started: Monotonic time of the first failed attempt
+            retry: Per-request override of the retried methods
+            status: Response status code, None for a connection error
+            retry_after: Value of the `Retry-After` response header
+            deadline: Optional deadline of the request, no retry is scheduled past it
+
+        Returns:
+            Number of seconds to wait, or None if the request must not be retried
+        """
+        if self.retry is None:
+            return None
+        elapsed = 0.0 if retry_started is None else time.monotonic() - retry_started
+        delay = self.retry.next_delay(method, attempt, elapsed, status=status, retry_after=retry_after, retry=retry)
+        if delay is not None and deadline is not None and delay >= deadline.remaining():
+            return None
+        return delay
+
+    def _retry_finished(self, attempt: int, retry_started: float | None, succeeded: bool) -> None:
+        """Record the outcome of a request in the retry policy statistics.
+
+        Args:
+            attempt: Number of attempts made
+            retry_started: Monotonic time of the first failed attempt
+            succeeded: Whether the last attempt succeeded
+        """
+        if self.retry is not None and retry_started is not None:
+            self.retry.record(attempt, time.monotonic() - retry_started, succeeded)
+
+    def _handle_response(
+        self,
+        method: str,
+        url: str,
+        response: TransportResponse,
+        cache_key: CacheKey | None,
+        cache_entry: Any,
+    ) -> Any:
+        """Decode a response, raising `APIError` for error statuses and updating the cache.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            response: Response of the last attempt
+            cache_key: Cache key returned by `_cache_lookup`
+            cache_entry: Cached entry returned by `_cache_lookup`
+
+        Returns:
+            Decoded JSON body of the response, or the cached value after a `304 Not Modified`
+        """
+        if cache_entry is not None and response.status == 304:  # noqa: PLR2004
+            return self.cache.revalidated(cache_key, cache_entry, response.headers)
+        if not response.ok:
+            raise APIError(response.json(), response.url)
+        value = response.json()
+        self._cache_update(method, url, cache_key, value, response.headers)
+        return value
+
     @abstractmethod
     def _request(
         self,
@@ -69,36 +306,138 @@ class AbstractAPIClient(ABC):
         params: dict | None = None,
         headers: dict | None = None,
         json: dict[Any, Any] | list[Any] | None = None,
+        data: bytes | None = None,
+        cacheable: bool = False,
+        retry: bool | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
         return
 
-    def request(
+    @abstractmethod
+    def _stream(
         self,
         method: str,
         url: str,
         params: dict | None = None,
         headers: dict | None = None,
-        json: dict[Any, Any] | list[Any] | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
+        return
+
+    def _prepare_request(self, url: str, params: dict | None, headers: dict | None) -> tuple[str, dict | None, dict]:
+        """Add authentication, drop empty query parameters and resolve the URL of a request.
+
+        Args:
+            url: Absolute URL or path relative to the base API URL
+            params: Query parameters
+            headers: Request headers
+
+        Returns:
+            Tuple of the absolute URL, query parameters and headers
+        """
         if headers is None:
             headers = {}
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
         # Prepend base_api_url if URL doesn't start with http
         if not url.startswith(("http://", "https://")):
             url = f"{self.base_api_url}/{url.lstrip('/')}"
+        return url, params, headers
 
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        json: dict[Any, Any] | list[Any] | None = None,
+        data: bytes | None = None,
+        cacheable: bool = False,
+        retry: bool | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        url, params, headers = self._prepare_request(url, params, headers)
         return self._request(
             method=method,
             url=url,
             params=params,
             headers=headers,
             json=json,
+            data=data,
+            cacheable=cacheable,
+            retry=retry,
+            timeout=self.timeout if timeout is None else Timeout.coerce(timeout),
+            deadline=deadline,
         )
 
-    def get(self, url: str, params: dict | None = None, headers: dict | None = None) -> Any:
-        return self.request(method="GET", url=url, params=params, headers=headers)
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        """Send a request and return as soon as the response headers are received.
+
+        The request is retried like any other, but once a successful response is returned
+        its body is read by iterating over the chunks of the stream, which must be closed
+        afterwards. Streamed responses bypass the response cache.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL or path relative to the base API URL
+            params: Query parameters
+            headers: Request headers
+            retry: Per-request override of the retried methods
+            timeout: Timeout of every attempt, uses the client timeout if not provided
+            deadline: Optional deadline bounding the attempts until the response headers
+
+        Returns:
+            `TransportStream` for synchronous clients, a coroutine resolving to an
+            `AsyncTransportStream` for asynchronous ones
+
+        Raises:
+            APIError: If the final response has an error status
+        """
+        url, params, headers = self._prepare_request(url, params, headers)
+        return self._stream(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers,
+            retry=retry,
+            timeout=self.timeout if timeout is None else Timeout.coerce(timeout),
+            deadline=deadline,
+        )
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        cacheable: bool = False,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        return self.request(
+            method="GET",
+            url=url,
+            params=params,
+            headers=headers,
+            cacheable=cacheable,
+            timeout=timeout,
+            deadline=deadline,
+        )
 
     def post(
         self,
@@ -106,8 +445,22 @@ class AbstractAPIClient(ABC):
         json: dict[Any, Any] | list[Any] | None = None,
         params: dict | None = None,
         headers: dict | None = None,
+        data: bytes | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
-        return self.request(method="POST", url=url, json=json, params=params, headers=headers)
+        return self.request(
+            method="POST",
+            url=url,
+            json=json,
+            params=params,
+            headers=headers,
+            data=data,
+            retry=retry,
+            timeout=timeout,
+            deadline=deadline,
+        )
 
     def put(
         self,
@@ -115,8 +468,22 @@ class AbstractAPIClient(ABC):
         json: dict[Any, Any] | list[Any] | None = None,
         params: dict | None = None,
         headers: dict | None = None,
+        data: bytes | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
-        return self.request(method="PUT", url=url, json=json, params=params, headers=headers)
+        return self.request(
+            method="PUT",
+            url=url,
+            json=json,
+            params=params,
+            headers=headers,
+            data=data,
+            retry=retry,
+            timeout=timeout,
+            deadline=deadline,
+        )
 
     def patch(
         self,
@@ -124,14 +491,53 @@ class AbstractAPIClient(ABC):
         json: dict[Any, Any] | list[Any] | None = None,
         params: dict | None = None,
         headers: dict | None = None,
+        data: bytes | None = None,
+        retry: bool | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
-        return self.request(method="PATCH", url=url, json=json, params=params, headers=headers)
+        return self.request(
+            method="PATCH",
+            url=url,
+            json=json,
+            params=params,
+            headers=headers,
+            data=data,
+            retry=retry,
+            timeout=timeout,
+            deadline=deadline,
+        )
 
-    def delete(self, url: str, params: dict | None = None, headers: dict | None = None) -> Any:
-        return self.request(method="DELETE", url=url, params=params, headers=headers)
+    def delete(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        return self.request(
+            method="DELETE", url=url, params=params, headers=headers, timeout=timeout, deadline=deadline
+        )
 
-    def head(self, url: str, params: dict | None = None, headers: dict | None = None) -> Any:
-        return self.request(method="HEAD", url=url, params=params, headers=headers)
+    def head(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        return self.request(method="HEAD", url=url, params=params, headers=headers, timeout=timeout, deadline=deadline)
 
-    def options(self, url: str, params: dict | None = None, headers: dict | None = None) -> Any:
-        return self.request(method="OPTIONS", url=url, params=params, headers=headers)
+    def options(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: Timeout | float | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        return self.request(
+            method="OPTIONS", url=url, params=params, headers=headers, timeout=timeout, deadline=deadline
+        )
@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class CacheEntry:
+    """Cached response of a GET request.
+
+    Attributes:
+        value: Decoded JSON body of the response
+        expires_at: Monotonic time after which the entry must be revalidated
+        etag: Value of the `ETag` response header, if any
+        last_modified: Value of the `Last-Modified` response header, if any
+    """
+
+    value: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be returned without contacting the server."""
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Get headers that ask the server to revalidate the entry.
+
+        Returns:
+            Dictionary with `If-None-Match` and/or `If-Modified-Since` headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe TTL and LRU cache of GET responses for the API clients.
+
+    Entries are keyed by method, URL and query parameters. Expired entries that carry
+    an `ETag` or `Last-Modified` validator are revalidated with a conditional request
+    and reused when the server answers `304 Not Modified`. Successful non-GET requests
+    invalidate every entry whose URL path is a parent or a child of the mutated URL,
+    e.g. pausing a heartbeat invalidates both its detail and the heartbeats list.
+
+    Example:
+        ```python
+        from upassist import Heartbeat, SyncAPIClient
+        from upassist.client import ResponseCache
+
+        cache = ResponseCache(ttl=30, max_size=2048)
+        heartbeat = Heartbeat("your-heartbeat-slug", api_client=SyncAPIClient(cache=cache))
+        heartbeat.detail()  # Fetched from the API
+        heartbeat.detail()  # Served from the cache
+        print(cache.stats)
+        ```
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            ttl: Number of seconds a response is served without revalidation
+            max_size: Maximum number of cached responses, least recently used ones are evicted
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get counters of the cache.
+
+        Returns:
+            Dictionary with `hits`, `misses`, `revalidations`, `evictions` and `size`
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+    @staticmethod
+    def key(method: str, url: str, params: Mapping[str, Any] | None = None) -> CacheKey:
+        """Build the cache key of a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+
+        Returns:
+            Hashable cache key
+        """
+        return method.upper(), url, tuple(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+
+    def lookup(self, key: CacheKey) -> CacheEntry | None:
+        """Get an entry and record a hit if it is fresh or a miss otherwise.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            The cached entry, possibly stale, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if entry is not None and entry.fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def store(self, key: CacheKey, value: Any, headers: Mapping[str, str] | None = None) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key of the request
+            value: Decoded JSON body of the response
+            headers: Response headers used to read `ETag` and `Last-Modified` validators
+        """
+        headers = headers or {}
+        entry = CacheEntry(
+            value=value,
+            expires_at=time.monotonic() + self.ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revalidated(self, key: CacheKey, entry: CacheEntry, headers: Mapping[str, str] | None = None) -> Any:
+        """Refresh an entry after the server answered `304 Not Modified`.
+
+        Args:
+            key: Cache key of the request
+            entry: Entry that was revalidated
+            headers: Headers of the `304` response
+
+        Returns:
+            The cached value
+        """
+        headers = headers or {}
+        with self._lock:
+            self.revalidations += 1
+            entry.expires_at = time.monotonic() + self.ttl
+            entry.etag = headers.get("ETag", entry.etag)
+            entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+            self._entries[key] = entry
+        return entry.value
+
+    def invalidate(self, url: str) -> None:
+        """Drop entries related to a mutated resource.
+
+        Args:
+            url: Absolute URL of the mutated resource
+        """
+        mutated = _path_segments(url)
+        with self._lock:
+            for key in [key for key in self._entries if _related(_path_segments(key[1]), mutated)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _path_segments(url: str) -> tuple[str, ...]:
+    parts = urlsplit(url)
+    return (parts.netloc, *(segment for segment in parts.path.split("/") if segment))
+
+
+def _related(first: tuple[str, ...], second: tuple[str, ...]) -> bool:
+    length = min(len(first), len(second))
+    return first[:length] == second[:length]
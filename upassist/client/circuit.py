@@ -0,0 +1,210 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from urllib.parse import urlsplit
+
+from upassist.errors import CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    """State of the circuit of one upstream host."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _HostCircuit:
+    __slots__ = ("opened_at", "outcomes", "state", "trials")
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: deque[tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker of the API clients.
+
+    Every upstream host, e.g. the API, heartbeat and logs hosts, has its own circuit.
+    A closed circuit records the outcome of requests over the last `window` seconds and
+    opens once at least `minimum_requests` were made and the share of failures reaches
+    `failure_threshold`. Connection errors and 5xx responses count as failures. While
+    open, requests to the host raise `CircuitOpenError` immediately instead of waiting
+    for a dead endpoint. After `cooldown` seconds the circuit becomes half-open and lets
+    `half_open_max_calls` trial requests through: a success closes it, a failure opens
+    it for another cooldown.
+
+    Example:
+        ```python
+        from upassist import Heartbeat, SyncAPIClient
+        from upassist.client import CircuitBreaker
+        from upassist.errors import CircuitOpenError
+
+        client = SyncAPIClient(circuit_breaker=CircuitBreaker(failure_threshold=0.5, cooldown=30))
+        try:
+            Heartbeat("your-heartbeat-slug", api_client=client).event()
+        except CircuitOpenError as error:
+            print(f"{error.host} is down, skipping")
+        ```
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        minimum_requests: int = 5,
+        window: float = 30.0,
+        cooldown: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Share of failed requests, between 0 and 1, that opens a circuit
+            minimum_requests: Minimum number of requests in the window before a circuit can open
+            window: Number of seconds of request outcomes taken into account
+            cooldown: Number of seconds a circuit stays open before letting trial requests through
+            half_open_max_calls: Number of concurrent trial requests of a half-open circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+
+        self.opened_count = 0
+        self.rejected_count = 0
+
+        self._circuits: dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get counters of the circuit breaker.
+
+        Returns:
+            Dictionary with the number of times circuits `opened`, of `rejected` requests
+            and of currently `open` circuits
+        """
+        return {
+            "opened": self.opened_count,
+            "rejected": self.rejected_count,
+            "open": sum(circuit.state is not CircuitState.CLOSED for circuit in list(self._circuits.values())),
+        }
+
+    @staticmethod
+    def host(url: str) -> str:
+        """Get the circuit key of a URL.
+
+        Args:
+            url: Absolute request URL
+
+        Returns:
+            Scheme and network location of the URL
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def state(self, url: str) -> CircuitState:
+        """Get the state of the circuit of a host.
+
+        Args:
+            url: Any absolute URL of the host
+
+        Returns:
+            Current state of the circuit
+        """
+        circuit = self._circuits.get(self.host(url))
+        if circuit is None:
+            return CircuitState.CLOSED
+        if circuit.state is CircuitState.OPEN and time.monotonic() - circuit.opened_at >= self.cooldown:
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+    def before_request(self, url: str) -> None:
+        """Check that a request to the host of a URL may be sent.
+
+        Args:
+            url: Absolute request URL
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+        """
+        host = self.host(url)
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return
+            now = time.monotonic()
+            if circuit.state is CircuitState.OPEN:
+                if now - circuit.opened_at < self.cooldown:
+                    self.rejected_count += 1
+                    raise CircuitOpenError(host, circuit.opened_at + self.cooldown - now)
+                circuit.state, circuit.trials = CircuitState.HALF_OPEN, 0
+            if circuit.trials >= self.half_open_max_calls:
+                self.rejected_count += 1
+                raise CircuitOpenError(host, 0.0)
+            circuit.trials += 1
+
+    def record(self, url: str, failed: bool) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            url: Absolute request URL
+            failed: Whether the request failed with a connection error or a 5xx response
+        """
+        host = self.host(url)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                circuit = self._circuits[host] = _HostCircuit()
+
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.trials > 0:
+                    circuit.trials -= 1
+                if failed:
+                    self._open(circuit, now)
+                else:
+                    circuit.state = CircuitState.CLOSED
+                    circuit.outcomes.clear()
+                return
+            if circuit.state is CircuitState.OPEN:
+                return
+
+            outcomes = circuit.outcomes
+            outcomes.append((now, failed))
+            while outcomes and now - outcomes[0][0] > self.window:
+                outcomes.popleft()
+            if len(outcomes) >= self.minimum_requests:
+                failures = sum(outcome_failed for _, outcome_failed in outcomes)
+                if failures / len(outcomes) >= self.failure_threshold:
+                    self._open(circuit, now)
+
+    def release(self, url: str) -> None:
+        """Give back the trial slot of a request that ended without an outcome.
+
+        Must be called instead of `record()` when a request admitted by `before_request()`
+        is cancelled or fails with an error that says nothing about the host, so a
+        half-open circuit keeps letting trial requests through.
+
+        Args:
+            url: Absolute request URL
+        """
+        with self._lock:
+            circuit = self._circuits.get(self.host(url))
+            if circuit is not None and circuit.state is CircuitState.HALF_OPEN and circuit.trials > 0:
+                circuit.trials -= 1
+
+    def _open(self, circuit: _HostCircuit, now: float) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+        self.opened_count += 1
+
+    def reset(self) -> None:
+        """Close every circuit and forget recorded outcomes."""
+        with self._lock:
+            self._circuits.clear()
@@ -0,0 +1,180 @@
+import random
+import threading
+import time
+from collections.abc import Collection
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Retry policy of the API clients for transient failures.
+
+    Failed attempts are retried after an exponential backoff with full jitter, i.e. a
+    random delay between zero and `backoff_base * 2 ** (attempt - 1)` capped by
+    `backoff_max`. A `Retry-After` response header replaces the computed delay. Only
+    idempotent methods are retried unless a request opts in with `retry=True`, and the
+    total time spent retrying one request never exceeds `max_retry_time`, so tail latency
+    stays bounded.
+
+    Example:
+        ```python
+        from upassist import Logs, SyncAPIClient
+        from upassist.client import RetryPolicy
+
+        retry = RetryPolicy(max_attempts=4, backoff_base=0.2)
+        logs = Logs(api_client=SyncAPIClient(retry=retry))
+        logs.collect(items, retry=True)  # POST requests are only retried on opt-in
+        print(retry.stats)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        max_retry_time: float = 30.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Maximum number of attempts of a request, including the first one
+            backoff_base: Upper bound of the first retry delay in seconds
+            backoff_max: Maximum upper bound of a computed retry delay in seconds
+            max_retry_time: Maximum number of seconds spent retrying one request. A retry
+                whose delay would exceed this budget is not attempted
+            retry_statuses: Response status codes that are retried
+            retry_methods: HTTP methods retried without an explicit opt-in
+            respect_retry_after: Whether to wait for the delay of a `Retry-After` header
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_time = max_retry_time
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+
+        self.retries = 0
+        self.retried_requests = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.retry_time = 0.0
+
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Get counters of the policy.
+
+        Returns:
+            Dictionary with `retries`, `retried_requests`, `recovered` and `exhausted`
+            counts and the total `retry_time` in seconds
+        """
+        return {
+            "retries": self.retries,
+            "retried_requests": self.retried_requests,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+            "retry_time": self.retry_time,
+        }
+
+    def is_retryable(self, method: str, retry: bool | None = None) -> bool:
+        """Check whether requests of a method may be retried.
+
+        Args:
+            method: HTTP method
+            retry: Per-request override, None uses `retry_methods`
+
+        Returns:
+            True if failed attempts of the request may be retried
+        """
+        if retry is not None:
+            return retry
+        return method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+            retry_after: Value of the `Retry-After` header of the failed response
+
+        Returns:
+            Number of seconds to wait
+        """
+        if retry_after is not None and self.respect_retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return delay
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status: int | None = None,
+        retry_after: str | None = None,
+        retry: bool | None = None,
+    ) -> float | None:
+        """Decide whether a failed attempt is retried and record the retry.
+
+        Args:
+            method: HTTP method
+            attempt: Number of the attempt that failed, starting at 1
+            elapsed: Seconds spent retrying the request so far
+            status: Response status code, None for a connection error
+            retry_after: Value of the `Retry-After` header of the failed response
+            retry: Per-request override of `retry_methods`
+
+        Returns:
+            Number of seconds to wait before the next attempt, or None if the failure is final
+        """
+        if status is not None and status not in self.retry_statuses:
+            return None
+        if not self.is_retryable(method, retry):
+            return None
+        delay = self.backoff(attempt, retry_after)
+        if attempt >= self.max_attempts or elapsed + delay > self.max_retry_time:
+            with self._lock:
+                self.exhausted += 1
+            return None
+        with self._lock:
+            self.retries += 1
+            if attempt == 1:
+                self.retried_requests += 1
+        return delay
+
+    def record(self, attempts: int, elapsed: float, succeeded: bool) -> None:
+        """Record the outcome of a request that was retried.
+
+        Args:
+            attempts: Number of attempts made
+            elapsed: Seconds spent retrying the request
+            succeeded: Whether the last attempt succeeded
+        """
+        if attempts <= 1:
+            return
+        with self._lock:
+            self.retry_time += elapsed
+            if succeeded:
+                self.recovered += 1
+
+
+def _parse_retry_after(value: str) -> float | None:
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    # HTTP dates are rare, `email.utils` is imported for them only to keep the client import cheap.
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -0,0 +1,116 @@
+import time
+from dataclasses import dataclass, replace
+
+from upassist.errors import DeadlineExceededError
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Timeouts of a single request attempt, in seconds.
+
+    None disables a timeout. The synchronous client has no total timeout of its own, so
+    it bounds connecting and every socket read by the remaining total instead.
+
+    Attributes:
+        connect: Maximum time to establish a connection
+        read: Maximum time to wait for data from the server
+        total: Maximum time of the whole attempt, including reading the response
+    """
+
+    connect: float | None = 5.0
+    read: float | None = 30.0
+    total: float | None = 60.0
+
+    @classmethod
+    def coerce(cls, value: "Timeout | float | None") -> "Timeout":
+        """Build a timeout from a `Timeout`, a number of seconds used for every timeout, or None.
+
+        Args:
+            value: Value to convert
+
+        Returns:
+            Timeout instance
+        """
+        if isinstance(value, Timeout):
+            return value
+        return cls(connect=value, read=value, total=value)
+
+    def bounded(self, remaining: float) -> "Timeout":
+        """Cap every timeout to the time left before a deadline.
+
+        Args:
+            remaining: Number of seconds left
+
+        Returns:
+            Timeout whose values do not exceed `remaining`
+        """
+        return replace(
+            self,
+            connect=remaining if self.connect is None else min(self.connect, remaining),
+            read=remaining if self.read is None else min(self.read, remaining),
+            total=remaining if self.total is None else min(self.total, remaining),
+        )
+
+    def capped(self) -> "Timeout":
+        """Cap the connect and read timeouts to the total, for backends without a total timeout.
+
+        Returns:
+            Timeout whose connect and read values do not exceed `total`
+        """
+        return self if self.total is None else self.bounded(self.total)
+
+
+DEFAULT_TIMEOUT = Timeout()
+
+
+class Deadline:
+    """Point in time after which an operation spanning many requests must stop.
+
+    Pass the same deadline to every request of a pagination walk or a bulk operation:
+    each request is bounded by the remaining time, and requests started after the
+    deadline raise `DeadlineExceededError` without touching the network.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+        from upassist.client import Deadline
+
+        heartbeats = Heartbeat().list_all(deadline=Deadline(10))
+        ```
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        """Start a deadline.
+
+        Args:
+            seconds: Number of seconds from now until the deadline
+        """
+        self.expires_at = time.monotonic() + seconds
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+    def remaining(self) -> float:
+        """Get the number of seconds left, negative once the deadline passed."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline passed."""
+        return self.remaining() <= 0
+
+    def check(self) -> float:
+        """Get the number of seconds left or raise if the deadline passed.
+
+        Returns:
+            Positive number of seconds left
+
+        Raises:
+            DeadlineExceededError: If the deadline passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded")
+        return remaining
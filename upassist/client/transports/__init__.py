@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING
+
+from upassist.utils.lazy import lazy_attributes
+
+from .base import AsyncTransport, AsyncTransportStream, SyncTransport, TransportResponse, TransportStream
+
+if TYPE_CHECKING:
+    from ._aiohttp import AiohttpTransport
+    from ._httpx import AsyncHttpxTransport, HttpxTransport
+    from ._requests import RequestsTransport
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AiohttpTransport": "._aiohttp",
+        "AsyncHttpxTransport": "._httpx",
+        "HttpxTransport": "._httpx",
+        "RequestsTransport": "._requests",
+    },
+)
+
+__all__ = (
+    "AiohttpTransport",
+    "AsyncHttpxTransport",
+    "AsyncTransport",
+    "AsyncTransportStream",
+    "HttpxTransport",
+    "RequestsTransport",
+    "SyncTransport",
+    "TransportResponse",
+    "TransportStream",
+)
@@ -0,0 +1,131 @@
+import asyncio
+import importlib.util
+from typing import Any
+
+from ..timeout import Timeout
+from .base import STREAM_CHUNK_SIZE, AsyncTransport, AsyncTransportStream, JSONBody, TransportResponse
+
+
+class AiohttpTransport(AsyncTransport):
+    """HTTP/1.1 transport backed by a shared `aiohttp` session.
+
+    The session and its TCP connector are created lazily on the first request and
+    reused afterwards, so concurrent calls share keep-alive connections and the DNS
+    cache. The number of simultaneously open sockets is bounded by the connector limits.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int | None = 10,
+        keepalive_timeout: float = 15,
+    ):
+        """Initialize the transport.
+
+        Args:
+            limit: Total number of simultaneous connections, 0 for no limit
+            limit_per_host: Number of simultaneous connections to a single host, 0 for no limit
+            ttl_dns_cache: Seconds to cache resolved DNS records, None to cache forever
+            keepalive_timeout: Seconds to keep idle connections open for reuse
+        """
+        if not importlib.util.find_spec("aiohttp"):
+            raise ImportError("You need to install the `aiohttp` package to use async client")
+        import aiohttp  # type: ignore
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.transient_errors = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        self._session: Any = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _get_session(self) -> Any:
+        import aiohttp  # type: ignore
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            stale, stale_loop = self._session, self._session_loop
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+            if stale is not None and stale_loop is not None and stale_loop is not loop:
+                await self._close_session(stale, stale_loop)
+        return self._session
+
+    @staticmethod
+    async def _close_session(session: Any, loop: asyncio.AbstractEventLoop) -> None:
+        if session.closed:
+            return
+        if loop is asyncio.get_running_loop() or loop.is_closed():
+            # The connections of a closed loop died with it, so this only marks the connector closed.
+            await session.close()
+        else:
+            # The connections belong to another running loop and must be closed from it.
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        import aiohttp  # type: ignore
+
+        session = await self._get_session()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            json=json,
+            data=data,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout.total, sock_connect=timeout.connect, sock_read=timeout.read),
+        ) as response:
+            content = await response.read()
+            return TransportResponse(
+                status=response.status, headers=response.headers, content=content, url=str(response.url)
+            )
+
+    async def stream(
+        self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout
+    ) -> AsyncTransportStream:
+        import aiohttp  # type: ignore
+
+        session = await self._get_session()
+        response = await session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout.total, sock_connect=timeout.connect, sock_read=timeout.read),
+        )
+
+        async def release() -> None:
+            response.release()
+
+        return AsyncTransportStream(
+            status=response.status,
+            headers=response.headers,
+            url=str(response.url),
+            chunks=response.content.iter_chunked(STREAM_CHUNK_SIZE),
+            release=release,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared session and release its connections."""
+        session, self._session = self._session, None
+        loop, self._session_loop = self._session_loop, None
+        if session is not None and loop is not None:
+            await self._close_session(session, loop)
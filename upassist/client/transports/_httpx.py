@@ -0,0 +1,216 @@
+import asyncio
+import importlib.util
+import os
+import threading
+from typing import Any
+
+from ..timeout import Timeout
+from .base import (
+    STREAM_CHUNK_SIZE,
+    AsyncTransport,
+    AsyncTransportStream,
+    JSONBody,
+    SyncTransport,
+    TransportResponse,
+    TransportStream,
+)
+
+
+def _check_httpx(http2: bool) -> None:
+    if not importlib.util.find_spec("httpx"):
+        raise ImportError("You need to install the `httpx` package to use the httpx transport")
+    if http2 and not importlib.util.find_spec("h2"):
+        raise ImportError("You need to install the `h2` package to use HTTP/2, e.g. `pip install upassist[http2]`")
+
+
+def _limits(max_connections: int, keepalive_expiry: float) -> Any:
+    import httpx  # type: ignore
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _timeout(timeout: Timeout) -> Any:
+    import httpx  # type: ignore
+
+    # httpx has no total timeout, every phase is bounded by the total instead.
+    capped = timeout.capped()
+    return httpx.Timeout(
+        connect=capped.connect,
+        read=capped.read,
+        write=capped.read,
+        pool=capped.total,
+    )
+
+
+def _response(response: Any) -> TransportResponse:
+    return TransportResponse(
+        status=response.status_code, headers=response.headers, content=response.content, url=str(response.url)
+    )
+
+
+class HttpxTransport(SyncTransport):
+    """Transport backed by an `httpx` client, with HTTP/2 enabled by default.
+
+    Over HTTPS the client negotiates HTTP/2 with ALPN and multiplexes concurrent
+    requests from many threads as streams of one connection per host, instead of
+    holding one socket per in-flight request.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 10, keepalive_expiry: float = 15.0):
+        """Initialize the transport.
+
+        Args:
+            http2: Whether to negotiate HTTP/2, requires the `h2` package
+            max_connections: Maximum number of connections of the pool
+            keepalive_expiry: Seconds to keep idle connections open for reuse
+        """
+        _check_httpx(http2)
+        import httpx  # type: ignore
+
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.transient_errors = (httpx.TransportError,)
+        self._client: Any = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _get_client(self) -> Any:
+        import httpx  # type: ignore
+
+        if self._pid != os.getpid():
+            # Connections inherited from the parent process must not be reused.
+            self._client, self._pid = None, os.getpid()
+        client = self._client
+        if client is None:
+            with self._lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(
+                        http2=self.http2, limits=_limits(self.max_connections, self.keepalive_expiry)
+                    )
+        return client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        response = self._get_client().request(
+            method, url, params=params, headers=headers, json=json, content=data, timeout=_timeout(timeout)
+        )
+        return _response(response)
+
+    def stream(self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout) -> TransportStream:
+        client = self._get_client()
+        request = client.build_request(method, url, params=params, headers=headers, timeout=_timeout(timeout))
+        response = client.send(request, stream=True)
+        return TransportStream(
+            status=response.status_code,
+            headers=response.headers,
+            url=str(response.url),
+            chunks=response.iter_bytes(STREAM_CHUNK_SIZE),
+            release=response.close,
+        )
+
+    def close(self) -> None:
+        """Close the client and release its connections."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """Asynchronous transport backed by an `httpx` client, with HTTP/2 enabled by default.
+
+    Over HTTPS hundreds of concurrent heartbeat and log requests are multiplexed as
+    streams of one connection per host.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 100, keepalive_expiry: float = 15.0):
+        """Initialize the transport.
+
+        Args:
+            http2: Whether to negotiate HTTP/2, requires the `h2` package
+            max_connections: Maximum number of connections of the pool
+            keepalive_expiry: Seconds to keep idle connections open for reuse
+        """
+        _check_httpx(http2)
+        import httpx  # type: ignore
+
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.transient_errors = (httpx.TransportError,)
+        self._client: Any = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> Any:
+        import httpx  # type: ignore
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and self._client_loop is not None and self._client_loop is not loop:
+                self._discard_client(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(
+                http2=self.http2, limits=_limits(self.max_connections, self.keepalive_expiry)
+            )
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    def _discard_client(client: Any, loop: asyncio.AbstractEventLoop) -> None:
+        # The connections of a client belong to the loop that opened them and can only be closed from it.
+        # Once that loop is closed they died with it and the client is left to the garbage collector.
+        if not client.is_closed and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        response = await self._get_client().request(
+            method, url, params=params, headers=headers, json=json, content=data, timeout=_timeout(timeout)
+        )
+        return _response(response)
+
+    async def stream(
+        self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout
+    ) -> AsyncTransportStream:
+        client = self._get_client()
+        request = client.build_request(method, url, params=params, headers=headers, timeout=_timeout(timeout))
+        response = await client.send(request, stream=True)
+        return AsyncTransportStream(
+            status=response.status_code,
+            headers=response.headers,
+            url=str(response.url),
+            chunks=response.aiter_bytes(STREAM_CHUNK_SIZE),
+            release=response.aclose,
+        )
+
+    async def aclose(self) -> None:
+        """Close the client and release its connections."""
+        client, self._client = self._client, None
+        loop, self._client_loop = self._client_loop, None
+        if client is None or client.is_closed:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        elif loop is not None:
+            self._discard_client(client, loop)
@@ -0,0 +1,142 @@
+import importlib.util
+import os
+import threading
+import weakref
+from typing import Any
+from urllib.parse import urlsplit
+
+from ..timeout import Timeout
+from .base import STREAM_CHUNK_SIZE, JSONBody, SyncTransport, TransportResponse, TransportStream
+
+_transports: "weakref.WeakSet[RequestsTransport]" = weakref.WeakSet()
+
+
+def _reset_transports_after_fork() -> None:
+    for transport in list(_transports):
+        transport._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_transports_after_fork)
+
+
+def _timeout(timeout: Timeout) -> tuple[float | None, float | None]:
+    # requests has no total timeout, connecting and every socket read are bounded by it instead.
+    timeout = timeout.capped()
+    return timeout.connect, timeout.read
+
+
+class RequestsTransport(SyncTransport):
+    """HTTP/1.1 transport backed by pooled `requests` sessions.
+
+    The transport keeps one long-lived session per upstream host, so repeated calls to
+    the API, heartbeat and logs hosts reuse established TCP/TLS connections instead of
+    performing a new handshake per request. Sessions are created lazily, shared between
+    threads and discarded in forked child processes.
+    """
+
+    def __init__(self, pool_size: int = 10, max_connections: int | None = None, keep_alive: bool = True):
+        """Initialize the transport.
+
+        Args:
+            pool_size: Number of connections kept alive per host
+            max_connections: Optional hard limit of connections per host. When reached,
+                callers wait for a free connection instead of opening a new one
+            keep_alive: Whether to keep connections open between requests
+        """
+        if not importlib.util.find_spec("requests"):
+            raise ImportError("You need to install the `requests` package to use sync client")
+        import requests  # type: ignore
+
+        self.pool_size = pool_size
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.transient_errors = (requests.ConnectionError, requests.Timeout)
+        self._sessions: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        _transports.add(self)
+
+    def _create_session(self) -> Any:
+        import requests  # type: ignore
+        from requests.adapters import HTTPAdapter  # type: ignore
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_connections or self.pool_size,
+            pool_block=self.max_connections is not None,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _get_session(self, url: str) -> Any:
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        session = self._sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host)
+                if session is None:
+                    session = self._sessions[host] = self._create_session()
+        return session
+
+    def _reset_after_fork(self) -> None:
+        # Sockets inherited from the parent must not be reused or closed by the child,
+        # so the sessions are dropped without calling `close()` on them.
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        response = self._get_session(url).request(
+            method=method,
+            url=url,
+            headers=headers,
+            json=json,
+            data=data,
+            params=params,
+            timeout=_timeout(timeout),
+        )
+        return TransportResponse(
+            status=response.status_code, headers=response.headers, content=response.content, url=response.url
+        )
+
+    def stream(self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout) -> TransportStream:
+        response = self._get_session(url).request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            timeout=_timeout(timeout),
+            stream=True,
+        )
+        return TransportStream(
+            status=response.status_code,
+            headers=response.headers,
+            url=response.url,
+            chunks=response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+            release=response.close,
+        )
+
+    def close(self) -> None:
+        """Close all pooled sessions and release their connections."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
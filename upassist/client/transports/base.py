@@ -0,0 +1,261 @@
+import json as json_module
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from ..timeout import Timeout
+
+JSONBody = dict[Any, Any] | list[Any] | None
+
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class TransportResponse:
+    """Fully read HTTP response returned by a transport.
+
+    Attributes:
+        status: Response status code
+        headers: Case-insensitive response headers
+        content: Response body
+        url: Final URL of the request
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    content: bytes
+    url: str
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is lower than 400."""
+        return self.status < 400  # noqa: PLR2004
+
+    def json(self) -> Any:
+        """Decode the JSON body of the response."""
+        return json_module.loads(self.content)
+
+
+def _release() -> None:
+    return
+
+
+async def _async_release() -> None:
+    return
+
+
+@dataclass
+class TransportStream:
+    """HTTP response whose body is read incrementally, returned by `SyncTransport.stream`.
+
+    Attributes:
+        status: Response status code
+        headers: Case-insensitive response headers
+        url: Final URL of the request
+        chunks: Iterator of body chunks, already decoded from their `Content-Encoding`
+        release: Callback closing the response and releasing its connection
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    url: str
+    chunks: Iterator[bytes]
+    release: Callable[[], None] = _release
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is lower than 400."""
+        return self.status < 400  # noqa: PLR2004
+
+    def read(self) -> TransportResponse:
+        """Read the rest of the body and close the response.
+
+        Returns:
+            The fully read response
+        """
+        try:
+            content = b"".join(self.chunks)
+        finally:
+            self.close()
+        return TransportResponse(status=self.status, headers=self.headers, content=content, url=self.url)
+
+    def close(self) -> None:
+        """Close the response and release its connection."""
+        self.release()
+
+
+@dataclass
+class AsyncTransportStream:
+    """HTTP response whose body is read incrementally, returned by `AsyncTransport.stream`.
+
+    Attributes:
+        status: Response status code
+        headers: Case-insensitive response headers
+        url: Final URL of the request
+        chunks: Asynchronous iterator of body chunks, already decoded from their `Content-Encoding`
+        release: Coroutine function closing the response and releasing its connection
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    url: str
+    chunks: AsyncIterator[bytes]
+    release: Callable[[], Awaitable[None]] = _async_release
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is lower than 400."""
+        return self.status < 400  # noqa: PLR2004
+
+    async def read(self) -> TransportResponse:
+        """Read the rest of the body and close the response.
+
+        Returns:
+            The fully read response
+        """
+        try:
+            content = b"".join([chunk async for chunk in self.chunks])
+        finally:
+            await self.aclose()
+        return TransportResponse(status=self.status, headers=self.headers, content=content, url=self.url)
+
+    async def aclose(self) -> None:
+        """Close the response and release its connection."""
+        await self.release()
+
+
+async def _single_chunk(content: bytes) -> AsyncIterator[bytes]:
+    yield content
+
+
+class SyncTransport(ABC):
+    """Interface of the HTTP backends of `SyncAPIClient`.
+
+    A transport sends one request attempt and returns the fully read response. Retries,
+    caching, compression, circuit breaking and error handling stay in the client, so
+    every backend behaves the same.
+
+    Attributes:
+        transient_errors: Exceptions raised for connection failures and timeouts, which
+            the client retry policy and circuit breaker treat as transient failures
+    """
+
+    transient_errors: tuple[type[BaseException], ...] = ()
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers
+            json: JSON body of the request
+            data: Raw body of the request
+            timeout: Timeouts of the attempt
+
+        Returns:
+            The response
+        """
+
+    def stream(self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout) -> TransportStream:
+        """Send a request without a body and return once the response headers are received.
+
+        The body is read by iterating over the chunks of the returned stream, which must be
+        closed afterwards. Backends that cannot stream return the fully read body as a
+        single chunk.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers
+            timeout: Timeouts of the attempt
+
+        Returns:
+            The response with an unread body
+        """
+        response = self.request(method, url, params, headers, None, None, timeout)
+        return TransportStream(
+            status=response.status, headers=response.headers, url=response.url, chunks=iter((response.content,))
+        )
+
+    def close(self) -> None:
+        """Release the connections of the transport."""
+        return
+
+
+class AsyncTransport(ABC):
+    """Interface of the HTTP backends of `AsyncAPIClient`.
+
+    Attributes:
+        transient_errors: Exceptions raised for connection failures and timeouts, which
+            the client retry policy and circuit breaker treat as transient failures
+    """
+
+    transient_errors: tuple[type[BaseException], ...] = ()
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        """Send a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers
+            json: JSON body of the request
+            data: Raw body of the request
+            timeout: Timeouts of the attempt
+
+        Returns:
+            The response
+        """
+
+    async def stream(
+        self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout
+    ) -> AsyncTransportStream:
+        """Send a request without a body and return once the response headers are received.
+
+        The body is read by iterating over the chunks of the returned stream, which must be
+        closed afterwards. Backends that cannot stream return the fully read body as a
+        single chunk.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers
+            timeout: Timeouts of the attempt
+
+        Returns:
+            The response with an unread body
+        """
+        response = await self.request(method, url, params, headers, None, None, timeout)
+        return AsyncTransportStream(
+            status=response.status, headers=response.headers, url=response.url, chunks=_single_chunk(response.content)
+        )
+
+    async def aclose(self) -> None:
+        """Release the connections of the transport."""
+        return
@@ -1,5 +1,24 @@
-from .base import BaseEntity
-from .heartbeat import Heartbeat
-from .logs import Logs
+from typing import TYPE_CHECKING
 
-__all__ = ("BaseEntity", "Heartbeat", "Logs")
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import BaseEntity
+    from .heartbeat import AsyncHeartbeat, Heartbeat
+    from .logs import AsyncLogs, Logs
+    from .streaming import AsyncPageStream, PageStream
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncHeartbeat": ".heartbeat.heartbeat",
+        "AsyncLogs": ".logs.logs",
+        "AsyncPageStream": ".streaming",
+        "BaseEntity": ".base",
+        "Heartbeat": ".heartbeat.heartbeat",
+        "Logs": ".logs.logs",
+        "PageStream": ".streaming",
+    },
+)
+
+__all__ = ("AsyncHeartbeat", "AsyncLogs", "AsyncPageStream", "BaseEntity", "Heartbeat", "Logs", "PageStream")
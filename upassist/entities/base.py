@@ -1,6 +1,12 @@
+from typing import Any, TypeVar
+
 from upassist import config
 from upassist.client._sync import SyncAPIClient
 from upassist.client.abstract import AbstractAPIClient
+from upassist.client.transports import AsyncTransport, SyncTransport
+from upassist.schemas.validation import ValidationMode, validate
+
+ModelT = TypeVar("ModelT")
 
 
 class BaseEntity:
@@ -15,6 +21,8 @@ class BaseEntity:
         api_key: str | None = None,
         api_version: str | None = None,
         api_client_cls: type[AbstractAPIClient] = SyncAPIClient,
+        api_client: AbstractAPIClient | None = None,
+        transport: SyncTransport | AsyncTransport | None = None,
     ):
         """Initialize a new entity instance.
 
@@ -22,11 +30,19 @@ class BaseEntity:
             api_key: Optional API key for authentication
             api_version: Optional API version to use
             api_client_cls: Class to use for API client implementation
+            api_client: Optional client instance to share its connection pool between entities.
+                When provided, `api_key`, `api_version`, `api_client_cls` and `transport` are ignored
+            transport: Optional HTTP backend of the client created with `api_client_cls`,
+                e.g. `HttpxTransport` to send requests over HTTP/2
         """
-        self.api_client = api_client_cls(
-            api_key=api_key or config.API_KEY,
-            api_version=api_version or config.API_VERSION,
-        )
+        if api_client is None:
+            options = {} if transport is None else {"transport": transport}
+            api_client = api_client_cls(
+                api_key=api_key or config.API_KEY,
+                api_version=api_version or config.API_VERSION,
+                **options,
+            )
+        self.api_client = api_client
 
     @property
     def base_api_url(self) -> str:
@@ -36,3 +52,29 @@ class BaseEntity:
             Base URL for API endpoints
         """
         return self.api_client.base_api_url
+
+    def _validate(
+        self, schema: type[ModelT], value: Any, validation: ValidationMode | str | None = None
+    ) -> ModelT | Any:
+        """Turn a decoded response into a schema.
+
+        Args:
+            schema: Pydantic model of the response
+            value: Decoded JSON response
+            validation: Validation mode of the call, the client default if not provided
+
+        Returns:
+            Schema instance, or the decoded response in raw mode
+        """
+        return validate(schema, value, self._validation_mode(validation))
+
+    def _validation_mode(self, validation: ValidationMode | str | None = None) -> ValidationMode:
+        """Resolve the validation mode of a call.
+
+        Args:
+            validation: Validation mode of the call, the client default if not provided
+
+        Returns:
+            Validation mode to apply
+        """
+        return self.api_client.validation if validation is None else ValidationMode(validation)
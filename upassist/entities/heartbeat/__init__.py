@@ -1,15 +1,52 @@
-from .heartbeat import Heartbeat
-from .schemas import (
-    HeartbeatCreateSchema,
-    HeartbeatDetailSchema,
-    HeartbeatListSchema,
-    HeartbeatPaginatedSchema,
+from typing import TYPE_CHECKING
+
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .bulk import BulkResult
+    from .emitter import AsyncHeartbeatEmitter, HeartbeatEmitter
+    from .heartbeat import AsyncHeartbeat, Heartbeat
+    from .index import AsyncHeartbeatIndex, HeartbeatIndex
+    from .monitor import JobMonitor
+    from .schemas import (
+        HeartbeatCreateSchema,
+        HeartbeatDetailSchema,
+        HeartbeatListSchema,
+        HeartbeatPaginatedSchema,
+    )
+    from .table import HeartbeatTable
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncHeartbeat": ".heartbeat",
+        "AsyncHeartbeatEmitter": ".emitter",
+        "AsyncHeartbeatIndex": ".index",
+        "BulkResult": ".bulk",
+        "Heartbeat": ".heartbeat",
+        "HeartbeatCreateSchema": ".schemas",
+        "HeartbeatDetailSchema": ".schemas",
+        "HeartbeatEmitter": ".emitter",
+        "HeartbeatIndex": ".index",
+        "HeartbeatListSchema": ".schemas",
+        "HeartbeatPaginatedSchema": ".schemas",
+        "HeartbeatTable": ".table",
+        "JobMonitor": ".monitor",
+    },
 )
 
 __all__ = (
+    "AsyncHeartbeat",
+    "AsyncHeartbeatEmitter",
+    "AsyncHeartbeatIndex",
+    "BulkResult",
     "Heartbeat",
     "HeartbeatCreateSchema",
     "HeartbeatDetailSchema",
+    "HeartbeatEmitter",
+    "HeartbeatIndex",
     "HeartbeatListSchema",
     "HeartbeatPaginatedSchema",
+    "HeartbeatTable",
+    "JobMonitor",
 )
@@ -0,0 +1,70 @@
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+class BulkResult(dict[str, Any]):
+    """Per-slug results of a bulk heartbeat operation.
+
+    Every slug maps to the value returned by the operation, or to the exception it
+    raised, such as `APIError`. A failing slug does not stop the others.
+    """
+
+    @property
+    def succeeded(self) -> dict[str, Any]:
+        """Get results of the slugs processed successfully."""
+        return {slug: value for slug, value in self.items() if not isinstance(value, BaseException)}
+
+    @property
+    def failed(self) -> dict[str, BaseException]:
+        """Get exceptions raised for the slugs that failed."""
+        return {slug: value for slug, value in self.items() if isinstance(value, BaseException)}
+
+    @property
+    def ok(self) -> bool:
+        """Whether every slug was processed successfully."""
+        return not self.failed
+
+
+def run_bulk(func: Callable[[str], Any], slugs: Iterable[str], concurrency: int) -> BulkResult:
+    """Run an operation for every slug in a thread pool.
+
+    Args:
+        func: Operation called with a single slug
+        slugs: Slugs to process, duplicates are processed once
+        concurrency: Maximum number of operations running at the same time
+
+    Returns:
+        BulkResult with the outcome of every slug
+    """
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upassist-heartbeats-bulk") as executor:
+        futures = {slug: executor.submit(func, slug) for slug in dict.fromkeys(slugs)}
+    result = BulkResult()
+    for slug, future in futures.items():
+        exception = future.exception()
+        result[slug] = exception if exception is not None else future.result()
+    return result
+
+
+async def run_bulk_async(func: Callable[[str], Awaitable[Any]], slugs: Iterable[str], concurrency: int) -> BulkResult:
+    """Run a coroutine operation for every slug with bounded concurrency.
+
+    Args:
+        func: Coroutine function called with a single slug
+        slugs: Slugs to process, duplicates are processed once
+        concurrency: Maximum number of operations running at the same time
+
+    Returns:
+        BulkResult with the outcome of every slug
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(slug: str) -> Any:
+        async with semaphore:
+            return await func(slug)
+
+    unique_slugs = list(dict.fromkeys(slugs))
+    values = await asyncio.gather(*(run(slug) for slug in unique_slugs), return_exceptions=True)
+    return BulkResult(zip(unique_slugs, values, strict=True))
@@ -0,0 +1,374 @@
+import asyncio
+import atexit
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any
+
+from .enums import HeartbeatStatusEnum
+from .heartbeat import AsyncHeartbeat, Heartbeat
+
+# Status reports are never coalesced, so their buffer is bounded to protect memory when
+# the heartbeat host is unreachable for a long time.
+MAX_PENDING_REPORTS = 10_000
+
+
+class BaseHeartbeatEmitter:
+    """Common bookkeeping of the synchronous and asynchronous heartbeat emitters.
+
+    A beat only marks its slug as pending. A slug is sent at most once per `interval`;
+    beats recorded while a slug is pending or waiting for its interval are coalesced
+    into the next event. Status reports are queued separately and sent in order, one
+    event per report.
+    """
+
+    def __init__(self, heartbeat: Any, interval: float, shutdown_timeout: float):
+        self.heartbeat = heartbeat
+        self.interval = interval
+        self.shutdown_timeout = shutdown_timeout
+
+        self.beats_count = 0
+        self.sent_count = 0
+        self.coalesced_count = 0
+        self.failed_count = 0
+        self.dropped_count = 0
+
+        self._pending: dict[str, None] = {}
+        self._reports: deque[tuple[str, HeartbeatStatusEnum, dict[str, Any] | None]] = deque(maxlen=MAX_PENDING_REPORTS)
+        self._last_sent: dict[str, float] = {}
+        self._closed = False
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get counters of the emitter.
+
+        Returns:
+            Dictionary with `beats`, `sent`, `coalesced`, `failed`, `dropped` and `pending` counts
+        """
+        return {
+            "beats": self.beats_count,
+            "sent": self.sent_count,
+            "coalesced": self.coalesced_count,
+            "failed": self.failed_count,
+            "dropped": self.dropped_count,
+            "pending": len(self._pending) + len(self._reports),
+        }
+
+    def _resolve_slug(self, slug: str | None) -> str:
+        slug = slug or self.heartbeat.heartbeat_slug
+        if not slug:
+            raise ValueError("`heartbeat_slug` is required to perform object action")
+        return slug
+
+    def _record_report(self, slug: str | None, status: HeartbeatStatusEnum, meta: dict[str, Any] | None) -> None:
+        slug = self._resolve_slug(slug)
+        status = HeartbeatStatusEnum(status)
+        if len(self._reports) == self._reports.maxlen:
+            # The bounded queue evicts the oldest report to make room.
+            self.dropped_count += 1
+        self._reports.append((slug, status, meta))
+
+    def _record(self, slug: str | None) -> bool:
+        slug = self._resolve_slug(slug)
+        self.beats_count += 1
+        if slug in self._pending:
+            self.coalesced_count += 1
+            return False
+        self._pending[slug] = None
+        return True
+
+    def _due_slugs(self, force: bool = False) -> list[str]:
+        now = time.monotonic()
+        return [
+            slug
+            for slug in list(self._pending)
+            if force or now - self._last_sent.get(slug, float("-inf")) >= self.interval
+        ]
+
+    def _next_due_in(self) -> float | None:
+        if self._reports:
+            return 0
+        if not self._pending:
+            return None
+        now = time.monotonic()
+        next_due = min(self._last_sent.get(slug, float("-inf")) + self.interval for slug in list(self._pending))
+        return max(next_due - now, 0)
+
+    def _sent(self, slug: str, error: BaseException | None) -> None:
+        self._last_sent[slug] = time.monotonic()
+        if error is None:
+            self._pending.pop(slug, None)
+            self.sent_count += 1
+        else:
+            # The slug stays pending and is retried once its interval elapses.
+            self.failed_count += 1
+
+    def _reported(self, error: BaseException | None) -> None:
+        if error is None:
+            self.sent_count += 1
+        else:
+            self.failed_count += 1
+
+
+class HeartbeatEmitter(BaseHeartbeatEmitter):
+    """Non-blocking heartbeat event sender backed by a background thread.
+
+    `beat()` records a beat in O(1) without any network call; a background thread sends
+    at most one `Heartbeat.event()` per slug per `interval`. Pending beats are flushed
+    on `close()` and at interpreter exit.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+        from upassist.entities.heartbeat import HeartbeatEmitter
+
+        emitter = HeartbeatEmitter(Heartbeat("your-heartbeat-slug"), interval=30)
+        for job in jobs:
+            process(job)
+            emitter.beat()
+        emitter.close()
+        ```
+    """
+
+    def __init__(self, heartbeat: Heartbeat | None = None, interval: float = 30.0, shutdown_timeout: float = 5.0):
+        """Initialize the emitter.
+
+        Args:
+            heartbeat: Heartbeat entity whose client sends events. Its slug is used by
+                `beat()` when no slug is given. A new `Heartbeat()` is created if not provided
+            interval: Minimum number of seconds between two events of the same slug
+            shutdown_timeout: Maximum seconds `close()` waits for pending events to be sent
+        """
+        super().__init__(heartbeat or Heartbeat(), interval, shutdown_timeout)
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._flush_requested = False
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._pid = os.getpid()
+
+        self_ref = weakref.ref(self)
+        self._atexit = lambda: (emitter := self_ref()) is not None and emitter.close()
+        atexit.register(self._atexit)
+
+    def beat(self, slug: str | None = None) -> None:
+        """Record a beat to be sent in the background.
+
+        Args:
+            slug: Slug of the heartbeat, defaults to the slug of the emitter heartbeat
+        """
+        if self._closed:
+            return
+        if self._record(slug):
+            if self._worker is None or self._pid != os.getpid():
+                self._ensure_worker()
+            self._wakeup.set()
+
+    def report(self, status: HeartbeatStatusEnum, meta: dict[str, Any] | None = None, slug: str | None = None) -> None:
+        """Queue a status event to be sent in the background, in order with other reports.
+
+        Args:
+            status: Status of the monitored job
+            meta: Optional metadata sent with the event, e.g. job duration
+            slug: Slug of the heartbeat, defaults to the slug of the emitter heartbeat
+        """
+        if self._closed:
+            return
+        self._record_report(slug, status, meta)
+        if self._worker is None or self._pid != os.getpid():
+            self._ensure_worker()
+        self._wakeup.set()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # The worker thread does not survive `os.fork()`.
+                self._worker = None
+                self._pid = os.getpid()
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="upassist-heartbeat-emitter", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.clear()
+            force = self._flush_requested
+            while self._reports:
+                slug, status, meta = self._reports.popleft()
+                try:
+                    type(self.heartbeat)(slug, api_client=self.heartbeat.api_client).event(status=status, meta=meta)
+                except Exception as error:
+                    self._reported(error)
+                else:
+                    self._reported(None)
+            for slug in self._due_slugs(force=force):
+                try:
+                    type(self.heartbeat)(slug, api_client=self.heartbeat.api_client).event()
+                except Exception as error:
+                    self._sent(slug, error)
+                else:
+                    self._sent(slug, None)
+            timeout = self._next_due_in()
+            if timeout is None or force:
+                self._idle.set()
+            self._wakeup.wait(timeout)
+        self._idle.set()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send pending beats immediately, ignoring the interval.
+
+        Args:
+            timeout: Maximum number of seconds to wait, None waits indefinitely
+
+        Returns:
+            True if every pending beat was sent or attempted before the deadline
+        """
+        if self._worker is None or not (self._pending or self._reports):
+            return True
+        self._flush_requested = True
+        self._idle.clear()
+        self._wakeup.set()
+        try:
+            return self._idle.wait(timeout)
+        finally:
+            self._flush_requested = False
+
+    def close(self) -> None:
+        """Send pending beats and reports within `shutdown_timeout` and stop the background thread."""
+        if self._closed:
+            return
+        self.flush(timeout=self.shutdown_timeout)
+        self._closed = True
+        self._wakeup.set()
+        atexit.unregister(self._atexit)
+
+
+class AsyncHeartbeatEmitter(BaseHeartbeatEmitter):
+    """Non-blocking heartbeat event sender backed by an asyncio task.
+
+    `beat()` is a plain method that records a beat in O(1); a background task sends at
+    most one `AsyncHeartbeat.event()` per slug per `interval`.
+
+    Example:
+        ```python
+        from upassist import AsyncHeartbeat
+        from upassist.entities.heartbeat import AsyncHeartbeatEmitter
+
+        async with AsyncHeartbeatEmitter(AsyncHeartbeat("your-heartbeat-slug"), interval=30) as emitter:
+            async for message in consumer:
+                await handle(message)
+                emitter.beat()
+        ```
+    """
+
+    def __init__(self, heartbeat: AsyncHeartbeat | None = None, interval: float = 30.0, shutdown_timeout: float = 5.0):
+        """Initialize the emitter.
+
+        Args:
+            heartbeat: AsyncHeartbeat entity whose client sends events. Its slug is used by
+                `beat()` when no slug is given. A new `AsyncHeartbeat()` is created if not provided
+            interval: Minimum number of seconds between two events of the same slug
+            shutdown_timeout: Maximum seconds `aclose()` waits for pending events to be sent
+        """
+        super().__init__(heartbeat or AsyncHeartbeat(), interval, shutdown_timeout)
+        # Since Python 3.10 events bind to the running loop on first use.
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "AsyncHeartbeatEmitter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def beat(self, slug: str | None = None) -> None:
+        """Record a beat to be sent in the background.
+
+        Must be called from the event loop thread.
+
+        Args:
+            slug: Slug of the heartbeat, defaults to the slug of the emitter heartbeat
+        """
+        if self._closed:
+            return
+        if self._record(slug):
+            if self._task is None:
+                self._task = asyncio.get_running_loop().create_task(self._run(), name="upassist-heartbeat-emitter")
+            self._wakeup.set()
+
+    def report(self, status: HeartbeatStatusEnum, meta: dict[str, Any] | None = None, slug: str | None = None) -> None:
+        """Queue a status event to be sent in the background, in order with other reports.
+
+        Must be called from the event loop thread.
+
+        Args:
+            status: Status of the monitored job
+            meta: Optional metadata sent with the event, e.g. job duration
+            slug: Slug of the heartbeat, defaults to the slug of the emitter heartbeat
+        """
+        if self._closed:
+            return
+        # Outside the event loop this raises before the report is queued.
+        loop = asyncio.get_running_loop()
+        self._record_report(slug, status, meta)
+        if self._task is None:
+            self._task = loop.create_task(self._run(), name="upassist-heartbeat-emitter")
+        self._wakeup.set()
+
+    async def _send_reports(self) -> None:
+        while self._reports:
+            slug, status, meta = self._reports.popleft()
+            try:
+                await type(self.heartbeat)(slug, api_client=self.heartbeat.api_client).event(status=status, meta=meta)
+            except Exception as error:
+                self._reported(error)
+            else:
+                self._reported(None)
+
+    async def _send(self, slugs: list[str]) -> None:
+        async def send(slug: str) -> None:
+            try:
+                await type(self.heartbeat)(slug, api_client=self.heartbeat.api_client).event()
+            except Exception as error:
+                self._sent(slug, error)
+            else:
+                self._sent(slug, None)
+
+        await asyncio.gather(*(send(slug) for slug in slugs))
+
+    async def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.clear()
+            await self._send_reports()
+            await self._send(self._due_slugs())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._next_due_in())
+            except asyncio.TimeoutError:
+                pass
+
+    async def aclose(self) -> None:
+        """Send pending beats and reports within `shutdown_timeout` and stop the background task."""
+        if self._closed:
+            return
+        self._closed = True
+        shutdown_at = time.monotonic() + self.shutdown_timeout
+        task, self._task = self._task, None
+        if task is not None:
+            # The task stops once it sees `_closed`, after finishing the sends in flight.
+            self._wakeup.set()
+            done, _ = await asyncio.wait({task}, timeout=self.shutdown_timeout)
+            if not done:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        async def send_pending() -> None:
+            await self._send_reports()
+            await self._send(self._due_slugs(force=True))
+
+        try:
+            await asyncio.wait_for(send_pending(), max(shutdown_at - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            pass
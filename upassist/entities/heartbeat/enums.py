@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class HeartbeatStatusEnum(str, Enum):
+    """Enumeration of possible heartbeat statuses."""
+
+    RUNNING = "RUNNING"
+    SUCCESS = "SUCCESS"
+    FAILURE = "FAILURE"
@@ -1,25 +1,41 @@
+import builtins
+import functools
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
 from upassist import config
-from upassist.client import AbstractAPIClient, SyncAPIClient
+from upassist.client import AbstractAPIClient, Deadline, SyncAPIClient
+from upassist.client.transports import AsyncTransport, SyncTransport
 from upassist.entities.base import BaseEntity
-from upassist.schemas.base import DetailResponse
+from upassist.schemas.validation import ValidationMode, get_field
 from upassist.utils.attributes import attribute_required
 
-from .schemas import (
-    HeartbeatCreateSchema,
-    HeartbeatDetailSchema,
-    HeartbeatPaginatedSchema,
-    HeartbeatSchema,
-)
+from .bulk import BulkResult, run_bulk, run_bulk_async
+from .enums import HeartbeatStatusEnum
 
-heartbeat_slug_required = attribute_required("heartbeat_slug")
+if TYPE_CHECKING:
+    # Schemas pull in pydantic, they are imported on first validation to keep
+    # `Heartbeat(slug).event()` fast to start.
+    from upassist.entities.streaming import AsyncPageStream, PageStream
+    from upassist.schemas.base import DetailResponse
 
+    from .emitter import AsyncHeartbeatEmitter, HeartbeatEmitter
+    from .monitor import JobMonitor
+    from .schemas import (
+        HeartbeatCreateSchema,
+        HeartbeatDetailSchema,
+        HeartbeatListSchema,
+        HeartbeatPaginatedSchema,
+        HeartbeatSchema,
+    )
+    from .table import HeartbeatTable
 
-class Heartbeat(BaseEntity):
-    """A class representing a heartbeat monitoring entity.
+heartbeat_slug_required = attribute_required("heartbeat_slug")
 
-    This class provides functionality to manage and interact with heartbeat monitors,
-    including creating, listing, pausing, and managing heartbeat events.
-    """
+
+class BaseHeartbeat(BaseEntity):
+    """Common configuration shared by the synchronous and asynchronous heartbeat entities."""
 
     base_heartbeat_event_api_url: str = "https://heartbeats.upassist.cloud/api"
 
@@ -29,6 +45,8 @@ class Heartbeat(BaseEntity):
         api_key: str | None = None,
         api_version: str | None = None,
         api_client_cls: type[AbstractAPIClient] = SyncAPIClient,
+        api_client: AbstractAPIClient | None = None,
+        transport: SyncTransport | AsyncTransport | None = None,
     ):
         """Initialize a new Heartbeat instance.
 
@@ -37,26 +55,55 @@ class Heartbeat(BaseEntity):
             api_key: API key for authentication
             api_version: API version to use
             api_client_cls: Class to use for API client implementation
+            api_client: Optional client instance shared between entities
+            transport: Optional HTTP backend of the client created with `api_client_cls`
         """
         super().__init__(
             api_key=api_key or config.API_KEY,
             api_version=api_version or config.API_VERSION,
             api_client_cls=api_client_cls,
+            api_client=api_client,
+            transport=transport,
         )
         self.heartbeat_slug = heartbeat_slug
+        self._emitter: Any = None
+
+    @property
+    def base_heartbeats_api_url(self) -> str:
+        """Get the base URL for heartbeat API endpoints.
+
+        Returns:
+            Base URL for heartbeat API endpoints
+        """
+        return f"{self.api_client.base_api_url}/heartbeats"
+
+
+class Heartbeat(BaseHeartbeat):
+    """A class representing a heartbeat monitoring entity.
+
+    This class provides functionality to manage and interact with heartbeat monitors,
+    including creating, listing, pausing, and managing heartbeat events.
+    """
 
     def list(
-        self, q: str | None = None, page: int | None = None, per_page: int | None = None
-    ) -> HeartbeatPaginatedSchema:
+        self,
+        q: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> "HeartbeatPaginatedSchema":
         """List all heartbeats with optional filtering and pagination.
 
         Args:
             q: Search query string
             page: Page number for pagination
             per_page: Number of items per page
+            deadline: Optional deadline bounding the request
+            validation: Optional validation mode of the response, the client default if not provided
 
         Returns:
-            HeartbeatPaginatedSchema containing the list of heartbeats
+            HeartbeatPaginatedSchema containing the list of heartbeats, a dictionary in raw mode
         """
         response = self.api_client.get(
             self.base_heartbeats_api_url,
@@ -65,67 +112,829 @@ class Heartbeat(BaseEntity):
                 "page": page,
                 "per_page": per_page,
             },
+            cacheable=True,
+            deadline=deadline,
+        )
+        from .schemas import HeartbeatPaginatedSchema
+
+        return self._validate(HeartbeatPaginatedSchema, response, validation)
+
+    def list_stream(
+        self,
+        q: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> "PageStream[HeartbeatListSchema]":
+        """Stream one page of heartbeats, decoding and validating items as they arrive.
+
+        Unlike `list()`, the page is never held whole in memory: the request is sent when
+        the iteration starts and each item is yielded as soon as it is received, which
+        suits large `per_page` values. Streamed pages bypass the response cache.
+
+        Args:
+            q: Search query string
+            page: Page number for pagination
+            per_page: Number of items per page
+            deadline: Optional deadline bounding the request until the response headers
+            validation: Optional validation mode of the items, the client default if not provided
+
+        Returns:
+            PageStream of HeartbeatListSchema items, dictionaries in raw mode, exposing the
+            pagination fields once parsed
+        """
+        from upassist.entities.streaming import PageStream
+
+        from .schemas import HeartbeatListSchema
+
+        return PageStream(
+            functools.partial(
+                self.api_client.stream,
+                "GET",
+                self.base_heartbeats_api_url,
+                params={"q": q, "page": page, "per_page": per_page},
+                deadline=deadline,
+            ),
+            HeartbeatListSchema,
+            self._validation_mode(validation),
+        )
+
+    def iter_all(
+        self,
+        q: str | None = None,
+        per_page: int | None = None,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> Iterator["HeartbeatListSchema"]:
+        """Iterate over all heartbeats page by page.
+
+        The next page is fetched in a background thread while the items of the current
+        page are consumed, so walking all pages costs about one page of latency plus the
+        time spent consuming items.
+
+        Args:
+            q: Search query string
+            per_page: Number of items per page
+            deadline: Optional deadline of the whole walk, fetching a page after it raises
+                `DeadlineExceededError`
+            validation: Optional validation mode of the pages, the client default if not provided
+
+        Returns:
+            Iterator of HeartbeatListSchema items, dictionaries in raw mode
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upassist-heartbeats-prefetch")
+        try:
+            future = executor.submit(
+                self.list, q=q, page=1, per_page=per_page, deadline=deadline, validation=validation
+            )
+            while future is not None:
+                page = future.result()
+                future = None
+                next_page = get_field(page, "next_page")
+                if next_page:
+                    future = executor.submit(
+                        self.list, q=q, page=next_page, per_page=per_page, deadline=deadline, validation=validation
+                    )
+                yield from get_field(page, "data")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def list_all(
+        self,
+        q: str | None = None,
+        per_page: int | None = None,
+        concurrency: int = 4,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> builtins.list["HeartbeatListSchema"]:
+        """Fetch heartbeats of all pages concurrently.
+
+        The first page is fetched to learn `pages_count`, then the remaining pages are
+        fetched by a pool of `concurrency` threads sharing the entity client. Keep the
+        client `pool_size` at least `concurrency` to reuse every connection.
+
+        Args:
+            q: Search query string
+            per_page: Number of items per page
+            concurrency: Maximum number of pages fetched at the same time
+            deadline: Optional deadline of the whole walk, fetching a page after it raises
+                `DeadlineExceededError`
+            validation: Optional validation mode of the pages, the client default if not provided
+
+        Returns:
+            List of HeartbeatListSchema items of all pages in page order, dictionaries in raw mode
+        """
+        first_page = self.list(q=q, page=1, per_page=per_page, deadline=deadline, validation=validation)
+        items = builtins.list(get_field(first_page, "data"))
+        pages_count = get_field(first_page, "pages_count")
+        if pages_count <= 1:
+            return items
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upassist-heartbeats-fetch") as executor:
+            pages = executor.map(
+                lambda page: self.list(q=q, page=page, per_page=per_page, deadline=deadline, validation=validation),
+                range(2, pages_count + 1),
+            )
+            for page in pages:
+                items.extend(get_field(page, "data"))
+        return items
+
+    def list_table(
+        self, q: str | None = None, per_page: int | None = None, deadline: Deadline | None = None
+    ) -> "HeartbeatTable":
+        """Fetch heartbeats of all pages into a compact column-wise table.
+
+        Pages are decoded without building schemas and stored column by column as they
+        arrive, which takes a fraction of the memory of `list_all()` for large fleets.
+        Rows are validated into `HeartbeatListSchema` only when accessed.
+
+        Args:
+            q: Search query string
+            per_page: Number of items per page
+            deadline: Optional deadline of the whole walk, fetching a page after it raises
+                `DeadlineExceededError`
+
+        Returns:
+            HeartbeatTable of the heartbeats of all pages in page order
+        """
+        from .table import HeartbeatTable
+
+        return HeartbeatTable(self.iter_all(q=q, per_page=per_page, deadline=deadline, validation=ValidationMode.RAW))
+
+    @heartbeat_slug_required
+    def detail(
+        self, deadline: Deadline | None = None, validation: ValidationMode | str | None = None
+    ) -> "HeartbeatDetailSchema":
+        """Get detailed information about a specific heartbeat.
+
+        Args:
+            deadline: Optional deadline bounding the request
+            validation: Optional validation mode of the response, the client default if not provided
+
+        Returns:
+            HeartbeatDetailSchema containing detailed heartbeat information, a dictionary in raw mode
+        """
+        response = self.api_client.get(
+            f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}", cacheable=True, deadline=deadline
+        )
+        from .schemas import HeartbeatDetailSchema
+
+        return self._validate(HeartbeatDetailSchema, response, validation)
+
+    @heartbeat_slug_required
+    def pause(self, deadline: Deadline | None = None):
+        """Pause the heartbeat monitoring.
+
+        Args:
+            deadline: Optional deadline bounding the request
+        """
+        return self.api_client.patch(f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}/pause", deadline=deadline)
+
+    @heartbeat_slug_required
+    def unpause(self, deadline: Deadline | None = None):
+        """Resume the heartbeat monitoring.
+
+        Args:
+            deadline: Optional deadline bounding the request
+        """
+        return self.api_client.patch(f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}/unpause", deadline=deadline)
+
+    @heartbeat_slug_required
+    def delete(self, deadline: Deadline | None = None) -> None:
+        """Delete the heartbeat.
+
+        Args:
+            deadline: Optional deadline bounding the request
+        """
+        self.api_client.delete(f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}", deadline=deadline)
+
+    @heartbeat_slug_required
+    def event(
+        self,
+        status: HeartbeatStatusEnum | None = None,
+        meta: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> "DetailResponse":
+        """Get the current event status of the heartbeat.
+
+        Args:
+            status: Optional job status reported with the event
+            meta: Optional metadata sent as query parameters, e.g. job duration
+            deadline: Optional deadline bounding the request
+
+        Returns:
+            DetailResponse containing the event status
+        """
+        params = dict(meta or {})
+        if status is not None:
+            params["status"] = HeartbeatStatusEnum(status).value
+        return self.api_client.get(
+            f"{self.base_heartbeat_event_api_url}/event/{self.heartbeat_slug}",
+            params=params or None,
+            deadline=deadline,
+        )
+
+    @heartbeat_slug_required
+    def monitor(self) -> "JobMonitor":
+        """Monitor a job with `running`, `success` and `failure` events sent in the background.
+
+        The returned monitor is a context manager and a decorator. Events are queued on
+        the entity `emitter`, so the job never waits for the network.
+
+        Returns:
+            JobMonitor reporting to this heartbeat
+        """
+        from .monitor import JobMonitor
+
+        return JobMonitor(self.emitter)
+
+    def monitored(self, func: Callable[..., Any] | None = None, *, slug: str | None = None) -> Any:
+        """Decorate a job function to report its `running`, `success` and `failure` events.
+
+        Usable bare, `@heartbeat.monitored`, or with arguments,
+        `@heartbeat.monitored(slug="other-job")`. Events are queued on the entity `emitter`
+        like with `monitor()`.
+
+        Args:
+            func: Function to monitor, given when used without arguments
+            slug: Slug of the heartbeat reported to, defaults to the slug of the entity
+
+        Returns:
+            Decorated function, or a decorator of a function when called with arguments only
+
+        Raises:
+            ValueError: If neither `slug` nor the entity slug is set
+        """
+        from .monitor import JobMonitor
+
+        if not (slug or self.heartbeat_slug):
+            raise ValueError("`heartbeat_slug` is required to perform object action")
+        monitor = JobMonitor(self.emitter, slug)
+        return monitor if func is None else monitor(func)
+
+    def create(
+        self, heartbeat: "HeartbeatCreateSchema", validation: ValidationMode | str | None = None
+    ) -> "HeartbeatSchema":
+        """Create a new heartbeat.
+
+        Args:
+            heartbeat: The heartbeat configuration.
+            validation: Optional validation mode of the response, the client default if not provided
+
+        Returns:
+            HeartbeatSchema containing the created heartbeat information, a dictionary in raw mode
+        """
+        response = self.api_client.post(
+            self.base_heartbeats_api_url,
+            json=heartbeat.model_dump(exclude_unset=True),
         )
-        return HeartbeatPaginatedSchema.model_validate(response)
+        from .schemas import HeartbeatSchema
+
+        return self._validate(HeartbeatSchema, response, validation)
+
+    def _run_many(self, action: str, slugs: Iterable[str], concurrency: int, deadline: Deadline | None) -> BulkResult:
+        return run_bulk(
+            lambda slug: getattr(type(self)(slug, api_client=self.api_client), action)(deadline=deadline),
+            slugs,
+            concurrency,
+        )
+
+    def pause_many(self, slugs: Iterable[str], concurrency: int = 8, deadline: Deadline | None = None) -> BulkResult:
+        """Pause several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to pause
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to its response or the raised exception
+        """
+        return self._run_many("pause", slugs, concurrency, deadline)
+
+    def unpause_many(self, slugs: Iterable[str], concurrency: int = 8, deadline: Deadline | None = None) -> BulkResult:
+        """Resume several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to resume
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to its response or the raised exception
+        """
+        return self._run_many("unpause", slugs, concurrency, deadline)
+
+    def delete_many(self, slugs: Iterable[str], concurrency: int = 8, deadline: Deadline | None = None) -> BulkResult:
+        """Delete several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to delete
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to None or the raised exception
+        """
+        return self._run_many("delete", slugs, concurrency, deadline)
+
+    def event_many(self, slugs: Iterable[str], concurrency: int = 8, deadline: Deadline | None = None) -> BulkResult:
+        """Send events for several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to send events for
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to its response or the raised exception
+        """
+        return self._run_many("event", slugs, concurrency, deadline)
 
     @property
-    def base_heartbeats_api_url(self) -> str:
-        """Get the base URL for heartbeat API endpoints.
+    def emitter(self) -> "HeartbeatEmitter":
+        """Get the background emitter of the entity, created on first use.
 
         Returns:
-            Base URL for heartbeat API endpoints
+            HeartbeatEmitter sending events of this heartbeat
         """
-        return f"{self.api_client.base_api_url}/heartbeats"
+        if self._emitter is None:
+            from .emitter import HeartbeatEmitter
+
+            self._emitter = HeartbeatEmitter(self)
+        return self._emitter
+
+
+class AsyncHeartbeat(BaseHeartbeat):
+    """Asynchronous counterpart of `Heartbeat`.
+
+    Every method awaits the transport before validating the response, so the entity
+    can be used from asyncio services without a thread pool.
+
+    Example:
+        ```python
+        import asyncio
+
+        from upassist import AsyncAPIClient, AsyncHeartbeat
+
+        async def main():
+            async with AsyncAPIClient() as client:
+                heartbeats = [AsyncHeartbeat(slug, api_client=client) for slug in slugs]
+                await asyncio.gather(*(heartbeat.event() for heartbeat in heartbeats))
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        heartbeat_slug: str | None = None,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        api_client_cls: type[AbstractAPIClient] | None = None,
+        api_client: AbstractAPIClient | None = None,
+        transport: SyncTransport | AsyncTransport | None = None,
+    ):
+        """Initialize a new AsyncHeartbeat instance.
+
+        Args:
+            heartbeat_slug: Unique identifier for the heartbeat
+            api_key: API key for authentication
+            api_version: API version to use
+            api_client_cls: Class to use for API client implementation, `AsyncAPIClient` if not provided
+            api_client: Optional client instance shared between entities
+            transport: Optional HTTP backend of the client created with `api_client_cls`
+        """
+        if api_client_cls is None:
+            from upassist.client import AsyncAPIClient
+
+            api_client_cls = AsyncAPIClient
+        super().__init__(
+            heartbeat_slug=heartbeat_slug,
+            api_key=api_key,
+            api_version=api_version,
+            api_client_cls=api_client_cls,
+            api_client=api_client,
+            transport=transport,
+        )
+
+    async def list(
+        self,
+        q: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> "HeartbeatPaginatedSchema":
+        """List all heartbeats with optional filtering and pagination.
+
+        Args:
+            q: Search query string
+            page: Page number for pagination
+            per_page: Number of items per page
+            deadline: Optional deadline bounding the request
+            validation: Optional validation mode of the response, the client default if not provided
+
+        Returns:
+            HeartbeatPaginatedSchema containing the list of heartbeats, a dictionary in raw mode
+        """
+        response = await self.api_client.get(
+            self.base_heartbeats_api_url,
+            params={
+                "q": q,
+                "page": page,
+                "per_page": per_page,
+            },
+            cacheable=True,
+            deadline=deadline,
+        )
+        from .schemas import HeartbeatPaginatedSchema
+
+        return self._validate(HeartbeatPaginatedSchema, response, validation)
+
+    def list_stream(
+        self,
+        q: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> "AsyncPageStream[HeartbeatListSchema]":
+        """Stream one page of heartbeats, decoding and validating items as they arrive.
+
+        Unlike `list()`, the page is never held whole in memory: the request is sent when
+        the iteration starts and each item is yielded as soon as it is received, which
+        suits large `per_page` values. Streamed pages bypass the response cache.
+
+        Args:
+            q: Search query string
+            page: Page number for pagination
+            per_page: Number of items per page
+            deadline: Optional deadline bounding the request until the response headers
+            validation: Optional validation mode of the items, the client default if not provided
+
+        Returns:
+            AsyncPageStream of HeartbeatListSchema items, dictionaries in raw mode, exposing the
+            pagination fields once parsed
+        """
+        from upassist.entities.streaming import AsyncPageStream
+
+        from .schemas import HeartbeatListSchema
+
+        return AsyncPageStream(
+            functools.partial(
+                self.api_client.stream,
+                "GET",
+                self.base_heartbeats_api_url,
+                params={"q": q, "page": page, "per_page": per_page},
+                deadline=deadline,
+            ),
+            HeartbeatListSchema,
+            self._validation_mode(validation),
+        )
+
+    async def iter_all(
+        self,
+        q: str | None = None,
+        per_page: int | None = None,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> AsyncIterator["HeartbeatListSchema"]:
+        """Iterate over all heartbeats page by page.
+
+        The next page is fetched in a background task while the items of the current
+        page are consumed, so walking all pages costs about one page of latency plus the
+        time spent consuming items.
+
+        Args:
+            q: Search query string
+            per_page: Number of items per page
+            deadline: Optional deadline of the whole walk, fetching a page after it raises
+                `DeadlineExceededError`
+            validation: Optional validation mode of the pages, the client default if not provided
+
+        Returns:
+            Async iterator of HeartbeatListSchema items, dictionaries in raw mode
+        """
+        import asyncio
+
+        task: asyncio.Task[HeartbeatPaginatedSchema] | None = asyncio.ensure_future(
+            self.list(q=q, page=1, per_page=per_page, deadline=deadline, validation=validation)
+        )
+        try:
+            while task is not None:
+                page = await task
+                task = None
+                next_page = get_field(page, "next_page")
+                if next_page:
+                    task = asyncio.ensure_future(
+                        self.list(q=q, page=next_page, per_page=per_page, deadline=deadline, validation=validation)
+                    )
+                for item in get_field(page, "data"):
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def list_all(
+        self,
+        q: str | None = None,
+        per_page: int | None = None,
+        concurrency: int = 4,
+        deadline: Deadline | None = None,
+        validation: ValidationMode | str | None = None,
+    ) -> builtins.list["HeartbeatListSchema"]:
+        """Fetch heartbeats of all pages concurrently.
+
+        The first page is fetched to learn `pages_count`, then at most `concurrency`
+        of the remaining pages are fetched at the same time. The first failing page
+        cancels the fetches still running and its error is raised.
+
+        Args:
+            q: Search query string
+            per_page: Number of items per page
+            concurrency: Maximum number of pages fetched at the same time
+            deadline: Optional deadline of the whole walk, fetching a page after it raises
+                `DeadlineExceededError`
+            validation: Optional validation mode of the pages, the client default if not provided
+
+        Returns:
+            List of HeartbeatListSchema items of all pages in page order, dictionaries in raw mode
+        """
+        import asyncio
+
+        first_page = await self.list(q=q, page=1, per_page=per_page, deadline=deadline, validation=validation)
+        items = builtins.list(get_field(first_page, "data"))
+        pages_count = get_field(first_page, "pages_count")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> "HeartbeatPaginatedSchema":
+            async with semaphore:
+                return await self.list(q=q, page=page, per_page=per_page, deadline=deadline, validation=validation)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, pages_count + 1)]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            # `gather` leaves the other fetches running after the first failure.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        for page in pages:
+            items.extend(get_field(page, "data"))
+        return items
+
+    async def list_table(
+        self, q: str | None = None, per_page: int | None = None, deadline: Deadline | None = None
+    ) -> "HeartbeatTable":
+        """Fetch heartbeats of all pages into a compact column-wise table.
+
+        Pages are decoded without building schemas and stored column by column as they
+        arrive, which takes a fraction of the memory of `list_all()` for large fleets.
+        Rows are validated into `HeartbeatListSchema` only when accessed.
+
+        Args:
+            q: Search query string
+            per_page: Number of items per page
+            deadline: Optional deadline of the whole walk, fetching a page after it raises
+                `DeadlineExceededError`
+
+        Returns:
+            HeartbeatTable of the heartbeats of all pages in page order
+        """
+        from .table import HeartbeatTable
+
+        table = HeartbeatTable()
+        async for item in self.iter_all(q=q, per_page=per_page, deadline=deadline, validation=ValidationMode.RAW):
+            table.append(item)
+        return table
 
     @heartbeat_slug_required
-    def detail(self) -> HeartbeatDetailSchema:
+    async def detail(
+        self, deadline: Deadline | None = None, validation: ValidationMode | str | None = None
+    ) -> "HeartbeatDetailSchema":
         """Get detailed information about a specific heartbeat.
 
+        Args:
+            deadline: Optional deadline bounding the request
+            validation: Optional validation mode of the response, the client default if not provided
+
         Returns:
-            HeartbeatDetailSchema containing detailed heartbeat information
+            HeartbeatDetailSchema containing detailed heartbeat information, a dictionary in raw mode
         """
-        response = self.api_client.get(f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}")
-        return HeartbeatDetailSchema.model_validate(response)
+        response = await self.api_client.get(
+            f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}", cacheable=True, deadline=deadline
+        )
+        from .schemas import HeartbeatDetailSchema
+
+        return self._validate(HeartbeatDetailSchema, response, validation)
 
     @heartbeat_slug_required
-    def pause(self):
-        """Pause the heartbeat monitoring."""
-        return self.api_client.patch(
-            f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}/pause",
+    async def pause(self, deadline: Deadline | None = None):
+        """Pause the heartbeat monitoring.
+
+        Args:
+            deadline: Optional deadline bounding the request
+        """
+        return await self.api_client.patch(
+            f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}/pause", deadline=deadline
         )
 
     @heartbeat_slug_required
-    def unpause(self):
-        """Resume the heartbeat monitoring."""
-        return self.api_client.patch(
-            f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}/unpause",
+    async def unpause(self, deadline: Deadline | None = None):
+        """Resume the heartbeat monitoring.
+
+        Args:
+            deadline: Optional deadline bounding the request
+        """
+        return await self.api_client.patch(
+            f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}/unpause", deadline=deadline
         )
 
     @heartbeat_slug_required
-    def delete(self) -> None:
-        """Delete the heartbeat."""
-        self.api_client.delete(f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}")
+    async def delete(self, deadline: Deadline | None = None) -> None:
+        """Delete the heartbeat.
+
+        Args:
+            deadline: Optional deadline bounding the request
+        """
+        await self.api_client.delete(f"{self.base_heartbeats_api_url}/{self.heartbeat_slug}", deadline=deadline)
 
     @heartbeat_slug_required
-    def event(self) -> DetailResponse:
+    async def event(
+        self,
+        status: HeartbeatStatusEnum | None = None,
+        meta: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> "DetailResponse":
         """Get the current event status of the heartbeat.
 
+        Args:
+            status: Optional job status reported with the event
+            meta: Optional metadata sent as query parameters, e.g. job duration
+            deadline: Optional deadline bounding the request
+
         Returns:
             DetailResponse containing the event status
         """
-        return self.api_client.get(f"{self.base_heartbeat_event_api_url}/event/{self.heartbeat_slug}")
+        params = dict(meta or {})
+        if status is not None:
+            params["status"] = HeartbeatStatusEnum(status).value
+        return await self.api_client.get(
+            f"{self.base_heartbeat_event_api_url}/event/{self.heartbeat_slug}",
+            params=params or None,
+            deadline=deadline,
+        )
+
+    @heartbeat_slug_required
+    def monitor(self) -> "JobMonitor":
+        """Monitor a job with `running`, `success` and `failure` events sent in the background.
+
+        The returned monitor is a context manager and a decorator. Events are queued on
+        the entity `emitter`, so the job never waits for the network.
+
+        Returns:
+            JobMonitor reporting to this heartbeat
+        """
+        from .monitor import JobMonitor
+
+        return JobMonitor(self.emitter)
+
+    def monitored(self, func: Callable[..., Any] | None = None, *, slug: str | None = None) -> Any:
+        """Decorate a job coroutine function to report its `running`, `success` and `failure` events.
+
+        Usable bare, `@heartbeat.monitored`, or with arguments,
+        `@heartbeat.monitored(slug="other-job")`. Events are queued on the entity `emitter`
+        like with `monitor()`.
+
+        Args:
+            func: Coroutine function to monitor, given when used without arguments
+            slug: Slug of the heartbeat reported to, defaults to the slug of the entity
+
+        Returns:
+            Decorated coroutine function, or a decorator of a coroutine function when called with arguments only
+
+        Raises:
+            ValueError: If neither `slug` nor the entity slug is set
+            TypeError: If `func` is not a coroutine function
+        """
+        from .monitor import JobMonitor
+
+        if not (slug or self.heartbeat_slug):
+            raise ValueError("`heartbeat_slug` is required to perform object action")
+        monitor = JobMonitor(self.emitter, slug)
+        return monitor if func is None else monitor(func)
 
-    def create(self, heartbeat: HeartbeatCreateSchema) -> HeartbeatSchema:
+    async def create(
+        self, heartbeat: "HeartbeatCreateSchema", validation: ValidationMode | str | None = None
+    ) -> "HeartbeatSchema":
         """Create a new heartbeat.
 
         Args:
             heartbeat: The heartbeat configuration.
+            validation: Optional validation mode of the response, the client default if not provided
 
         Returns:
-            HeartbeatSchema containing the created heartbeat information
+            HeartbeatSchema containing the created heartbeat information, a dictionary in raw mode
         """
-        response = self.api_client.post(
+        response = await self.api_client.post(
             self.base_heartbeats_api_url,
             json=heartbeat.model_dump(exclude_unset=True),
         )
-        return HeartbeatSchema.model_validate(response)
+        from .schemas import HeartbeatSchema
+
+        return self._validate(HeartbeatSchema, response, validation)
+
+    async def _run_many(
+        self, action: str, slugs: Iterable[str], concurrency: int, deadline: Deadline | None
+    ) -> BulkResult:
+        return await run_bulk_async(
+            lambda slug: getattr(type(self)(slug, api_client=self.api_client), action)(deadline=deadline),
+            slugs,
+            concurrency,
+        )
+
+    async def pause_many(
+        self, slugs: Iterable[str], concurrency: int = 32, deadline: Deadline | None = None
+    ) -> BulkResult:
+        """Pause several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to pause
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to its response or the raised exception
+        """
+        return await self._run_many("pause", slugs, concurrency, deadline)
+
+    async def unpause_many(
+        self, slugs: Iterable[str], concurrency: int = 32, deadline: Deadline | None = None
+    ) -> BulkResult:
+        """Resume several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to resume
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to its response or the raised exception
+        """
+        return await self._run_many("unpause", slugs, concurrency, deadline)
+
+    async def delete_many(
+        self, slugs: Iterable[str], concurrency: int = 32, deadline: Deadline | None = None
+    ) -> BulkResult:
+        """Delete several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to delete
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to None or the raised exception
+        """
+        return await self._run_many("delete", slugs, concurrency, deadline)
+
+    async def event_many(
+        self, slugs: Iterable[str], concurrency: int = 32, deadline: Deadline | None = None
+    ) -> BulkResult:
+        """Send events for several heartbeats concurrently over the entity client.
+
+        Args:
+            slugs: Slugs of the heartbeats to send events for
+            concurrency: Maximum number of requests running at the same time
+            deadline: Optional deadline of the whole operation, slugs not processed before
+                it fail with `DeadlineExceededError`
+
+        Returns:
+            BulkResult mapping every slug to its response or the raised exception
+        """
+        return await self._run_many("event", slugs, concurrency, deadline)
+
+    @property
+    def emitter(self) -> "AsyncHeartbeatEmitter":
+        """Get the background emitter of the entity, created on first use.
+
+        Close it with `await heartbeat.emitter.aclose()` before the event loop stops to
+        send pending events.
+
+        Returns:
+            AsyncHeartbeatEmitter sending events of this heartbeat
+        """
+        if self._emitter is None:
+            from .emitter import AsyncHeartbeatEmitter
+
+            self._emitter = AsyncHeartbeatEmitter(self)
+        return self._emitter
@@ -0,0 +1,480 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from upassist.schemas.validation import ValidationMode, validate
+
+from .heartbeat import AsyncHeartbeat, Heartbeat
+
+if TYPE_CHECKING:
+    from .schemas import HeartbeatListSchema
+
+INDEXED_FIELDS = ("group_id", "status", "is_down", "paused")
+
+
+def _key(name: str, value: Any) -> Any:
+    """Get the index key of a field value, of a record or of a lookup.
+
+    Values are indexed as the API sends them, so a status added by the API later is
+    indexed like the known ones instead of failing the sweep.
+    """
+    if name in ("is_down", "paused"):
+        return bool(value)
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    # UUIDs are compared in their canonical lowercase form
+    return str(value).lower() if name == "group_id" else str(value)
+
+
+class BaseHeartbeatIndex:
+    """Common bookkeeping of the synchronous and asynchronous heartbeat indexes.
+
+    Heartbeats are kept as decoded JSON objects by id, with secondary indexes from slug
+    to id and from every value of `INDEXED_FIELDS` to the set of matching ids. A sweep
+    compares every received heartbeat with the stored one and applies only the added,
+    changed and removed ones. Records are validated into `HeartbeatListSchema` on first
+    access and the instance is kept until the heartbeat changes.
+    """
+
+    def __init__(
+        self,
+        heartbeat: Any,
+        interval: float,
+        q: str | None,
+        per_page: int | None,
+        validation: ValidationMode | str | None,
+    ):
+        self.heartbeat = heartbeat
+        self.interval = interval
+        self.q = q
+        self.per_page = per_page
+        self.validation = heartbeat._validation_mode(validation)
+        if self.validation == ValidationMode.RAW:
+            # Raw records would hand out the mutable objects the index compares against.
+            self.validation = ValidationMode.FULL
+
+        self.sweeps_count = 0
+        self.added_count = 0
+        self.updated_count = 0
+        self.removed_count = 0
+        self.failed_count = 0
+        self.last_error: BaseException | None = None
+        self.synced_at: float | None = None
+
+        self._records: dict[str, dict[str, Any]] = {}
+        self._items: dict[str, HeartbeatListSchema] = {}
+        self._slugs: dict[str, str] = {}
+        self._keys: dict[str, tuple[Any, ...]] = {}
+        self._indexes: dict[str, dict[Any, set[str]]] = {name: {} for name in INDEXED_FIELDS}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get counters of the index.
+
+        Returns:
+            Dictionary with `size`, `sweeps`, `added`, `updated`, `removed` and `failed` counts
+        """
+        return {
+            "size": len(self._records),
+            "sweeps": self.sweeps_count,
+            "added": self.added_count,
+            "updated": self.updated_count,
+            "removed": self.removed_count,
+            "failed": self.failed_count,
+        }
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last complete sweep, None before the first one."""
+        return None if self.synced_at is None else time.monotonic() - self.synced_at
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._slugs
+
+    def __iter__(self) -> Iterator["HeartbeatListSchema"]:
+        with self._lock:
+            ids = list(self._records)
+        for heartbeat_id in ids:
+            item = self._item(heartbeat_id)
+            if item is not None:
+                yield item
+
+    def get(self, slug: str) -> "HeartbeatListSchema | None":
+        """Get a heartbeat by slug.
+
+        Args:
+            slug: Slug of the heartbeat
+
+        Returns:
+            HeartbeatListSchema of the heartbeat, None if it is not in the index
+        """
+        heartbeat_id = self._slugs.get(slug)
+        return None if heartbeat_id is None else self._item(heartbeat_id)
+
+    def is_down(self, slug: str) -> bool:
+        """Check whether a heartbeat is down.
+
+        Args:
+            slug: Slug of the heartbeat
+
+        Returns:
+            True if the heartbeat is down
+
+        Raises:
+            KeyError: If the heartbeat is not in the index
+        """
+        with self._lock:
+            return bool(self._records[self._slugs[slug]].get("is_down"))
+
+    def is_paused(self, slug: str) -> bool:
+        """Check whether a heartbeat is paused.
+
+        Args:
+            slug: Slug of the heartbeat
+
+        Returns:
+            True if the heartbeat is paused
+
+        Raises:
+            KeyError: If the heartbeat is not in the index
+        """
+        with self._lock:
+            return bool(self._records[self._slugs[slug]].get("paused"))
+
+    def slugs(self, **conditions: Any) -> set[str]:
+        """Get the slugs of the heartbeats matching all conditions.
+
+        Args:
+            **conditions: Expected values by field name, one of `INDEXED_FIELDS`,
+                e.g. `group_id="...", paused=True`
+
+        Returns:
+            Slugs of the matching heartbeats
+        """
+        with self._lock:
+            return {self._records[heartbeat_id]["slug"] for heartbeat_id in self._select(conditions)}
+
+    def count(self, **conditions: Any) -> int:
+        """Count the heartbeats matching all conditions.
+
+        Args:
+            **conditions: Expected values by field name, one of `INDEXED_FIELDS`
+
+        Returns:
+            Number of matching heartbeats
+        """
+        with self._lock:
+            return len(self._select(conditions))
+
+    def find(self, **conditions: Any) -> list["HeartbeatListSchema"]:
+        """Get the heartbeats matching all conditions.
+
+        Args:
+            **conditions: Expected values by field name, one of `INDEXED_FIELDS`,
+                e.g. `status="FAILURE"` or `group_id="...", is_down=True`
+
+        Returns:
+            HeartbeatListSchema items of the matching heartbeats
+        """
+        with self._lock:
+            ids = self._select(conditions)
+        return [item for item in map(self._item, ids) if item is not None]
+
+    def _select(self, conditions: dict[str, Any]) -> set[str]:
+        for name in conditions:
+            if name not in INDEXED_FIELDS:
+                raise KeyError(f"Field {name!r} is not indexed, expected one of {', '.join(INDEXED_FIELDS)}")
+        if not conditions:
+            return set(self._records)
+        matches = sorted(
+            (self._indexes[name].get(_key(name, value), set()) for name, value in conditions.items()), key=len
+        )
+        return matches[0].intersection(*matches[1:])
+
+    def _item(self, heartbeat_id: str) -> "HeartbeatListSchema | None":
+        item = self._items.get(heartbeat_id)
+        if item is None:
+            from .schemas import HeartbeatListSchema
+
+            with self._lock:
+                record = self._records.get(heartbeat_id)
+            if record is None:
+                return None
+            item = validate(HeartbeatListSchema, record, self.validation)
+            with self._lock:
+                # The record may have changed while it was validated.
+                if self._records.get(heartbeat_id) is record:
+                    self._items[heartbeat_id] = item
+        return item
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} heartbeats={len(self)}>"
+
+    def _compare(self, record: dict[str, Any], changed: list[dict[str, Any]], seen: set[str]) -> None:
+        """Record a received heartbeat as seen and keep it if it differs from the stored one."""
+        heartbeat_id = record["id"]
+        seen.add(heartbeat_id)
+        if self._records.get(heartbeat_id) != record:
+            changed.append(record)
+
+    def _apply(self, changed: list[dict[str, Any]], seen: set[str]) -> None:
+        # Every key is computed before the index is touched, so a bad record leaves it unchanged.
+        entries = [
+            (record["id"], record["slug"], tuple(_key(name, record.get(name)) for name in INDEXED_FIELDS), record)
+            for record in changed
+        ]
+        with self._lock:
+            for heartbeat_id, slug, keys, record in entries:
+                if heartbeat_id in self._records:
+                    self._unindex(heartbeat_id)
+                    self.updated_count += 1
+                else:
+                    self.added_count += 1
+                self._records[heartbeat_id] = record
+                self._items.pop(heartbeat_id, None)
+                self._slugs[slug] = heartbeat_id
+                self._keys[heartbeat_id] = keys
+                for name, key in zip(INDEXED_FIELDS, keys, strict=True):
+                    self._indexes[name].setdefault(key, set()).add(heartbeat_id)
+            for heartbeat_id in self._records.keys() - seen:
+                self._unindex(heartbeat_id)
+                del self._records[heartbeat_id]
+                self._items.pop(heartbeat_id, None)
+                self.removed_count += 1
+            self.sweeps_count += 1
+            self.synced_at = time.monotonic()
+            self.last_error = None
+
+    def _unindex(self, heartbeat_id: str) -> None:
+        slug = self._records[heartbeat_id]["slug"]
+        if self._slugs.get(slug) == heartbeat_id:
+            del self._slugs[slug]
+        for name, key in zip(INDEXED_FIELDS, self._keys.pop(heartbeat_id), strict=True):
+            index = self._indexes[name]
+            ids = index[key]
+            ids.discard(heartbeat_id)
+            if not ids:
+                del index[key]
+
+    def _failed(self, error: BaseException) -> None:
+        self.failed_count += 1
+        self.last_error = error
+
+
+class HeartbeatIndex(BaseHeartbeatIndex):
+    """In-memory mirror of the heartbeats of an account, refreshed by a background thread.
+
+    Lookups by slug and by `group_id`, `status`, `is_down` and `paused` are answered from
+    local dictionaries without any network call. The background thread walks all list
+    pages once per `interval` and applies only the heartbeats that changed. Heartbeats
+    missing from a complete sweep are removed; a failed sweep keeps the previous state
+    and is retried after `interval`.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+        from upassist.entities.heartbeat import HeartbeatIndex
+
+        with HeartbeatIndex(Heartbeat(), interval=60) as index:
+            if index.is_down("billing-worker"):
+                page_on_call()
+            paused = index.find(group_id="8c0f3f6e-9a43-4f6b-a8f8-bd7b4b1a6d2e", paused=True)
+        ```
+    """
+
+    def __init__(
+        self,
+        heartbeat: Heartbeat | None = None,
+        interval: float = 60.0,
+        q: str | None = None,
+        per_page: int | None = None,
+        validation: ValidationMode | str | None = None,
+    ):
+        """Initialize the index, which stays empty until `start()` or `refresh()`.
+
+        Args:
+            heartbeat: Heartbeat entity whose client fetches the list pages. A new
+                `Heartbeat()` is created if not provided
+            interval: Number of seconds between two sweeps of the background thread
+            q: Optional search query restricting the mirrored heartbeats
+            per_page: Number of items per list page
+            validation: Optional validation mode of the returned items, the client default
+                if not provided. Raw mode is served as full
+        """
+        heartbeat = heartbeat or Heartbeat()
+        super().__init__(heartbeat, interval, q, per_page, validation)
+        self._wakeup = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    def __enter__(self) -> "HeartbeatIndex":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def refresh(self) -> None:
+        """Sweep all list pages and apply the changed heartbeats.
+
+        Raises:
+            Exception: Errors of the list requests, the index is left unchanged
+        """
+        changed: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        with self._refresh_lock:
+            try:
+                for record in self.heartbeat.iter_all(q=self.q, per_page=self.per_page, validation=ValidationMode.RAW):
+                    self._compare(record, changed, seen)
+            except Exception as error:
+                self._failed(error)
+                raise
+            self._apply(changed, seen)
+
+    def start(self, wait: bool = True) -> None:
+        """Start the background refresh.
+
+        Args:
+            wait: Whether to run the first sweep before returning, so lookups are answered
+                right away. Its errors are raised
+        """
+        if wait:
+            self.refresh()
+        if self._worker is None:
+            self._closed = False
+            self._wakeup.clear()
+            self._worker = threading.Thread(
+                target=self._run, args=(not wait,), name="upassist-heartbeat-index", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self, refresh_now: bool) -> None:
+        while not self._closed:
+            if refresh_now:
+                try:
+                    self.refresh()
+                except Exception:
+                    # Counted in `failed_count`, the sweep is retried after `interval`.
+                    pass
+            refresh_now = True
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    def close(self) -> None:
+        """Stop the background refresh, the index keeps answering from its last state."""
+        self._closed = True
+        self._wakeup.set()
+        worker, self._worker = self._worker, None
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+
+class AsyncHeartbeatIndex(BaseHeartbeatIndex):
+    """Asynchronous counterpart of `HeartbeatIndex` refreshed by an asyncio task.
+
+    Lookups are plain methods answered from memory; only `refresh()`, `start()` and
+    `aclose()` are coroutines.
+
+    Example:
+        ```python
+        from upassist import AsyncHeartbeat
+        from upassist.entities.heartbeat import AsyncHeartbeatIndex
+
+        async with AsyncHeartbeatIndex(AsyncHeartbeat(), interval=60) as index:
+            if index.is_down("billing-worker"):
+                await page_on_call()
+        ```
+    """
+
+    def __init__(
+        self,
+        heartbeat: AsyncHeartbeat | None = None,
+        interval: float = 60.0,
+        q: str | None = None,
+        per_page: int | None = None,
+        validation: ValidationMode | str | None = None,
+    ):
+        """Initialize the index, which stays empty until `start()` or `refresh()`.
+
+        Args:
+            heartbeat: AsyncHeartbeat entity whose client fetches the list pages. A new
+                `AsyncHeartbeat()` is created if not provided
+            interval: Number of seconds between two sweeps of the background task
+            q: Optional search query restricting the mirrored heartbeats
+            per_page: Number of items per list page
+            validation: Optional validation mode of the returned items, the client default
+                if not provided. Raw mode is served as full
+        """
+        heartbeat = heartbeat or AsyncHeartbeat()
+        super().__init__(heartbeat, interval, q, per_page, validation)
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "AsyncHeartbeatIndex":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def refresh(self) -> None:
+        """Sweep all list pages and apply the changed heartbeats.
+
+        Raises:
+            Exception: Errors of the list requests, the index is left unchanged
+        """
+        changed: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        try:
+            async for record in self.heartbeat.iter_all(
+                q=self.q, per_page=self.per_page, validation=ValidationMode.RAW
+            ):
+                self._compare(record, changed, seen)
+        except Exception as error:
+            self._failed(error)
+            raise
+        self._apply(changed, seen)
+
+    async def start(self, wait: bool = True) -> None:
+        """Start the background refresh.
+
+        Args:
+            wait: Whether to run the first sweep before returning, so lookups are answered
+                right away. Its errors are raised
+        """
+        if wait:
+            await self.refresh()
+        if self._task is None:
+            self._closed = False
+            self._task = asyncio.get_running_loop().create_task(self._run(not wait), name="upassist-heartbeat-index")
+
+    async def _run(self, refresh_now: bool) -> None:
+        while not self._closed:
+            if refresh_now:
+                try:
+                    await self.refresh()
+                except Exception:
+                    # Counted in `failed_count`, the sweep is retried after `interval`.
+                    pass
+            refresh_now = True
+            await asyncio.sleep(self.interval)
+
+    async def aclose(self) -> None:
+        """Stop the background refresh, the index keeps answering from its last state."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
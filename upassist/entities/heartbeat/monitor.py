@@ -0,0 +1,113 @@
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from .emitter import AsyncHeartbeatEmitter, HeartbeatEmitter
+from .enums import HeartbeatStatusEnum
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class JobMonitor:
+    """Report the lifecycle of a job as heartbeat status events.
+
+    A `running` event is queued when the job starts and a `success` or `failure` event,
+    carrying the job duration and the exception type on failure, when it ends. Events are
+    queued on an emitter and sent by its background worker, so monitoring never adds
+    network latency to the job and a failing heartbeat endpoint never fails the job.
+
+    The monitor is a context manager, an async context manager and a decorator of both
+    plain and coroutine functions. With an `AsyncHeartbeatEmitter` it must be used from
+    the event loop thread.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+
+        heartbeat = Heartbeat("nightly-backup")
+
+        with heartbeat.monitor():
+            run_backup()
+
+        @heartbeat.monitor()
+        def run_report():
+            ...
+        ```
+    """
+
+    def __init__(self, emitter: HeartbeatEmitter | AsyncHeartbeatEmitter, slug: str | None = None):
+        """Initialize the monitor.
+
+        Args:
+            emitter: Emitter that sends the status events in the background
+            slug: Slug of the heartbeat, defaults to the slug of the emitter heartbeat
+        """
+        self.emitter = emitter
+        self.slug = slug
+        self._started_at: list[float] = []
+
+    def _report(self, status: HeartbeatStatusEnum, meta: dict[str, Any] | None = None) -> None:
+        try:
+            self.emitter.report(status, meta=meta, slug=self.slug)
+        except Exception:
+            # Monitoring never fails the job, e.g. an async emitter used outside its event loop.
+            self.emitter.failed_count += 1
+
+    def _start(self) -> None:
+        self._started_at.append(time.perf_counter())
+        self._report(HeartbeatStatusEnum.RUNNING)
+
+    def _finish(self, exc: BaseException | None) -> None:
+        meta: dict[str, Any] = {"duration": round(time.perf_counter() - self._started_at.pop(), 6)}
+        if exc is None:
+            self._report(HeartbeatStatusEnum.SUCCESS, meta)
+        else:
+            meta["exception"] = type(exc).__qualname__
+            self._report(HeartbeatStatusEnum.FAILURE, meta)
+
+    def __enter__(self) -> "JobMonitor":
+        self._start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, traceback: Any) -> None:
+        self._finish(exc)
+
+    async def __aenter__(self) -> "JobMonitor":
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: BaseException | None, traceback: Any) -> None:
+        self._finish(exc)
+
+    def __call__(self, func: F) -> F:
+        """Decorate a job function.
+
+        Args:
+            func: Plain or coroutine function to monitor
+
+        Returns:
+            Function reporting the lifecycle of every call
+
+        Raises:
+            TypeError: If a plain function is decorated with an `AsyncHeartbeatEmitter`,
+                whose events can only be queued from the event loop
+        """
+        if isinstance(self.emitter, AsyncHeartbeatEmitter) and not inspect.iscoroutinefunction(func):
+            raise TypeError(f"{func.__qualname__} must be a coroutine function to be monitored by an AsyncHeartbeat")
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_inner(*args: Any, **kwargs: Any) -> Any:
+                async with JobMonitor(self.emitter, self.slug):
+                    return await func(*args, **kwargs)
+
+            return async_inner  # type: ignore
+
+        @functools.wraps(func)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            with JobMonitor(self.emitter, self.slug):
+                return func(*args, **kwargs)
+
+        return inner  # type: ignore
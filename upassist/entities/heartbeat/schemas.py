@@ -1,5 +1,4 @@
 from datetime import date, datetime, time
-from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
@@ -7,13 +6,7 @@ from pydantic_extra_types.timezone_name import TimeZoneName
 
 from upassist.schemas.base import BasePaginatedSchema, BaseSchema, UUIDSchema
 
-
-class HeartbeatStatusEnum(str, Enum):
-    """Enumeration of possible heartbeat statuses."""
-
-    RUNNING = "RUNNING"
-    SUCCESS = "SUCCESS"
-    FAILURE = "FAILURE"
+from .enums import HeartbeatStatusEnum
 
 
 class HeartbeatCreateSchema(BaseModel):
@@ -40,6 +33,9 @@ class HeartbeatCreateSchema(BaseModel):
         alert_week_days: List of days (0-6) when alerts should be sent
     """
 
+    class Config:
+        defer_build = True
+
     name: str
     description: str | None = None
     group_id: UUID | None = None
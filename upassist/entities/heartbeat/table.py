@@ -0,0 +1,353 @@
+import itertools
+import math
+import sys
+import uuid
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from .enums import HeartbeatStatusEnum
+
+if TYPE_CHECKING:
+    from .schemas import HeartbeatListSchema
+
+TIMESTAMP_COLUMNS = ("created_at", "last_up_at", "last_down_at", "last_fetch_at", "next_fetch_at")
+FLAG_COLUMNS = ("is_down", "paused", "alerts_on", "call", "send_sms", "send_email", "send_push_notification")
+INTEGER_COLUMNS = ("fetch_interval", "confirmation_period", "incidents_count")
+CATEGORY_COLUMNS = ("status", "group_id", "opened_incident_id", "maintenance")
+STRING_COLUMNS = ("slug", "name")
+COLUMNS = ("id", *STRING_COLUMNS, *CATEGORY_COLUMNS[:3], *FLAG_COLUMNS, *TIMESTAMP_COLUMNS, *INTEGER_COLUMNS)
+
+# Rarely differing settings share one category per distinct combination
+_MAINTENANCE_FIELDS = (
+    "maintenance_window_from",
+    "maintenance_window_until",
+    "maintenance_window_timezone",
+    "alert_week_days",
+)
+_MISSING_INTEGER = -(2**63)
+
+
+def _field(row: Any, name: str, default: Any = None) -> Any:
+    if isinstance(row, Mapping):
+        return row.get(name, default)
+    return getattr(row, name, default)
+
+
+def _uuid(value: Any) -> uuid.UUID | None:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(value)
+
+
+def _status(value: Any) -> HeartbeatStatusEnum | None:
+    return None if value is None else HeartbeatStatusEnum(value)
+
+
+def _timestamp(value: Any) -> float:
+    if value is None:
+        return math.nan
+    if isinstance(value, str):
+        # `fromisoformat` only accepts the `Z` suffix from Python 3.11
+        value = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _datetime(value: float) -> datetime | None:
+    return None if math.isnan(value) else datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _integer(value: Any) -> int:
+    return _MISSING_INTEGER if value is None else int(value)
+
+
+def _maintenance(row: Any) -> tuple:
+    values = [_field(row, name) for name in _MAINTENANCE_FIELDS]
+    if values[3] is not None:
+        values[3] = tuple(values[3])
+    return tuple(values)
+
+
+class _Categories:
+    """Codes of the rows of a low-cardinality column and their distinct values."""
+
+    __slots__ = ("codes", "lookup", "values")
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: list[Any] = []
+        self.lookup: dict[Any, int] = {}
+
+    def append(self, value: Any) -> None:
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+
+class _Columns:
+    """Column storage shared by a table and the views filtered from it."""
+
+    __slots__ = ("categories", "flags", "ids", "integers", "size", "strings", "timestamps")
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.ids = bytearray()
+        self.strings: dict[str, list[str]] = {name: [] for name in STRING_COLUMNS}
+        self.categories = {name: _Categories() for name in CATEGORY_COLUMNS}
+        self.flags = {name: bytearray() for name in FLAG_COLUMNS}
+        self.timestamps = {name: array("d") for name in TIMESTAMP_COLUMNS}
+        self.integers = {name: array("q") for name in INTEGER_COLUMNS}
+
+    def append(self, row: Any) -> None:
+        # Every value is converted before any column is touched, so a bad row leaves no partial row.
+        values = (
+            _uuid(_field(row, "id")).bytes,
+            [sys.intern(str(_field(row, name))) for name in STRING_COLUMNS],
+            (
+                _status(_field(row, "status")),
+                _uuid(_field(row, "group_id")),
+                _uuid(_field(row, "opened_incident_id")),
+                _maintenance(row),
+            ),
+            [bool(_field(row, name)) for name in FLAG_COLUMNS],
+            [_timestamp(_field(row, name)) for name in TIMESTAMP_COLUMNS],
+            [_integer(_field(row, name, 0 if name == "incidents_count" else None)) for name in INTEGER_COLUMNS],
+        )
+        row_id, strings, categories, flags, timestamps, integers = values
+        self.ids += row_id
+        for name, value in zip(STRING_COLUMNS, strings, strict=True):
+            self.strings[name].append(value)
+        for name, value in zip(CATEGORY_COLUMNS, categories, strict=True):
+            self.categories[name].append(value)
+        for name, value in zip(FLAG_COLUMNS, flags, strict=True):
+            self.flags[name].append(value)
+        for name, value in zip(TIMESTAMP_COLUMNS, timestamps, strict=True):
+            self.timestamps[name].append(value)
+        for name, value in zip(INTEGER_COLUMNS, integers, strict=True):
+            self.integers[name].append(value)
+        self.size += 1
+
+    def value(self, name: str, index: int) -> Any:
+        if name == "id":
+            return uuid.UUID(bytes=bytes(self.ids[index * 16 : index * 16 + 16]))
+        if name in self.strings:
+            return self.strings[name][index]
+        if name in self.categories:
+            categories = self.categories[name]
+            return categories.values[categories.codes[index]]
+        if name in self.flags:
+            return bool(self.flags[name][index])
+        if name in self.timestamps:
+            return _datetime(self.timestamps[name][index])
+        value = self.integers[name][index]
+        return None if value == _MISSING_INTEGER else value
+
+    def encode(self, name: str, value: Any) -> Any:
+        """Convert a filter value of a column to the type of its decoded values."""
+        if name in ("id", "group_id", "opened_incident_id"):
+            return _uuid(value)
+        if name == "status":
+            return _status(value)
+        if name in self.timestamps and isinstance(value, str):
+            return _datetime(_timestamp(value))
+        return value
+
+
+class HeartbeatTable:
+    """Compact column-wise collection of heartbeats of list pages.
+
+    Rows are stored by column instead of as one `HeartbeatListSchema` instance each: ids
+    as 16 bytes, timestamps as floats, flags as bytes, integers in arrays, interned slugs
+    and names, and low-cardinality columns such as `status` and `group_id` as codes of
+    their distinct values. A fleet of tens of thousands of heartbeats takes a few hundred
+    bytes per row instead of several kilobytes.
+
+    Filters run column by column and return views sharing the storage of the table.
+    Rows are materialized as validated `HeartbeatListSchema` instances only when accessed.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+
+        table = Heartbeat().list_table(per_page=1000)
+        down = table.filter(is_down=True, group_id="8c0f3f6e-9a43-4f6b-a8f8-bd7b4b1a6d2e")
+        print(len(down), down.column("slug"))
+        first = down[0]  # HeartbeatListSchema
+        ```
+    """
+
+    __slots__ = ("_columns", "_rows")
+
+    def __init__(self, rows: Iterable[Any] = ()):
+        """Initialize the table.
+
+        Args:
+            rows: Heartbeats to store, as decoded JSON objects or schema instances
+        """
+        self._columns = _Columns()
+        self._rows: array | None = None
+        self.extend(rows)
+
+    @classmethod
+    def _view(cls, columns: _Columns, rows: array) -> "HeartbeatTable":
+        table = cls.__new__(cls)
+        table._columns, table._rows = columns, rows
+        return table
+
+    def append(self, row: Any) -> None:
+        """Store a heartbeat.
+
+        Args:
+            row: Heartbeat as a decoded JSON object or a schema instance
+
+        Raises:
+            TypeError: If the table is a filtered view
+        """
+        if self._rows is not None:
+            raise TypeError("Rows can not be added to a filtered view of a table")
+        self._columns.append(row)
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        """Store heartbeats.
+
+        Args:
+            rows: Heartbeats as decoded JSON objects or schema instances
+
+        Raises:
+            TypeError: If the table is a filtered view
+        """
+        for row in rows:
+            self.append(row)
+
+    def __len__(self) -> int:
+        return self._columns.size if self._rows is None else len(self._rows)
+
+    def _indices(self) -> Iterable[int]:
+        return range(self._columns.size) if self._rows is None else self._rows
+
+    def _index(self, position: int) -> int:
+        size = len(self)
+        if position < 0:
+            position += size
+        if not 0 <= position < size:
+            raise IndexError("HeartbeatTable index out of range")
+        return position if self._rows is None else self._rows[position]
+
+    def row(self, position: int) -> dict[str, Any]:
+        """Get a heartbeat as a dictionary of typed values, without building a schema.
+
+        Args:
+            position: Position of the row in the table
+
+        Returns:
+            Fields of the heartbeat
+        """
+        index, columns = self._index(position), self._columns
+        values = {name: columns.value(name, index) for name in COLUMNS}
+        maintenance = columns.value("maintenance", index)
+        values.update(zip(_MAINTENANCE_FIELDS, maintenance, strict=True))
+        if maintenance[3] is not None:
+            values["alert_week_days"] = list(maintenance[3])
+        return values
+
+    def __getitem__(self, position: int) -> "HeartbeatListSchema":
+        from .schemas import HeartbeatListSchema
+
+        return HeartbeatListSchema.model_validate(self.row(position))
+
+    def __iter__(self) -> Iterator["HeartbeatListSchema"]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def column(self, name: str) -> list[Any]:
+        """Get the values of a column.
+
+        Args:
+            name: Field name of the column, one of `COLUMNS`
+
+        Returns:
+            Values of the rows in table order
+        """
+        self._check_column(name)
+        columns = self._columns
+        if name in columns.strings and self._rows is None:
+            return list(columns.strings[name])
+        if name in columns.categories:
+            categories = columns.categories[name]
+            return [categories.values[categories.codes[index]] for index in self._indices()]
+        return [columns.value(name, index) for index in self._indices()]
+
+    def count_by(self, name: str) -> Counter:
+        """Count the rows by value of a column, e.g. `status` or `group_id`.
+
+        Args:
+            name: Field name of the column, one of `COLUMNS`
+
+        Returns:
+            Number of rows per value
+        """
+        self._check_column(name)
+        categories = self._columns.categories.get(name)
+        if categories is None:
+            return Counter(self.column(name))
+        codes = Counter(categories.codes if self._rows is None else (categories.codes[i] for i in self._rows))
+        return Counter({categories.values[code]: count for code, count in codes.items()})
+
+    def filter(self, **conditions: Any) -> "HeartbeatTable":
+        """Select the rows matching all conditions.
+
+        Each condition compares a column with a value, e.g. `is_down=True` or
+        `group_id="..."`, with a set, list or tuple of accepted values, e.g.
+        `status={"FAILURE", "RUNNING"}`, or applies a predicate to the column values, e.g.
+        `fetch_interval=lambda interval: interval > 300`. Conditions on flag and
+        low-cardinality columns are resolved on their codes without decoding any row.
+
+        Args:
+            **conditions: Conditions by column name, one of `COLUMNS`
+
+        Returns:
+            View of the matching rows sharing the storage of the table
+        """
+        rows = self._indices()
+        for name, condition in conditions.items():
+            self._check_column(name)
+            rows = self._select(name, condition, rows)
+        return self._view(self._columns, array("I", rows))
+
+    def _select(self, name: str, condition: Any, rows: Iterable[int]) -> Iterable[int]:
+        columns = self._columns
+        if callable(condition):
+            matches: Callable[[Any], Any] = condition
+        elif isinstance(condition, (set, frozenset, list, tuple)):
+            accepted = {columns.encode(name, value) for value in condition}
+            matches = accepted.__contains__
+        else:
+            expected = columns.encode(name, condition)
+            matches = lambda value: value == expected  # noqa: E731
+
+        if name in columns.flags:
+            flags = columns.flags[name]
+            accepted_flags = bytes(bool(matches(bool(value))) for value in range(256))
+            mask = flags.translate(accepted_flags)
+            if isinstance(rows, range):
+                return list(itertools.compress(rows, mask))
+            return [index for index in rows if mask[index]]
+        if name in columns.categories:
+            categories = columns.categories[name]
+            codes = {code for code, value in enumerate(categories.values) if matches(value)}
+            return [index for index in rows if categories.codes[index] in codes]
+        return [index for index in rows if matches(columns.value(name, index))]
+
+    @staticmethod
+    def _check_column(name: str) -> None:
+        if name not in COLUMNS:
+            raise KeyError(f"Unknown column {name!r}, expected one of {', '.join(COLUMNS)}")
+
+    def __repr__(self) -> str:
+        return f"<HeartbeatTable rows={len(self)}>"
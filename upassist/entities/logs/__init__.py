@@ -1,4 +1,42 @@
-from .logs import Logs
-from .schemas import LogItemSchema
+from typing import TYPE_CHECKING
 
-__all__ = ("LogItemSchema", "Logs")
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .handler import LogsHandler, OverflowPolicy
+    from .logs import AsyncLogs, Logs
+    from .records import LogEntry
+    from .schemas import LogItemSchema
+    from .shipper import AsyncLogShipper
+    from .spool import EvictionPolicy, LogSpool, LogSpoolReplayer, SpoolBatch
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncLogShipper": ".shipper",
+        "AsyncLogs": ".logs",
+        "EvictionPolicy": ".spool",
+        "LogEntry": ".records",
+        "LogItemSchema": ".schemas",
+        "LogSpool": ".spool",
+        "LogSpoolReplayer": ".spool",
+        "Logs": ".logs",
+        "LogsHandler": ".handler",
+        "OverflowPolicy": ".handler",
+        "SpoolBatch": ".spool",
+    },
+)
+
+__all__ = (
+    "AsyncLogShipper",
+    "AsyncLogs",
+    "EvictionPolicy",
+    "LogEntry",
+    "LogItemSchema",
+    "LogSpool",
+    "LogSpoolReplayer",
+    "Logs",
+    "LogsHandler",
+    "OverflowPolicy",
+    "SpoolBatch",
+)
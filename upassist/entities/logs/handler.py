@@ -0,0 +1,286 @@
+import logging
+import os
+import socket
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from upassist.utils.serialization import dumps
+
+from .logs import Logs, encode_logs
+from .records import LogEntry
+from .spool import LogSpool
+
+# Attributes every `LogRecord` has; anything else was passed through `extra=`.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _encodable(value: Any) -> Any:
+    """Get a value passed through `extra=` as is if it can be encoded, else its string form."""
+    try:
+        dumps(value)
+    except Exception:
+        return str(value)
+    return value
+
+
+class OverflowPolicy(str, Enum):
+    """Behaviour of `LogsHandler` when its buffer is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class LogsHandler(logging.Handler):
+    """Logging handler that ships records to Upassist in background batches.
+
+    `emit()` only formats the record and appends it to a bounded in-memory buffer. A
+    background thread converts buffered records to `LogEntry` items and submits
+    them with `Logs.collect` once `batch_size` records are buffered or the oldest
+    buffered record waited for `linger` seconds.
+
+    Example:
+        ```python
+        import logging
+
+        from upassist.entities.logs import LogsHandler, OverflowPolicy
+
+        handler = LogsHandler(batch_size=200, linger=2.0, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        logging.getLogger().addHandler(handler)
+        ```
+    """
+
+    def __init__(
+        self,
+        logs: Logs | None = None,
+        level: int = logging.NOTSET,
+        batch_size: int = 100,
+        linger: float = 1.0,
+        max_queue_size: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout: float | None = None,
+        shutdown_timeout: float = 5.0,
+        host: str | None = None,
+        spool: LogSpool | None = None,
+    ):
+        """Initialize the handler.
+
+        Args:
+            logs: Logs entity used to submit batches. A new `Logs()` is created if not provided
+            level: Minimum level of records handled
+            batch_size: Maximum number of records submitted in one batch
+            linger: Maximum number of seconds a record waits in the buffer before a flush
+            max_queue_size: Maximum number of buffered records
+            overflow_policy: What to do with a new record when the buffer is full
+            block_timeout: Maximum seconds `emit()` blocks with `OverflowPolicy.BLOCK`,
+                after which the record is dropped. None waits indefinitely
+            shutdown_timeout: Maximum seconds `close()` waits for buffered records to be sent
+            host: Host reported with every record, defaults to the machine hostname
+            spool: Optional disk spool that keeps batches which could not be submitted,
+                to be delivered later by a `LogSpoolReplayer`
+        """
+        super().__init__(level=level)
+        self.logs = logs or Logs()
+        self.batch_size = batch_size
+        self.linger = linger
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.block_timeout = block_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.host = host or socket.gethostname()
+        self.spool = spool
+
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+        self.spooled_count = 0
+
+        self._buffer: deque[tuple[Any, ...]] = deque()
+        self._in_flight = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._worker_ident: int | None = None
+        self._pid = os.getpid()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get delivery counters of the handler.
+
+        Returns:
+            Dictionary with `sent`, `dropped`, `failed`, `spooled` and `queued` record counts
+        """
+        return {
+            "sent": self.sent_count,
+            "dropped": self.dropped_count,
+            "failed": self.failed_count,
+            "spooled": self.spooled_count,
+            "queued": len(self._buffer),
+        }
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Records produced while submitting a batch (e.g. by urllib3) would feed back
+        # into the buffer forever, so they are ignored.
+        if self._closed or threading.get_ident() == self._worker_ident:
+            return
+        try:
+            item = self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            self._ensure_worker()
+            if len(self._buffer) >= self.max_queue_size and not self._make_room():
+                self.dropped_count += 1
+                return
+            self._buffer.append(item)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+
+    def _prepare(self, record: logging.LogRecord) -> tuple[Any, ...]:
+        message = self.format(record)
+        extra = {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+        return (
+            record.created,
+            message,
+            f"{record.pathname}:{record.lineno}",
+            record.levelname,
+            record.name,
+            extra,
+            time.monotonic(),
+        )
+
+    def _make_room(self) -> bool:
+        if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+            self._buffer.popleft()
+            self.dropped_count += 1
+            return True
+        if self.overflow_policy is OverflowPolicy.BLOCK:
+            return (
+                self._condition.wait_for(
+                    lambda: len(self._buffer) < self.max_queue_size or self._closed,
+                    timeout=self.block_timeout,
+                )
+                and not self._closed
+            )
+        return False
+
+    def _ensure_worker(self) -> None:
+        if self._pid != os.getpid():
+            # The worker thread does not survive `os.fork()`; records inherited from the
+            # parent belong to the parent process.
+            self._buffer.clear()
+            self._in_flight = 0
+            self._worker = None
+            self._pid = os.getpid()
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="upassist-logs-handler", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        self._worker_ident = threading.get_ident()
+        while True:
+            with self._condition:
+                while not self._closed and not self._batch_ready():
+                    timeout = None
+                    if self._buffer:
+                        timeout = max(self._buffer[0][-1] + self.linger - time.monotonic(), 0)
+                    self._condition.wait(timeout)
+                if not self._buffer:
+                    return
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+
+            try:
+                self._send(batch)
+            except Exception:
+                # The worker must outlive any failure, or later records would never be sent.
+                self.failed_count += len(batch)
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    def _batch_ready(self) -> bool:
+        if len(self._buffer) >= self.batch_size:
+            return True
+        if not self._buffer:
+            return False
+        return self._flush_waiters > 0 or time.monotonic() - self._buffer[0][-1] >= self.linger
+
+    def _send(self, batch: list[tuple[Any, ...]]) -> None:
+        payload = self._encode(batch)
+        try:
+            self.logs.collect_encoded(payload)
+        except Exception:
+            if self.spool is not None and self.spool.append(payload):
+                self.spooled_count += len(batch)
+            else:
+                self.failed_count += len(batch)
+        else:
+            self.sent_count += len(batch)
+
+    def _encode(self, batch: list[tuple[Any, ...]]) -> bytes:
+        try:
+            return encode_logs([self._to_log_item(item) for item in batch])
+        except Exception:
+            # Values the encoder does not support are only searched for when a batch fails.
+            return encode_logs([self._to_log_item(item, encodable=True) for item in batch])
+
+    def _to_log_item(self, item: tuple[Any, ...], encodable: bool = False) -> LogEntry:
+        created, message, file, level, logger_name, extra, _ = item
+        if encodable:
+            extra = {key: _encodable(value) for key, value in extra.items()}
+        return LogEntry(
+            dt=datetime.fromtimestamp(created, tz=timezone.utc),
+            host=self.host,
+            message=message,
+            file=file,
+            data={"level": level, "logger": logger_name, **extra},
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all buffered records are submitted.
+
+        `logging.shutdown()` calls this without arguments at interpreter exit, so the wait
+        is bounded by `shutdown_timeout` unless a timeout is given.
+
+        Args:
+            timeout: Maximum number of seconds to wait, defaults to `shutdown_timeout`
+
+        Returns:
+            True if the buffer was drained before the deadline
+        """
+        with self._condition:
+            if self._worker is None or threading.get_ident() == self._worker_ident:
+                return not self._buffer
+            # While somebody waits for a flush, partial batches are sent without waiting for `linger`.
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: not self._buffer and not self._in_flight,
+                    timeout=self.shutdown_timeout if timeout is None else timeout,
+                )
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self) -> None:
+        """Submit buffered records within `shutdown_timeout` and stop the worker.
+
+        `logging.shutdown()` calls this at interpreter exit for every live handler.
+        """
+        self.flush(timeout=self.shutdown_timeout)
+        with self._condition:
+            self._closed = True
+            self.dropped_count += len(self._buffer)
+            self._buffer.clear()
+            self._condition.notify_all()
+        super().close()
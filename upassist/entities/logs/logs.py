@@ -1,8 +1,46 @@
+from collections.abc import Sequence
+from typing import Any, TypeAlias
+
+from upassist.client import AbstractAPIClient, AsyncAPIClient
+from upassist.client.transports import AsyncTransport, SyncTransport
 from upassist.entities.base import BaseEntity
 from upassist.schemas.base import DetailResponse
+from upassist.utils.serialization import dumps
 
+from .records import LogEntry
 from .schemas import LogItemSchema
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+LogItem: TypeAlias = LogItemSchema | LogEntry | dict[str, Any]
+
+
+def encode_logs(logs: Sequence[LogItem]) -> bytes:
+    """Encode a batch of log items into a JSON request body in a single pass.
+
+    Plain dictionaries are encoded as is, while `LogEntry` and `LogItemSchema` items are
+    converted to dictionaries without validation or JSON coercion, leaving datetimes to
+    the encoder selected in `upassist.utils.serialization`.
+
+    Args:
+        logs: Log items to encode
+
+    Returns:
+        UTF-8 encoded JSON array of log items
+    """
+    items = []
+    for log in logs:
+        if isinstance(log, dict):
+            items.append(log)
+        elif isinstance(log, LogEntry):
+            items.append(log.to_dict())
+        elif type(log) is LogItemSchema:
+            # Field values of a flat model already are its `__dict__`, no dump is needed.
+            items.append(log.__dict__)
+        else:
+            items.append(log.model_dump())
+    return dumps(items)
+
 
 class Logs(BaseEntity):
     """Entity for managing log collection and submission.
@@ -12,17 +50,90 @@ class Logs(BaseEntity):
 
     base_logs_api_url: str = "https://logs.upassist.cloud/collect"
 
-    def collect(self, logs: list[LogItemSchema]) -> DetailResponse:
+    def collect(self, logs: Sequence[LogItem], retry: bool = False) -> DetailResponse:
         """Submit a collection of logs to the logging service.
 
         Args:
-            logs: List of log items to submit
+            logs: Log items to submit, as `LogItemSchema`, `LogEntry` or plain dictionaries
+            retry: Whether transient failures are retried with the client retry policy.
+                Disabled by default because a retried batch may be collected twice
+
+        Returns:
+            DetailResponse containing the submission result
+        """
+        return self.collect_encoded(encode_logs(logs), retry=retry)
+
+    def collect_encoded(self, payload: bytes, retry: bool = False) -> DetailResponse:
+        """Submit a batch of logs that was already encoded with `encode_logs`.
+
+        Args:
+            payload: JSON encoded array of log items
+            retry: Whether transient failures are retried with the client retry policy
+
+        Returns:
+            DetailResponse containing the submission result
+        """
+        response = self.api_client.post(self.base_logs_api_url, data=payload, headers=dict(JSON_HEADERS), retry=retry)
+        return self._validate(DetailResponse, response)
+
+
+class AsyncLogs(BaseEntity):
+    """Asynchronous counterpart of `Logs`.
+
+    This class awaits the transport before validating the submission result.
+    """
+
+    base_logs_api_url: str = Logs.base_logs_api_url
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_version: str | None = None,
+        api_client_cls: type[AbstractAPIClient] = AsyncAPIClient,
+        api_client: AbstractAPIClient | None = None,
+        transport: SyncTransport | AsyncTransport | None = None,
+    ):
+        """Initialize a new AsyncLogs instance.
+
+        Args:
+            api_key: Optional API key for authentication
+            api_version: Optional API version to use
+            api_client_cls: Class to use for API client implementation
+            api_client: Optional client instance shared between entities
+            transport: Optional HTTP backend of the client created with `api_client_cls`
+        """
+        super().__init__(
+            api_key=api_key,
+            api_version=api_version,
+            api_client_cls=api_client_cls,
+            api_client=api_client,
+            transport=transport,
+        )
+
+    async def collect(self, logs: Sequence[LogItem], retry: bool = False) -> DetailResponse:
+        """Submit a collection of logs to the logging service.
+
+        Args:
+            logs: Log items to submit, as `LogItemSchema`, `LogEntry` or plain dictionaries
+            retry: Whether transient failures are retried with the client retry policy.
+                Disabled by default because a retried batch may be collected twice
+
+        Returns:
+            DetailResponse containing the submission result
+        """
+        return await self.collect_encoded(encode_logs(logs), retry=retry)
+
+    async def collect_encoded(self, payload: bytes, retry: bool = False) -> DetailResponse:
+        """Submit a batch of logs that was already encoded with `encode_logs`.
+
+        Args:
+            payload: JSON encoded array of log items
+            retry: Whether transient failures are retried with the client retry policy
 
         Returns:
             DetailResponse containing the submission result
         """
-        response = self.api_client.post(
-            self.base_logs_api_url,
-            json=[log.model_dump(mode="json") for log in logs],
+        response = await self.api_client.post(
+            self.base_logs_api_url, data=payload, headers=dict(JSON_HEADERS), retry=retry
         )
-        return DetailResponse.model_validate(response)
+        return self._validate(DetailResponse, response)
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Any
+
+
+class LogEntry:
+    """Lightweight log item for high-volume log shipping.
+
+    `LogEntry` has the same fields as `LogItemSchema` but uses `__slots__` and skips
+    validation, so creating and encoding it is much cheaper than a pydantic model.
+
+    Attributes:
+        dt: Timestamp of the log entry
+        host: Hostname or source of the log
+        message: Log message content
+        file: Source file or location
+        data: Additional structured data associated with the log
+    """
+
+    __slots__ = ("data", "dt", "file", "host", "message")
+
+    def __init__(
+        self,
+        dt: datetime | None = None,
+        host: str | None = None,
+        message: str | None = None,
+        file: str | None = None,
+        data: dict[str, Any] | None = None,
+    ):
+        self.dt = dt
+        self.host = host
+        self.message = message
+        self.file = file
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"LogEntry(dt={self.dt!r}, host={self.host!r}, message={self.message!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the log item as a dictionary ready for JSON encoding.
+
+        Returns:
+            Dictionary with the log item fields
+        """
+        return {
+            "dt": self.dt,
+            "host": self.host,
+            "message": self.message,
+            "file": self.file,
+            "data": self.data,
+        }
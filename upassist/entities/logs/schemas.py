@@ -15,6 +15,9 @@ class LogItemSchema(BaseModel):
         data: Additional structured data associated with the log
     """
 
+    class Config:
+        defer_build = True
+
     dt: datetime | None = None
     host: str | None = None
     message: str | None = None
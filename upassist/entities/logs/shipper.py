@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any
+
+from .logs import AsyncLogs, LogItem, encode_logs
+
+
+class AsyncLogShipper:
+    """Asyncio log shipper that submits `AsyncLogs.collect`-shaped batches in the background.
+
+    Items are buffered in a bounded `asyncio.Queue`. `concurrency` worker tasks take up
+    to `batch_size` items each, encode them to JSON in the default executor so the event
+    loop is not blocked, and submit them over the shared session of the `AsyncLogs`
+    client. When the queue is full, `put()` waits until workers catch up.
+
+    Example:
+        ```python
+        from upassist.entities.logs import AsyncLogShipper, LogItemSchema
+
+        async with AsyncLogShipper(batch_size=500, concurrency=4) as shipper:
+            await shipper.put(LogItemSchema(message="Request handled"))
+        ```
+    """
+
+    def __init__(
+        self,
+        logs: AsyncLogs | None = None,
+        batch_size: int = 500,
+        linger: float = 1.0,
+        max_queue_size: int = 50_000,
+        concurrency: int = 4,
+    ):
+        """Initialize the shipper.
+
+        Args:
+            logs: AsyncLogs entity used to submit batches. A new `AsyncLogs()` is created if not provided
+            batch_size: Maximum number of items submitted in one batch
+            linger: Maximum number of seconds a worker waits to fill a batch
+            max_queue_size: Maximum number of buffered items before `put()` waits
+            concurrency: Number of batches submitted at the same time
+        """
+        self.logs = logs or AsyncLogs()
+        self.batch_size = batch_size
+        self.linger = linger
+        self.max_queue_size = max_queue_size
+        self.concurrency = concurrency
+
+        self.sent_count = 0
+        self.failed_count = 0
+
+        # Since Python 3.10 queues and events bind to the running loop on first use.
+        self._queue: asyncio.Queue[LogItem] = asyncio.Queue(maxsize=max_queue_size)
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task[None]] = []
+        self._draining = False
+
+    async def __aenter__(self) -> "AsyncLogShipper":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.drain()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get delivery counters of the shipper.
+
+        Returns:
+            Dictionary with `sent`, `failed` and `queued` item counts
+        """
+        return {
+            "sent": self.sent_count,
+            "failed": self.failed_count,
+            "queued": self._queue.qsize(),
+        }
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if self._workers:
+            return
+        self._draining = False
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"upassist-log-shipper-{index}") for index in range(self.concurrency)
+        ]
+
+    async def put(self, item: LogItem) -> None:
+        """Buffer a log item, waiting for free space if the queue is full.
+
+        Args:
+            item: Log item to submit
+        """
+        if not self._workers:
+            self.start()
+        if self._draining:
+            raise RuntimeError("Log shipper is draining")
+        await self._queue.put(item)
+        self._notify()
+
+    def put_nowait(self, item: LogItem) -> None:
+        """Buffer a log item without waiting.
+
+        Args:
+            item: Log item to submit
+
+        Raises:
+            asyncio.QueueFull: If the queue is full
+        """
+        if not self._workers:
+            self.start()
+        if self._draining:
+            raise RuntimeError("Log shipper is draining")
+        self._queue.put_nowait(item)
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+
+    async def _next_batch(self) -> list[LogItem]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.linger
+        while True:
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            timeout = deadline - loop.time()
+            if len(batch) >= self.batch_size or self._draining or timeout <= 0:
+                return batch
+            # Waiting on an event instead of `queue.get()` keeps items safe from timeout cancellation.
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            try:
+                payload = await loop.run_in_executor(None, encode_logs, batch)
+                await self.logs.collect_encoded(payload)
+            except asyncio.CancelledError:
+                self.failed_count += len(batch)
+                raise
+            except Exception:
+                self.failed_count += len(batch)
+            else:
+                self.sent_count += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Submit all buffered items and stop the workers.
+
+        Args:
+            timeout: Maximum number of seconds to wait, None waits indefinitely
+
+        Returns:
+            True if every buffered item was submitted before the deadline
+        """
+        if not self._workers:
+            return True
+        self._draining = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            drained = True
+        except asyncio.TimeoutError:
+            drained = False
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        return drained
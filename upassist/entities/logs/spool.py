@@ -0,0 +1,369 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .logs import Logs
+
+# Every batch is framed as `<payload length><crc32 of payload><payload>`.
+_FRAME_HEADER = struct.Struct("<II")
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor.json"
+
+
+class EvictionPolicy(str, Enum):
+    """Behaviour of `LogSpool` when appending a batch would exceed its size cap."""
+
+    DROP_OLDEST = "drop_oldest"
+    REJECT_NEW = "reject_new"
+
+
+@dataclass(frozen=True)
+class SpoolBatch:
+    """Encoded log batch read from the spool.
+
+    Attributes:
+        segment: Sequence number of the segment containing the batch
+        end_offset: Offset right after the batch frame in the segment
+        payload: JSON encoded array of log items
+    """
+
+    segment: int
+    end_offset: int
+    payload: bytes
+
+
+class LogSpool:
+    """Durable on-disk queue of encoded log batches.
+
+    Batches are appended to segment files in `directory` as CRC-framed records and read
+    back through memory maps. A cursor file remembers the position of the last committed
+    batch, and fully committed segments are removed. The total size of the spool is
+    capped by `max_bytes` and the `eviction_policy` decides what happens on overflow.
+
+    Example:
+        ```python
+        from upassist.entities.logs import LogSpool, LogSpoolReplayer, LogsHandler
+
+        spool = LogSpool("/var/spool/upassist")
+        handler = LogsHandler(spool=spool)
+        replayer = LogSpoolReplayer(spool, parallelism=4)
+        replayer.start()
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int = 256 * 1024 * 1024,
+        segment_bytes: int = 16 * 1024 * 1024,
+        eviction_policy: EvictionPolicy = EvictionPolicy.DROP_OLDEST,
+        fsync: bool = False,
+    ):
+        """Initialize the spool, creating its directory if needed.
+
+        Args:
+            directory: Directory holding the segment files
+            max_bytes: Maximum total size of all segment files
+            segment_bytes: Size after which a new segment file is started
+            eviction_policy: What to do when an append would exceed `max_bytes`
+            fsync: Whether to fsync segment files after every append
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.eviction_policy = EvictionPolicy(eviction_policy)
+        self.fsync = fsync
+
+        self.appended_count = 0
+        self.evicted_count = 0
+        self.rejected_count = 0
+        self.corrupted_count = 0
+
+        self._lock = threading.RLock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments: dict[int, int] = {
+            int(path.stem): path.stat().st_size for path in sorted(self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+        }
+        self._cursor = self._load_cursor()
+        self._active: int | None = None
+        self._active_file: Any = None
+        # Segments whose file could not be removed yet, e.g. while mapped by a reader on Windows
+        self._unremoved: set[int] = set()
+
+    @property
+    def size(self) -> int:
+        """Get the total size of all segment files in bytes."""
+        return sum(self._segments.values())
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get counters of the spool.
+
+        Returns:
+            Dictionary with `appended`, `evicted`, `rejected`, `corrupted` batch counts and `bytes` on disk
+        """
+        return {
+            "appended": self.appended_count,
+            "evicted": self.evicted_count,
+            "rejected": self.rejected_count,
+            "corrupted": self.corrupted_count,
+            "bytes": self.size,
+        }
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"{segment:020d}{_SEGMENT_SUFFIX}"
+
+    def _load_cursor(self) -> tuple[int, int]:
+        try:
+            cursor = json.loads((self.directory / _CURSOR_FILE).read_text())
+            return cursor["segment"], cursor["offset"]
+        except (OSError, ValueError, KeyError):
+            return (min(self._segments, default=0), 0)
+
+    def _store_cursor(self) -> None:
+        segment, offset = self._cursor
+        path = self.directory / _CURSOR_FILE
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"segment": segment, "offset": offset}))
+        os.replace(tmp_path, path)
+
+    def append(self, payload: bytes) -> bool:
+        """Append an encoded batch to the spool.
+
+        Args:
+            payload: JSON encoded array of log items
+
+        Returns:
+            True if the batch was stored, False if it was rejected because the spool is full
+        """
+        frame = _FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if len(frame) > self.max_bytes or not self._make_room(len(frame)):
+                self.rejected_count += 1
+                return False
+            if self._active is None or self._segments[self._active] + len(frame) > self.segment_bytes:
+                self._roll_segment()
+            active, active_file = self._active, self._active_file
+            active_file.write(frame)
+            active_file.flush()
+            if self.fsync:
+                os.fsync(active_file.fileno())
+            self._segments[active] += len(frame)
+            self.appended_count += 1
+            return True
+
+    def _make_room(self, frame_size: int) -> bool:
+        while self.size + frame_size > self.max_bytes:
+            if self.eviction_policy is EvictionPolicy.REJECT_NEW:
+                return False
+            oldest = min((segment for segment in self._segments if segment != self._active), default=None)
+            if oldest is None:
+                return False
+            self.evicted_count += self._count_frames(oldest)
+            self._remove_segment(oldest)
+        return True
+
+    def _roll_segment(self) -> None:
+        if self._active_file is not None:
+            self._active_file.close()
+        self._active = max(self._segments, default=self._cursor[0] - 1) + 1
+        self._active_file = open(self._segment_path(self._active), "ab")
+        self._segments[self._active] = 0
+
+    def _remove_segment(self, segment: int) -> None:
+        self._segments.pop(segment, None)
+        if segment == self._active:
+            if self._active_file is not None:
+                self._active_file.close()
+            self._active, self._active_file = None, None
+        self._unremoved.add(segment)
+        self._unlink_segments()
+        if self._cursor[0] <= segment:
+            self._cursor = (min(self._segments, default=segment + 1), 0)
+            self._store_cursor()
+
+    def _unlink_segments(self) -> None:
+        for segment in list(self._unremoved):
+            try:
+                self._segment_path(segment).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Retried on the next removal, the segment is no longer read either way.
+                continue
+            self._unremoved.discard(segment)
+
+    def _count_frames(self, segment: int) -> int:
+        start = self._cursor[1] if self._cursor[0] == segment else 0
+        return sum(1 for _ in self._read_segment(segment, start))
+
+    def _read_segment(self, segment: int, start: int) -> Iterator[SpoolBatch]:
+        last = None
+        try:
+            with open(self._segment_path(segment), "rb") as file:
+                if os.fstat(file.fileno()).st_size <= start:
+                    return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    offset = start
+                    while offset + _FRAME_HEADER.size <= len(view):
+                        length, checksum = _FRAME_HEADER.unpack_from(view, offset)
+                        end = offset + _FRAME_HEADER.size + length
+                        if end > len(view):
+                            # Partially written tail, it is read again once the append completes.
+                            return
+                        payload = view[offset + _FRAME_HEADER.size : end]
+                        if zlib.crc32(payload) != checksum:
+                            self._skip_corrupted(segment)
+                            return
+                        batch = SpoolBatch(segment=segment, end_offset=end, payload=payload)
+                        if end + _FRAME_HEADER.size > len(view):
+                            # The last frame is yielded once the segment is unmapped and closed,
+                            # so that committing it can remove the file on every platform.
+                            last = batch
+                            break
+                        yield batch
+                        offset = end
+        except FileNotFoundError:
+            return
+        if last is not None:
+            yield last
+
+    def _skip_corrupted(self, segment: int) -> None:
+        # Frames after a checksum mismatch cannot be located reliably, so the rest of a
+        # finished segment is dropped instead of blocking the replay forever.
+        with self._lock:
+            self.corrupted_count += 1
+            if segment != self._active:
+                self._remove_segment(segment)
+
+    def __iter__(self) -> Iterator[SpoolBatch]:
+        return self.read()
+
+    def read(self) -> Iterator[SpoolBatch]:
+        """Iterate over uncommitted batches in the order they were appended.
+
+        Returns:
+            Iterator of `SpoolBatch` items starting at the committed cursor
+        """
+        with self._lock:
+            cursor_segment, cursor_offset = self._cursor
+            segments = sorted(segment for segment in self._segments if segment >= cursor_segment)
+        for segment in segments:
+            yield from self._read_segment(segment, cursor_offset if segment == cursor_segment else 0)
+
+    def commit(self, batch: SpoolBatch) -> None:
+        """Mark a batch and every batch before it as delivered.
+
+        Fully delivered segments other than the one being written are removed.
+
+        Args:
+            batch: Last delivered batch
+        """
+        with self._lock:
+            if (batch.segment, batch.end_offset) <= self._cursor:
+                return
+            self._cursor = (batch.segment, batch.end_offset)
+            for segment in [segment for segment in self._segments if segment < batch.segment]:
+                self._remove_segment(segment)
+            if batch.segment != self._active and batch.end_offset >= self._segments.get(batch.segment, 0):
+                self._remove_segment(batch.segment)
+            self._store_cursor()
+
+    def close(self) -> None:
+        """Close the segment file being written."""
+        with self._lock:
+            if self._active_file is not None:
+                self._active_file.close()
+            self._active, self._active_file = None, None
+
+
+class LogSpoolReplayer:
+    """Background replayer that drains a `LogSpool` once the logs endpoint recovers.
+
+    Every `interval` seconds the replayer reads spooled batches in order and submits up
+    to `parallelism` of them at a time with `Logs.collect_encoded`. The cursor only moves
+    past batches whose predecessors were all delivered, so a failure stops the round and
+    the remaining batches are retried on the next one. Delivery is at least once: batches
+    sent in parallel after a failed one may be sent again.
+    """
+
+    def __init__(
+        self,
+        spool: LogSpool,
+        logs: Logs | None = None,
+        parallelism: int = 1,
+        interval: float = 5.0,
+    ):
+        """Initialize the replayer.
+
+        Args:
+            spool: Spool to drain
+            logs: Logs entity used to submit batches. A new `Logs()` is created if not provided
+            parallelism: Number of batches submitted at the same time
+            interval: Seconds between replay rounds
+        """
+        self.spool = spool
+        self.logs = logs or Logs()
+        self.parallelism = parallelism
+        self.interval = interval
+
+        self.replayed_count = 0
+        self.failed_count = 0
+
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def replay(self) -> int:
+        """Submit spooled batches in order until the spool is empty or a submission fails.
+
+        Returns:
+            Number of batches delivered
+        """
+        delivered = 0
+        batches = self.spool.read()
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            while not self._stopped.is_set():
+                chunk = [batch for _, batch in zip(range(self.parallelism), batches)]  # noqa: B905
+                if not chunk:
+                    break
+                futures = [executor.submit(self.logs.collect_encoded, batch.payload) for batch in chunk]
+                for batch, future in zip(chunk, futures, strict=True):
+                    if future.exception() is not None:
+                        self.failed_count += 1
+                        return delivered
+                    self.spool.commit(batch)
+                    delivered += 1
+                    self.replayed_count += 1
+        return delivered
+
+    def start(self) -> None:
+        """Start replaying in a background thread every `interval` seconds."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="upassist-log-spool-replayer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.replay()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the running round to finish
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,187 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any, Generic, TypeVar
+
+from upassist.client.transports.base import AsyncTransportStream, TransportStream
+from upassist.schemas.validation import ValidationMode, validate
+from upassist.utils.json_stream import JSONItemsParser
+
+ItemT = TypeVar("ItemT")
+
+
+def _pagination_field(name: str, description: str) -> property:
+    def getter(self: "BasePageStream") -> Any:
+        return self.fields.get(name)
+
+    return property(getter, doc=f"{description}, None until parsed.")
+
+
+class BasePageStream(Generic[ItemT]):
+    """Pagination fields of a page whose items are decoded while the body is downloaded.
+
+    Fields are exposed as soon as they are parsed: the ones the API sends after the
+    `data` array are available once all items were iterated.
+
+    Attributes:
+        schema: Schema of the items
+        validation: Validation mode of the items
+    """
+
+    page = _pagination_field("page", "Current page number")
+    per_page = _pagination_field("per_page", "Number of items per page")
+    pages_count = _pagination_field("pages_count", "Total number of pages")
+    count = _pagination_field("count", "Number of items in the page")
+    total_count = _pagination_field("total_count", "Total number of items across all pages")
+    next_page = _pagination_field("next_page", "Next page number, None on the last page")
+    prev_page = _pagination_field("prev_page", "Previous page number, None on the first page")
+
+    def __init__(self, schema: type[ItemT], validation: ValidationMode | str = ValidationMode.FULL):
+        """Initialize the page stream.
+
+        Args:
+            schema: Schema of the items
+            validation: Validation mode of the items
+        """
+        self.schema = schema
+        self.validation = ValidationMode(validation)
+        self._parser = JSONItemsParser("data")
+        self._started = False
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """Fields of the page other than `data` parsed so far."""
+        return self._parser.fields
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole page was received."""
+        return self._parser.done
+
+    def _start(self) -> None:
+        if self._started:
+            raise RuntimeError("A page stream can only be iterated once")
+        self._started = True
+
+
+class PageStream(BasePageStream[ItemT]):
+    """One page of a list endpoint whose items are decoded and validated while the body is downloaded.
+
+    The request is sent when the iteration starts and every item is yielded as soon as it
+    is received, so the first item is available before the body is complete and memory
+    stays flat whatever the page size. The response is closed once all items were
+    iterated, when the iteration is abandoned or when the `with` block exits.
+
+    Example:
+        ```python
+        from upassist import Heartbeat
+
+        with Heartbeat().list_stream(per_page=5000) as page:
+            for heartbeat in page:
+                print(heartbeat.slug, heartbeat.status)
+        print(page.next_page)
+        ```
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], TransportStream],
+        schema: type[ItemT],
+        validation: ValidationMode | str = ValidationMode.FULL,
+    ):
+        """Initialize the page stream.
+
+        Args:
+            open_stream: Function sending the request and returning the streamed response
+            schema: Schema of the items
+            validation: Validation mode of the items
+        """
+        super().__init__(schema, validation)
+        self._open_stream = open_stream
+        self._stream: TransportStream | None = None
+
+    def __enter__(self) -> "PageStream[ItemT]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[ItemT]:
+        self._start()
+        return self._iterate()
+
+    def _iterate(self) -> Iterator[ItemT]:
+        parser, schema, validation = self._parser, self.schema, self.validation
+        self._stream = self._open_stream()
+        try:
+            for chunk in self._stream.chunks:
+                for item in parser.feed(chunk):
+                    yield validate(schema, item, validation)
+            for item in parser.close():
+                yield validate(schema, item, validation)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the response and release its connection."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
+
+
+class AsyncPageStream(BasePageStream[ItemT]):
+    """Asynchronous counterpart of `PageStream`.
+
+    Example:
+        ```python
+        from upassist import AsyncHeartbeat
+
+        async with AsyncHeartbeat().list_stream(per_page=5000) as page:
+            async for heartbeat in page:
+                print(heartbeat.slug, heartbeat.status)
+        print(page.next_page)
+        ```
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], Awaitable[AsyncTransportStream]],
+        schema: type[ItemT],
+        validation: ValidationMode | str = ValidationMode.FULL,
+    ):
+        """Initialize the page stream.
+
+        Args:
+            open_stream: Coroutine function sending the request and returning the streamed response
+            schema: Schema of the items
+            validation: Validation mode of the items
+        """
+        super().__init__(schema, validation)
+        self._open_stream = open_stream
+        self._stream: AsyncTransportStream | None = None
+
+    async def __aenter__(self) -> "AsyncPageStream[ItemT]":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def __aiter__(self) -> AsyncIterator[ItemT]:
+        self._start()
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[ItemT]:
+        parser, schema, validation = self._parser, self.schema, self.validation
+        self._stream = await self._open_stream()
+        try:
+            async for chunk in self._stream.chunks:
+                for item in parser.feed(chunk):
+                    yield validate(schema, item, validation)
+            for item in parser.close():
+                yield validate(schema, item, validation)
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the response and release its connection."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            await stream.aclose()
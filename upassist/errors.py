@@ -6,3 +6,21 @@ class APIError(Exception):
     """
 
     pass
+
+
+class CircuitOpenError(APIError):
+    """Exception raised without a request when the circuit of an upstream host is open.
+
+    Attributes:
+        host: Scheme and network location of the failing host
+        retry_in: Number of seconds until the circuit lets a trial request through
+    """
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit for {host} is open, retry in {retry_in:.1f}s", host)
+        self.host = host
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(APIError, TimeoutError):
+    """Exception raised without a request when the deadline of an operation has passed."""
@@ -1,10 +1,29 @@
-from .base import (
-    BasePaginatedSchema,
-    BaseSchema,
-    CamelCaseSchemaSchema,
-    DetailResponse,
-    IDSchema,
-    UUIDSchema,
+from typing import TYPE_CHECKING
+
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import (
+        BasePaginatedSchema,
+        BaseSchema,
+        CamelCaseSchemaSchema,
+        DetailResponse,
+        IDSchema,
+        UUIDSchema,
+    )
+    from .validation import ValidationMode
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BasePaginatedSchema": ".base",
+        "BaseSchema": ".base",
+        "CamelCaseSchemaSchema": ".base",
+        "DetailResponse": ".base",
+        "IDSchema": ".base",
+        "UUIDSchema": ".base",
+        "ValidationMode": ".validation",
+    },
 )
 
 __all__ = (
@@ -14,4 +33,5 @@ __all__ = (
     "DetailResponse",
     "IDSchema",
     "UUIDSchema",
+    "ValidationMode",
 )
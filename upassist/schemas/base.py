@@ -9,10 +9,12 @@ class BaseSchema(BaseModel):
     """Base schema class that provides common configuration for all schemas.
 
     This class sets up basic Pydantic model configuration like whitespace stripping.
+    Validators are built on first use rather than at import time.
     """
 
     class Config:
         str_strip_whitespace = True
+        defer_build = True
 
 
 class CamelCaseSchemaSchema(BaseModel):
@@ -25,6 +27,7 @@ class CamelCaseSchemaSchema(BaseModel):
         populate_by_name = True
         alias_generator = to_camel
         str_strip_whitespace = True
+        defer_build = True
 
 
 class IDSchema(BaseSchema):
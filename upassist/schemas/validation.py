@@ -0,0 +1,52 @@
+"""Validation modes of API responses.
+
+This module does not import pydantic, so clients and entities can resolve a mode
+without paying for it until a response is actually validated.
+"""
+
+from enum import Enum
+from typing import Any, TypeVar
+
+ModelT = TypeVar("ModelT")
+
+
+class ValidationMode(str, Enum):
+    """How responses are turned into schemas.
+
+    Attributes:
+        FULL: Validate with `model_validate`, coercing and checking every field
+        RAW: Return the decoded JSON as plain dictionaries and lists
+    """
+
+    FULL = "full"
+    RAW = "raw"
+
+
+def validate(schema: type[ModelT], value: Any, mode: ValidationMode | str = ValidationMode.FULL) -> ModelT | Any:
+    """Turn a decoded response into a schema according to a validation mode.
+
+    Args:
+        schema: Pydantic model of the response
+        value: Decoded JSON response
+        mode: Validation mode
+
+    Returns:
+        Schema instance, or `value` itself in raw mode
+    """
+    mode = ValidationMode(mode)
+    if mode is ValidationMode.RAW:
+        return value
+    return schema.model_validate(value)  # type: ignore[attr-defined]
+
+
+def get_field(value: Any, name: str) -> Any:
+    """Read a field of a schema instance or of its raw dictionary.
+
+    Args:
+        value: Schema instance or decoded JSON object
+        name: Name of the field
+
+    Returns:
+        Value of the field
+    """
+    return value[name] if isinstance(value, dict) else getattr(value, name)
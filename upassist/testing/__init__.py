@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING
+
+from upassist.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .backend import FakeResponse, FakeUpassist, Faults
+    from .server import FakeUpassistServer
+    from .transports import AsyncMockTransport, AsyncRedirectTransport, MockTransport, RedirectTransport
+
+# `.server` must not be imported with the package, so that `python -m upassist.testing.server` runs it once.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncMockTransport": ".transports",
+        "AsyncRedirectTransport": ".transports",
+        "FakeResponse": ".backend",
+        "FakeUpassist": ".backend",
+        "FakeUpassistServer": ".server",
+        "Faults": ".backend",
+        "MockTransport": ".transports",
+        "RedirectTransport": ".transports",
+    },
+)
+
+__all__ = (
+    "AsyncMockTransport",
+    "AsyncRedirectTransport",
+    "FakeResponse",
+    "FakeUpassist",
+    "FakeUpassistServer",
+    "Faults",
+    "MockTransport",
+    "RedirectTransport",
+)
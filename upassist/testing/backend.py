@@ -0,0 +1,346 @@
+import gzip
+import json
+import random
+import re
+import threading
+import uuid
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from upassist.utils.serialization import dumps
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_HEARTBEATS_PATH = re.compile(r"/heartbeats/?$")
+_HEARTBEAT_PATH = re.compile(r"/heartbeats/(?P<slug>[^/]+)/?$")
+_HEARTBEAT_ACTION_PATH = re.compile(r"/heartbeats/(?P<slug>[^/]+)/(?P<action>pause|unpause)/?$")
+_EVENT_PATH = re.compile(r"/event/(?P<slug>[^/]+)/?$")
+_COLLECT_PATH = re.compile(r"/collect/?$")
+_STATS_PERIODS = ((1, "day"), (7, "week"), (30, "month"), (365, "year"))
+
+
+@dataclass
+class FakeResponse:
+    """Response produced by `FakeUpassist`.
+
+    Attributes:
+        status: Response status code
+        headers: Response headers
+        body: Encoded response body
+        latency: Seconds to wait before the response headers are sent
+        body_delay: Seconds to stall between the response headers and the body
+    """
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    latency: float = 0.0
+    body_delay: float = 0.0
+
+
+@dataclass
+class Faults:
+    """Faults injected by the fake Upassist transports and server.
+
+    Every decision is drawn from a random generator seeded with `seed`, so a run with the
+    same seed and request order is reproducible.
+
+    Attributes:
+        latency: Seconds added before every response
+        jitter: Maximum random seconds added to `latency`
+        error_rate: Share of requests, between 0 and 1, answered with `error_status`
+        error_status: Status code of injected errors
+        rate_limit_rate: Share of requests answered with `429 Too Many Requests`
+        retry_after: Value of the `Retry-After` header of injected 429 responses
+        slow_body_rate: Share of responses whose body is stalled for `slow_body_delay`
+        slow_body_delay: Seconds a slow body is stalled after the headers were sent
+        seed: Seed of the random generator
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    slow_body_rate: float = 0.0
+    slow_body_delay: float = 0.0
+    seed: int | None = None
+    _random: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    def draw(self) -> tuple[float, int | None, float]:
+        """Draw the faults of one request.
+
+        Returns:
+            Tuple of the latency in seconds, the injected status code or None, and the
+            body stall in seconds
+        """
+        with self._lock:
+            latency = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._random.random()
+            body_delay = self.slow_body_delay if self._random.random() < self.slow_body_rate else 0.0
+        if roll < self.rate_limit_rate:
+            return latency, 429, body_delay
+        if roll < self.rate_limit_rate + self.error_rate:
+            return latency, self.error_status, body_delay
+        return latency, None, body_delay
+
+
+class FakeUpassist:
+    """In-memory implementation of the heartbeats, heartbeat event and log collect endpoints.
+
+    Requests are routed by URL path only, so the API, heartbeat and logs hosts all reach
+    the same state. Responses have the shapes of `HeartbeatPaginatedSchema`,
+    `HeartbeatDetailSchema`, `HeartbeatSchema` and `DetailResponse`. Heartbeat details
+    carry an `ETag` and conditional requests are answered with `304 Not Modified`.
+
+    Attributes:
+        heartbeats: Heartbeats by slug
+        events: Slug and query parameters of every received heartbeat event
+        collected_logs: Number of received log items
+        collected_bytes: Number of received log body bytes, before decompression
+        requests_count: Number of handled requests, including injected failures
+    """
+
+    def __init__(self, heartbeats: int = 0, faults: Faults | None = None):
+        """Initialize the fake.
+
+        Args:
+            heartbeats: Number of heartbeats generated up front
+            faults: Optional faults injected into responses
+        """
+        self.faults = faults or Faults()
+        self.heartbeats: dict[str, dict[str, Any]] = {}
+        self.events: list[tuple[str, dict[str, str]]] = []
+        self.collected_logs = 0
+        self.collected_bytes = 0
+        self.requests_count = 0
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for index in range(heartbeats):
+            self.add_heartbeat(name=f"Heartbeat {index}", slug=f"heartbeat-{index}")
+
+    def add_heartbeat(self, name: str, slug: str | None = None, **fields: Any) -> dict[str, Any]:
+        """Create a heartbeat with default values for missing fields.
+
+        Args:
+            name: Name of the heartbeat
+            slug: Optional slug, derived from the name if not provided
+            **fields: Values of other `HeartbeatDetailSchema` fields
+
+        Returns:
+            The stored heartbeat
+        """
+        now = datetime.now(tz=timezone.utc)
+        slug = slug or re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+        heartbeat = {
+            "id": str(uuid.uuid4()),
+            "name": name,
+            "description": None,
+            "created_at": now.isoformat(),
+            "slug": slug,
+            "group_id": None,
+            "status": "SUCCESS",
+            "is_down": False,
+            "last_up_at": now.isoformat(),
+            "last_down_at": None,
+            "last_fetch_at": now.isoformat(),
+            "next_fetch_at": (now + timedelta(seconds=180)).isoformat(),
+            "fetch_interval": 180,
+            "confirmation_period": 0,
+            "realert_period": None,
+            "paused": False,
+            "alerts_on": True,
+            "call": False,
+            "send_sms": False,
+            "send_email": True,
+            "send_push_notification": False,
+            "maintenance_window_from": None,
+            "maintenance_window_until": None,
+            "maintenance_window_timezone": "Europe/Belfast",
+            "alert_week_days": [0, 1, 2, 3, 4, 5, 6],
+            "incidents_count": 0,
+            "opened_incident_id": None,
+            "meta": None,
+            "incident_stats": [_incident_stats(now, days, alias) for days, alias in _STATS_PERIODS],
+        }
+        heartbeat.update({key: value for key, value in fields.items() if key in heartbeat})
+        with self._lock:
+            self.heartbeats[slug] = heartbeat
+            self._versions[slug] = self._versions.get(slug, 0) + 1
+        return heartbeat
+
+    def handle(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        body: bytes | None = None,
+    ) -> FakeResponse:
+        """Handle a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL, query parameters of the URL are merged with `params`
+            params: Query parameters
+            headers: Request headers
+            body: Raw request body
+
+        Returns:
+            The response, including the drawn faults
+        """
+        with self._lock:
+            self.requests_count += 1
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        query.update({str(key): str(value) for key, value in (params or {}).items() if value is not None})
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+
+        latency, status, body_delay = self.faults.draw()
+        if status is not None:
+            response = self._json(status, {"detail": "Injected failure"})
+            if status == 429:  # noqa: PLR2004
+                response.headers["Retry-After"] = f"{self.faults.retry_after:g}"
+        else:
+            response = self._route(method.upper(), parts.path, query, headers, body or b"")
+        response.latency, response.body_delay = latency, body_delay
+        return response
+
+    def _route(  # noqa: PLR0911
+        self, method: str, path: str, query: dict[str, str], headers: dict[str, str], body: bytes
+    ) -> FakeResponse:
+        if match := _HEARTBEAT_ACTION_PATH.search(path):
+            if method != "PATCH":
+                return self._json(405, {"detail": "Method not allowed"})
+            return self._set_paused(match["slug"], match["action"] == "pause")
+        if match := _HEARTBEAT_PATH.search(path):
+            if method == "GET":
+                return self._detail(match["slug"], headers)
+            if method == "DELETE":
+                return self._delete(match["slug"])
+            return self._json(405, {"detail": "Method not allowed"})
+        if _HEARTBEATS_PATH.search(path):
+            if method == "GET":
+                return self._list(query)
+            if method == "POST":
+                return self._create(_decode_body(body, headers))
+            return self._json(405, {"detail": "Method not allowed"})
+        if match := _EVENT_PATH.search(path):
+            with self._lock:
+                self.events.append((match["slug"], query))
+            return self._json(200, {"detail": "OK"})
+        if _COLLECT_PATH.search(path):
+            if method != "POST":
+                return self._json(405, {"detail": "Method not allowed"})
+            items = _decode_body(body, headers)
+            with self._lock:
+                self.collected_logs += len(items) if isinstance(items, list) else 1
+                self.collected_bytes += len(body)
+            return self._json(200, {"detail": "OK"})
+        return self._json(404, {"detail": "Not found"})
+
+    def _list(self, query: dict[str, str]) -> FakeResponse:
+        per_page = max(int(query.get("per_page") or 50), 1)
+        page = max(int(query.get("page") or 1), 1)
+        search = (query.get("q") or "").lower()
+        with self._lock:
+            items = [
+                heartbeat
+                for heartbeat in self.heartbeats.values()
+                if not search or search in heartbeat["name"].lower() or search in heartbeat["slug"]
+            ]
+        pages_count = (len(items) + per_page - 1) // per_page
+        data = [
+            {key: value for key, value in heartbeat.items() if key not in {"description", "meta", "incident_stats"}}
+            for heartbeat in items[(page - 1) * per_page : page * per_page]
+        ]
+        return self._json(
+            200,
+            {
+                "data": data,
+                "per_page": per_page,
+                "pages_count": pages_count,
+                "count": len(data),
+                "total_count": len(items),
+                "page": page,
+                "next_page": page + 1 if page < pages_count else None,
+                "prev_page": page - 1 if page > 1 else None,
+            },
+        )
+
+    def _detail(self, slug: str, headers: dict[str, str]) -> FakeResponse:
+        with self._lock:
+            heartbeat = self.heartbeats.get(slug)
+            etag = f'"{slug}-{self._versions.get(slug, 0)}"'
+        if heartbeat is None:
+            return self._json(404, {"detail": "Not found"})
+        if headers.get("if-none-match") == etag:
+            return FakeResponse(status=304, headers={"ETag": etag}, body=b"")
+        response = self._json(200, heartbeat)
+        response.headers["ETag"] = etag
+        return response
+
+    def _create(self, payload: Any) -> FakeResponse:
+        if not isinstance(payload, dict) or not payload.get("name"):
+            return self._json(422, {"detail": "Field `name` is required"})
+        fields = {key: value for key, value in payload.items() if key not in {"name", "slug"}}
+        heartbeat = self.add_heartbeat(payload["name"], payload.get("slug"), **fields)
+        return self._json(201, {key: value for key, value in heartbeat.items() if key != "incident_stats"})
+
+    def _set_paused(self, slug: str, paused: bool) -> FakeResponse:
+        with self._lock:
+            heartbeat = self.heartbeats.get(slug)
+            if heartbeat is None:
+                return self._json(404, {"detail": "Not found"})
+            heartbeat["paused"] = paused
+            self._versions[slug] += 1
+        return self._json(200, {"detail": "OK"})
+
+    def _delete(self, slug: str) -> FakeResponse:
+        with self._lock:
+            if self.heartbeats.pop(slug, None) is None:
+                return self._json(404, {"detail": "Not found"})
+            self._versions.pop(slug, None)
+        return self._json(200, {"detail": "OK"})
+
+    @staticmethod
+    def _json(status: int, value: Any) -> FakeResponse:
+        return FakeResponse(status=status, headers=dict(JSON_HEADERS), body=dumps(value))
+
+
+def _incident_stats(now: datetime, days: int, alias: str) -> dict[str, Any]:
+    since = now - timedelta(days=days)
+    return {
+        "sum": 0,
+        "avg": 0,
+        "max": 0,
+        "count": 0,
+        "from_date": since.date().isoformat(),
+        "to_date": now.date().isoformat(),
+        "from_datetime": since.isoformat(),
+        "to_datetime": now.isoformat(),
+        "period_alias": alias,
+        "uptime_percents": 100.0,
+    }
+
+
+def _decode_body(body: bytes, headers: dict[str, str]) -> Any:
+    encoding = headers.get("content-encoding")
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "deflate":
+        body = zlib.decompress(body)
+    elif encoding == "zstd":
+        import zstandard  # type: ignore
+
+        body = zstandard.ZstdDecompressor().decompress(body)
+    return json.loads(body) if body else None
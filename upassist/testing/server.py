@@ -0,0 +1,222 @@
+"""Local HTTP server of the fake Upassist endpoints.
+
+Usage:
+    python -m upassist.testing.server --port 8080 --heartbeats 500 --latency 0.02 --rate-limit-rate 0.05
+"""
+
+import argparse
+import http.server
+import sys
+import threading
+import time
+
+from .backend import FakeUpassist, Faults
+from .transports import AsyncRedirectTransport, RedirectTransport
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body leave in one write, a separate small body write would stall on delayed ACKs.
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        response = self.server.backend.handle(self.command, self.path, headers=dict(self.headers.items()), body=body)
+        if response.latency:
+            time.sleep(response.latency)
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if self.command == "HEAD":
+            # A HEAD response has no body, only the Content-Length a GET would return.
+            return
+        if response.body_delay:
+            self.wfile.flush()
+            time.sleep(response.body_delay)
+        self.wfile.write(response.body)
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_HEAD(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def do_PUT(self) -> None:
+        self._handle()
+
+    def do_PATCH(self) -> None:
+        self._handle()
+
+    def do_DELETE(self) -> None:
+        self._handle()
+
+    def do_OPTIONS(self) -> None:
+        self._handle()
+
+    def log_message(self, *args: object) -> None:
+        return
+
+
+class _HTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    backend: FakeUpassist
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # Clients closing a connection mid-response, e.g. an abandoned streamed page, are expected.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeUpassistServer:
+    """Local HTTP/1.1 server answering requests from a `FakeUpassist`.
+
+    Injected latency is slept before the response headers are sent and slow bodies are
+    stalled after them, so client timeouts, retries and batching can be measured over
+    real sockets. `transport()` and `async_transport()` point every Upassist host of a
+    client at the server.
+
+    Example:
+        ```python
+        from upassist import Heartbeat, Logs, SyncAPIClient
+        from upassist.testing import Faults, FakeUpassistServer
+
+        with FakeUpassistServer(heartbeats=100, faults=Faults(error_rate=0.05, seed=1)) as server:
+            client = SyncAPIClient(api_key="test", transport=server.transport())
+            Heartbeat("heartbeat-1", api_client=client).event()
+            Logs(api_client=client).collect(log_entries)
+            print(server.backend.collected_logs)
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: FakeUpassist | None = None,
+        heartbeats: int = 0,
+        faults: Faults | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server.
+
+        Args:
+            backend: Fake backend answering requests, created from `heartbeats` and `faults` if not provided
+            heartbeats: Number of heartbeats generated up front by a new backend
+            faults: Faults injected by a new backend
+            host: Address the server listens on
+            port: Port the server listens on, any free port if 0
+        """
+        self.backend = backend or FakeUpassist(heartbeats=heartbeats, faults=faults)
+        self.host = host
+        self.port = port
+        self._server: _HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Server is not running")
+        return f"http://{self.host}:{self._server.server_port}"
+
+    def start(self) -> "FakeUpassistServer":
+        """Start serving in a background thread.
+
+        Returns:
+            The server
+        """
+        if self._server is None:
+            self._server = _HTTPServer((self.host, self.port), _Handler)
+            self._server.backend = self.backend
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "FakeUpassistServer":
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def transport(self, **kwargs) -> RedirectTransport:
+        """Create a transport of `SyncAPIClient` sending every request to the server.
+
+        Args:
+            **kwargs: Keyword arguments of `RequestsTransport`
+
+        Returns:
+            The transport
+        """
+        from upassist.client.transports import RequestsTransport
+
+        return RedirectTransport(self.url, RequestsTransport(**kwargs))
+
+    def async_transport(self, **kwargs) -> AsyncRedirectTransport:
+        """Create a transport of `AsyncAPIClient` sending every request to the server.
+
+        Args:
+            **kwargs: Keyword arguments of `AiohttpTransport`
+
+        Returns:
+            The transport
+        """
+        from upassist.client.transports import AiohttpTransport
+
+        return AsyncRedirectTransport(self.url, AiohttpTransport(**kwargs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--heartbeats", type=int, default=100, help="Number of generated heartbeats")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added before every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of 429 responses")
+    parser.add_argument("--slow-body-rate", type=float, default=0.0, help="Share of responses with a stalled body")
+    parser.add_argument("--slow-body-delay", type=float, default=0.0, help="Seconds a slow body is stalled")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        slow_body_rate=args.slow_body_rate,
+        slow_body_delay=args.slow_body_delay,
+        seed=args.seed,
+    )
+    server = FakeUpassistServer(heartbeats=args.heartbeats, faults=faults, host=args.host, port=args.port)
+    with server:
+        print(f"Fake Upassist listening on {server.url}, press Ctrl+C to stop")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    backend = server.backend
+    print(f"Requests: {backend.requests_count}, events: {len(backend.events)}, logs: {backend.collected_logs}")
+
+
+if __name__ == "__main__":
+    main()
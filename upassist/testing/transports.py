@@ -0,0 +1,267 @@
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator, Iterator
+from urllib.parse import urlsplit, urlunsplit
+
+from upassist.client.timeout import Timeout
+from upassist.client.transports.base import (
+    STREAM_CHUNK_SIZE,
+    AsyncTransport,
+    AsyncTransportStream,
+    JSONBody,
+    SyncTransport,
+    TransportResponse,
+    TransportStream,
+)
+from upassist.utils.serialization import dumps
+
+from .backend import FakeResponse, FakeUpassist
+
+
+def _encode_body(headers: dict, json: JSONBody, data: bytes | None) -> bytes | None:
+    if json is not None:
+        headers.setdefault("Content-Type", "application/json")
+        return dumps(json)
+    return data
+
+
+def _limit(seconds: float | None) -> float:
+    """Get a timeout value as a number of seconds, None being unbounded."""
+    return math.inf if seconds is None else seconds
+
+
+def _stall(response: FakeResponse, timeout: Timeout) -> tuple[float, bool]:
+    """Get the seconds a response takes to arrive and whether the attempt times out first.
+
+    Args:
+        response: Response of the fake backend
+        timeout: Timeouts of the attempt
+
+    Returns:
+        Tuple of the seconds to wait and whether a `TimeoutError` is raised after them
+    """
+    latency, read, total = response.latency, _limit(timeout.read), _limit(timeout.total)
+    if latency > read:
+        return read, True
+    if latency + response.body_delay > total:
+        return total, True
+    if response.body_delay > read:
+        return latency + read, True
+    return latency + response.body_delay, False
+
+
+def _chunks(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), STREAM_CHUNK_SIZE):
+        yield body[start : start + STREAM_CHUNK_SIZE]
+
+
+def _sync_chunks(url: str, response: FakeResponse, timeout: Timeout) -> Iterator[bytes]:
+    if response.body_delay:
+        time.sleep(min(response.body_delay, _limit(timeout.read)))
+        if response.body_delay > _limit(timeout.read):
+            raise TimeoutError(f"Reading the response of {url} timed out")
+    yield from _chunks(response.body)
+
+
+async def _async_chunks(url: str, response: FakeResponse, timeout: Timeout) -> AsyncIterator[bytes]:
+    if response.body_delay:
+        await asyncio.sleep(min(response.body_delay, _limit(timeout.read)))
+        if response.body_delay > _limit(timeout.read):
+            raise TimeoutError(f"Reading the response of {url} timed out")
+    for chunk in _chunks(response.body):
+        yield chunk
+
+
+def _rewrite(url: str, base_url: str) -> str:
+    target = urlsplit(base_url)
+    parts = urlsplit(url)
+    return urlunsplit((target.scheme, target.netloc, target.path.rstrip("/") + parts.path, parts.query, ""))
+
+
+class MockTransport(SyncTransport):
+    """In-process transport of `SyncAPIClient` answering requests from a `FakeUpassist`.
+
+    No sockets are opened; injected latency and slow bodies are slept in the calling
+    thread, and an attempt that exceeds its read or total timeout raises `TimeoutError`.
+
+    Example:
+        ```python
+        from upassist import Heartbeat, SyncAPIClient
+        from upassist.testing import FakeUpassist, Faults, MockTransport
+
+        backend = FakeUpassist(heartbeats=250, faults=Faults(latency=0.01, rate_limit_rate=0.1, seed=1))
+        client = SyncAPIClient(api_key="test", transport=MockTransport(backend))
+        heartbeats = Heartbeat(api_client=client).list_all(per_page=50)
+        ```
+    """
+
+    transient_errors = (TimeoutError,)
+
+    def __init__(self, backend: FakeUpassist | None = None):
+        """Initialize the transport.
+
+        Args:
+            backend: Fake backend answering requests, an empty one is created if not provided
+        """
+        self.backend = backend or FakeUpassist()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        headers = dict(headers)
+        body = _encode_body(headers, json, data)
+        response = self.backend.handle(method, url, params=params, headers=headers, body=body)
+        wait, timed_out = _stall(response, timeout)
+        if wait:
+            time.sleep(wait)
+        if timed_out:
+            raise TimeoutError(f"Request to {url} timed out")
+        return TransportResponse(status=response.status, headers=response.headers, content=response.body, url=url)
+
+    def stream(self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout) -> TransportStream:
+        response = self.backend.handle(method, url, params=params, headers=dict(headers))
+        if response.latency:
+            time.sleep(min(response.latency, _limit(timeout.read)))
+            if response.latency > _limit(timeout.read):
+                raise TimeoutError(f"Request to {url} timed out")
+        return TransportStream(
+            status=response.status, headers=response.headers, url=url, chunks=_sync_chunks(url, response, timeout)
+        )
+
+
+class AsyncMockTransport(AsyncTransport):
+    """In-process transport of `AsyncAPIClient` answering requests from a `FakeUpassist`.
+
+    Injected latency and slow bodies are awaited with `asyncio.sleep`, so concurrent
+    requests overlap as they would over the network.
+    """
+
+    transient_errors = (TimeoutError,)
+
+    def __init__(self, backend: FakeUpassist | None = None):
+        """Initialize the transport.
+
+        Args:
+            backend: Fake backend answering requests, an empty one is created if not provided
+        """
+        self.backend = backend or FakeUpassist()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        headers = dict(headers)
+        body = _encode_body(headers, json, data)
+        response = self.backend.handle(method, url, params=params, headers=headers, body=body)
+        wait, timed_out = _stall(response, timeout)
+        if wait:
+            await asyncio.sleep(wait)
+        if timed_out:
+            raise TimeoutError(f"Request to {url} timed out")
+        return TransportResponse(status=response.status, headers=response.headers, content=response.body, url=url)
+
+    async def stream(
+        self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout
+    ) -> AsyncTransportStream:
+        response = self.backend.handle(method, url, params=params, headers=dict(headers))
+        if response.latency:
+            await asyncio.sleep(min(response.latency, _limit(timeout.read)))
+            if response.latency > _limit(timeout.read):
+                raise TimeoutError(f"Request to {url} timed out")
+        return AsyncTransportStream(
+            status=response.status, headers=response.headers, url=url, chunks=_async_chunks(url, response, timeout)
+        )
+
+
+class RedirectTransport(SyncTransport):
+    """Transport sending every request to one base URL, e.g. of a `FakeUpassistServer`.
+
+    The scheme and host of each request URL are replaced, so requests of the API,
+    heartbeat and logs hosts all reach the same server while keeping their paths.
+    """
+
+    def __init__(self, base_url: str, transport: SyncTransport | None = None):
+        """Initialize the transport.
+
+        Args:
+            base_url: URL whose scheme, host and path prefix replace those of every request
+            transport: Wrapped transport, `RequestsTransport` if not provided
+        """
+        if transport is None:
+            from upassist.client.transports import RequestsTransport
+
+            transport = RequestsTransport()
+        self.base_url = base_url
+        self.transport = transport
+        self.transient_errors = transport.transient_errors
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        return self.transport.request(method, _rewrite(url, self.base_url), params, headers, json, data, timeout)
+
+    def stream(self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout) -> TransportStream:
+        return self.transport.stream(method, _rewrite(url, self.base_url), params, headers, timeout)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRedirectTransport(AsyncTransport):
+    """Asynchronous counterpart of `RedirectTransport`."""
+
+    def __init__(self, base_url: str, transport: AsyncTransport | None = None):
+        """Initialize the transport.
+
+        Args:
+            base_url: URL whose scheme, host and path prefix replace those of every request
+            transport: Wrapped transport, `AiohttpTransport` if not provided
+        """
+        if transport is None:
+            from upassist.client.transports import AiohttpTransport
+
+            transport = AiohttpTransport()
+        self.base_url = base_url
+        self.transport = transport
+        self.transient_errors = transport.transient_errors
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        headers: dict,
+        json: JSONBody,
+        data: bytes | None,
+        timeout: Timeout,
+    ) -> TransportResponse:
+        return await self.transport.request(method, _rewrite(url, self.base_url), params, headers, json, data, timeout)
+
+    async def stream(
+        self, method: str, url: str, params: dict | None, headers: dict, timeout: Timeout
+    ) -> AsyncTransportStream:
+        return await self.transport.stream(method, _rewrite(url, self.base_url), params, headers, timeout)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -1,4 +1,5 @@
 import functools
+import inspect
 
 
 def attribute_required(attribute: str):
@@ -43,6 +44,17 @@ def attribute_required(attribute: str):
                 raise ValueError(f"`{attribute}` is required to perform object action")
             return func(self, *args, **kwargs)
 
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_inner(self, *args, **kwargs):
+                """Coroutine counterpart of `inner` that raises when awaited."""
+                if not getattr(self, attribute):
+                    raise ValueError(f"`{attribute}` is required to perform object action")
+                return await func(self, *args, **kwargs)
+
+            return async_inner
+
         return inner
 
     return wrapper
@@ -0,0 +1,43 @@
+import gzip
+import importlib.util
+import zlib
+
+SUPPORTED_ENCODINGS = ("gzip", "deflate", "zstd")
+
+
+def check_encoding(encoding: str) -> None:
+    """Check that a content encoding is supported and its packages are installed.
+
+    Args:
+        encoding: Content encoding name
+
+    Raises:
+        ValueError: If the encoding is not supported
+        ImportError: If the encoding requires a package that is not installed
+    """
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ValueError(f"Unsupported compression `{encoding}`, expected one of {SUPPORTED_ENCODINGS}")
+    if encoding == "zstd" and not importlib.util.find_spec("zstandard"):
+        raise ImportError("You need to install the `zstandard` package to use zstd compression")
+
+
+def compress(data: bytes, encoding: str, level: int | None = None) -> bytes:
+    """Compress a request body.
+
+    Args:
+        data: Body to compress
+        encoding: Content encoding name, one of `SUPPORTED_ENCODINGS`
+        level: Optional compression level, uses the encoding default if not provided
+
+    Returns:
+        Compressed body
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if encoding == "deflate":
+        return zlib.compress(data, -1 if level is None else level)
+    if encoding == "zstd":
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+    raise ValueError(f"Unsupported compression `{encoding}`, expected one of {SUPPORTED_ENCODINGS}")
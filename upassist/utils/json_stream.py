@@ -0,0 +1,163 @@
+"""Incremental decoding of JSON objects holding a large array.
+
+List responses are objects with a `data` array of items and a few pagination fields.
+`JSONItemsParser` is fed the body chunk by chunk as it arrives from the socket and
+returns the items of the array as soon as each one is complete, so only the current
+chunk and one item are held in memory, whatever the size of the page.
+"""
+
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+(
+    _OBJECT_START,
+    _FIRST_KEY,
+    _KEY,
+    _COLON,
+    _VALUE,
+    _AFTER_VALUE,
+    _FIRST_ITEM,
+    _ITEM,
+    _AFTER_ITEM,
+    _END,
+) = range(10)
+
+# Punctuation expected in each state and the state it leads to
+_TRANSITIONS = {
+    (_OBJECT_START, "{"): _FIRST_KEY,
+    (_FIRST_KEY, "}"): _END,
+    (_COLON, ":"): _VALUE,
+    (_AFTER_VALUE, ","): _KEY,
+    (_AFTER_VALUE, "}"): _END,
+    (_FIRST_ITEM, "]"): _AFTER_VALUE,
+    (_AFTER_ITEM, ","): _ITEM,
+    (_AFTER_ITEM, "]"): _AFTER_VALUE,
+}
+
+
+class JSONItemsParser:
+    """Push parser of a JSON object returning the items of one of its arrays incrementally.
+
+    Every other field of the object is decoded whole and stored in `fields` as soon as
+    it is complete, whether it comes before or after the array.
+
+    Example:
+        ```python
+        parser = JSONItemsParser("data")
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                handle(item)
+        parser.close()
+        print(parser.fields["next_page"])
+        ```
+
+    Attributes:
+        array_field: Name of the array whose items are returned incrementally
+        fields: Decoded fields of the object other than the array
+    """
+
+    def __init__(self, array_field: str = "data"):
+        """Initialize the parser.
+
+        Args:
+            array_field: Name of the array whose items are returned incrementally
+        """
+        self.array_field = array_field
+        self.fields: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._state = _OBJECT_START
+        self._key: str | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole object was parsed."""
+        return self._state == _END
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse the next chunk of the body.
+
+        Args:
+            chunk: Next bytes of the body
+
+        Returns:
+            Items of the array completed by the chunk
+
+        Raises:
+            ValueError: If the body is not a JSON object
+        """
+        return self._parse(self._text_decoder.decode(chunk), final=False)
+
+    def close(self) -> list[Any]:
+        """Finish parsing once the whole body was fed.
+
+        Returns:
+            Items of the array completed by the end of the body
+
+        Raises:
+            ValueError: If the body is truncated or is not a JSON object
+        """
+        items = self._parse(self._text_decoder.decode(b"", final=True), final=True)
+        if self._state != _END:
+            raise ValueError("Truncated JSON object")
+        return items
+
+    def _parse(self, text: str, final: bool) -> list[Any]:
+        buffer = self._buffer = self._buffer[self._position :] + text
+        length = len(buffer)
+        position, state, items = 0, self._state, []
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == length:
+                break
+            char = buffer[position]
+            next_state = _TRANSITIONS.get((state, char))
+            if next_state is not None:
+                position, state = position + 1, next_state
+            elif state in (_FIRST_KEY, _KEY) and char == '"':
+                try:
+                    self._key, position = json.decoder.scanstring(buffer, position + 1)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                state = _COLON
+            elif state == _VALUE and char == "[" and self._key == self.array_field:
+                position, state = position + 1, _FIRST_ITEM
+            elif state in (_VALUE, _FIRST_ITEM, _ITEM):
+                decoded = self._decode_value(buffer, position, final)
+                if decoded is None:
+                    break
+                value, position = decoded
+                if state == _VALUE:
+                    self.fields[self._key] = value
+                    state = _AFTER_VALUE
+                else:
+                    items.append(value)
+                    state = _AFTER_ITEM
+            else:
+                raise ValueError(f"Unexpected {char!r} in the JSON object")
+        self._position, self._state = position, state
+        return items
+
+    def _decode_value(self, buffer: str, position: int, final: bool) -> tuple[Any, int] | None:
+        """Decode the value starting at `position`, or return None if it may be incomplete."""
+        try:
+            value, end = self._decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if not final and not isinstance(value, (str, dict, list)):
+            # A number or literal is complete only once its delimiter arrived, e.g. `12`
+            # may continue as `123` or `12.5` in the next chunk.
+            delimiter = _WHITESPACE.match(buffer, end).end()
+            if delimiter == len(buffer) or buffer[delimiter] not in ",]}":
+                return None
+        return value, end
@@ -0,0 +1,42 @@
+"""Lazy attribute loading for package `__init__` modules.
+
+Packages re-export their public names through a module `__getattr__` (PEP 562), so
+`import upassist` does not import pydantic, the HTTP backends or `asyncio` until a name
+that needs them is first accessed. Static analysis keeps working through the
+`TYPE_CHECKING` imports that mirror every lazy attribute.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_attributes(
+    package: str, attributes: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create module `__getattr__` and `__dir__` functions loading attributes on first access.
+
+    A loaded attribute is stored in the package namespace, so later accesses do not go
+    through `__getattr__` again.
+
+    Args:
+        package: Name of the package, i.e. `__name__` of its `__init__` module
+        attributes: Relative or absolute name of the module defining each attribute
+
+    Returns:
+        Tuple of the `__getattr__` and `__dir__` functions of the package
+    """
+
+    def module_getattr(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return module_getattr, module_dir
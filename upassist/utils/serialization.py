@@ -0,0 +1,57 @@
+"""JSON encoding helpers that use the fastest installed encoder.
+
+`orjson` is preferred, then `msgspec`. When neither is installed the Rust encoder of
+`pydantic_core`, which is always available as a dependency of pydantic, is used instead
+of the much slower standard library `json` module.
+"""
+
+import functools
+import importlib.util
+from collections.abc import Callable
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _make_encoder() -> tuple[str, Callable[[Any], bytes]]:
+    if importlib.util.find_spec("orjson"):
+        import orjson  # type: ignore
+
+        return "orjson", functools.partial(orjson.dumps, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    if importlib.util.find_spec("msgspec"):
+        import msgspec  # type: ignore
+
+        return "msgspec", msgspec.json.Encoder(enc_hook=_default).encode
+
+    import pydantic_core
+
+    return "pydantic", functools.partial(pydantic_core.to_json, fallback=_default)
+
+
+JSON_BACKEND, _encode = _make_encoder()
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a value to JSON bytes.
+
+    Args:
+        value: Value to encode. Datetimes, enums, UUIDs and pydantic models are supported
+            in addition to the standard JSON types
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return _encode(value)